@@ -0,0 +1,5 @@
+"""처리량/지연시간 벤치마크 (`python -m backend.bench`).
+
+YouTube Data API, Gemini, 자막은 로컬 대역(`fakes`)으로 대체해 네트워크와 과금 없이
+같은 입력으로 커밋 간 결과를 비교한다.
+"""
@@ -0,0 +1,452 @@
+"""백엔드 처리량 벤치마크.
+
+    uv run python -m backend.bench                                  # 전체 시나리오
+    uv run python -m backend.bench -s analyze -c 16 -n 200 --workers 2
+    uv run python -m backend.bench -o after.json --compare before.json
+
+시나리오:
+    rules    Rule 엔진(analyze_comment) — 프로세스 풀 `concurrency`개
+    nodes    prescreen / analyze / validate 노드 단독 (대역 LLM, 같은 입력 반복)
+    comment  POST /analyze/comment — uvicorn 서버 + 대역 LLM
+    analyze  POST /analyze — uvicorn 서버 + 대역 YouTube/LLM/자막
+
+결과는 처리량, p50/p95/p99 지연, 워커별 CPU/RSS(/proc)를 담은 JSON으로 저장된다.
+`--compare`를 주면 이전 결과와 처리량/p95를 비교하고, `--threshold`%를 넘는 악화를 표시한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from backend.bench import procstats
+from backend.bench.fakes import CORPUS, TRANSCRIPT, FakeTaggingLLM, FakeYouTubeServer
+
+SCENARIOS = ("rules", "nodes", "comment", "analyze")
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+# ─── 통계 ─────────────────────────────────────────────────
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """nearest-rank 백분위수."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    """초 단위 지연시간 목록 → ms 단위 요약."""
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+    }
+
+
+# ─── rules ───────────────────────────────────────────────
+
+def _rules_worker(count: int) -> dict:
+    """프로세스 하나에서 코퍼스를 count개 채점."""
+    from backend.graph.nodes.prescreen import analyze_comment
+
+    analyze_comment(CORPUS[0])  # 정규식 컴파일은 측정에서 제외
+    pid = os.getpid()
+    before = procstats.snapshot([pid]) if procstats.available() else {}
+    latencies = []
+    start = time.perf_counter()
+    for i in range(count):
+        t0 = time.perf_counter()
+        analyze_comment(CORPUS[i % len(CORPUS)])
+        latencies.append(time.perf_counter() - t0)
+    wall = time.perf_counter() - start
+    after = procstats.snapshot([pid]) if procstats.available() else {}
+    return {
+        "latencies": latencies,
+        "wall": wall,
+        "workers": procstats.usage(before, after, wall),
+    }
+
+
+def bench_rules(args) -> dict:
+    per_worker = max(1, args.comments * args.requests // args.concurrency)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(_rules_worker, [per_worker] * args.concurrency))
+    wall = time.perf_counter() - start
+
+    latencies = [lat for r in results for lat in r["latencies"]]
+    busy = max(r["wall"] for r in results)
+    return {
+        "unit": "comment",
+        "concurrency": args.concurrency,
+        "items": len(latencies),
+        "throughput_per_s": round(len(latencies) / busy, 1),
+        "wall_seconds": round(wall, 3),
+        "latency": latency_summary(latencies),
+        "workers": [w for r in results for w in r["workers"]],
+    }
+
+
+# ─── nodes ───────────────────────────────────────────────
+
+def _node_state(count: int) -> dict:
+    comments = [
+        {
+            "comment_id": f"c{i}",
+            "author": f"@user{i % 50}",
+            "text": CORPUS[i % len(CORPUS)],
+            "published_at": f"2025-01-{1 + i % 28:02d}T00:00:00Z",
+            "like_count": i % 37,
+        }
+        for i in range(count)
+    ]
+    return {
+        "video_id": "benchvideo0",
+        "video_title": "벤치마크 영상",
+        "transcript": TRANSCRIPT,
+        "comments": comments,
+    }
+
+
+def bench_nodes(args) -> dict:
+    import backend.graph.nodes.analyze as analyze_module
+    from backend.config import settings
+    from backend.graph.nodes.prescreen import prescreen_node
+    from backend.graph.nodes.validate import validate_node
+
+    # 매 반복이 같은 댓글이므로 판정 저장소를 쓰면 두 번째부터 분석이 통째로 생략된다
+    settings.verdict_store_enabled = False
+
+    llm = FakeTaggingLLM(latency_ms=0)
+    analyze_module.get_tagging_llm = lambda: llm
+
+    state = _node_state(args.comments)
+    prescreen_node(state)  # 워밍업
+
+    pid = os.getpid()
+    before = procstats.snapshot([pid]) if procstats.available() else {}
+    timings: dict[str, list[float]] = {"prescreen": [], "analyze": [], "validate": []}
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        t0 = time.perf_counter()
+        state_after = {**state, **prescreen_node(state)}
+        t1 = time.perf_counter()
+        # 그래프의 analyze 루프처럼 배치가 남아 있는 동안 반복
+        while len(state_after["llm_results"]) < len(state_after["suspect_idx"]):
+            state_after.update(asyncio.run(analyze_module.aanalyze_node(state_after)))
+        t2 = time.perf_counter()
+        validate_node(state_after)
+        t3 = time.perf_counter()
+        timings["prescreen"].append(t1 - t0)
+        timings["analyze"].append(t2 - t1)
+        timings["validate"].append(t3 - t2)
+    wall = time.perf_counter() - start
+    after = procstats.snapshot([pid]) if procstats.available() else {}
+
+    nodes = {}
+    for name, values in timings.items():
+        total = sum(values)
+        nodes[name] = {
+            "latency": latency_summary(values),
+            "comments_per_s": round(args.comments * len(values) / total, 1) if total else 0.0,
+        }
+    return {
+        "unit": "run",
+        "comments_per_run": args.comments,
+        "items": args.requests,
+        "throughput_per_s": round(args.requests / wall, 2),
+        "wall_seconds": round(wall, 3),
+        "nodes": nodes,
+        "workers": procstats.usage(before, after, wall),
+    }
+
+
+# ─── HTTP 시나리오 ───────────────────────────────────────
+
+class BenchServer:
+    """`backend.bench.server:app`을 uvicorn 하위 프로세스로 띄운다."""
+
+    def __init__(self, args, youtube: FakeYouTubeServer, port: int):
+        self.args = args
+        self.port = port
+        self.base_url = f"http://127.0.0.1:{port}"
+        self._tmp = tempfile.TemporaryDirectory(prefix="bench-")
+        self.env = {
+            **os.environ,
+            "YOUTUBE_API_KEY": "bench",
+            "GOOGLE_API_KEY": "",
+            "YOUTUBE_API_BASE_URL": youtube.base_url,
+            "BENCH_LLM_LATENCY_MS": str(args.llm_latency_ms),
+            "VIDEO_CACHE_ENABLED": "false",
+            "VERDICT_STORE_ENABLED": "false",
+            "RESULT_STORE_PATH": str(Path(self._tmp.name) / "results.db"),
+            "ANALYSIS_CACHE_TTL_SECONDS": "0",
+        }
+        self.log_path = Path(self._tmp.name) / "server.log"
+        self.process: subprocess.Popen | None = None
+
+    def __enter__(self) -> BenchServer:
+        # 서버 로그는 측정 출력과 섞이지 않게 파일로
+        self._log = open(self.log_path, "w", encoding="utf-8")
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "backend.bench.server:app",
+                "--host", "127.0.0.1", "--port", str(self.port),
+                "--workers", str(self.args.workers), "--log-level", "warning",
+            ],
+            cwd=PROJECT_ROOT,
+            env=self.env,
+            stdout=self._log,
+            stderr=subprocess.STDOUT,
+        )
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                log_tail = self.log_path.read_text(encoding="utf-8")[-2000:]
+                raise RuntimeError(f"벤치마크 서버가 시작하지 못했습니다:\n{log_tail}")
+            try:
+                if httpx.get(f"{self.base_url}/ready", timeout=1).status_code == 200:
+                    return self
+            except httpx.TransportError:
+                pass
+            time.sleep(0.2)
+        raise RuntimeError("벤치마크 서버 /ready 대기 시간 초과")
+
+    def __exit__(self, *exc) -> None:
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait(timeout=30)
+        self._log.close()
+        self._tmp.cleanup()
+
+    def worker_pids(self) -> list[int]:
+        # --workers 1이면 uvicorn 프로세스 자신이 워커
+        if self.args.workers <= 1:
+            return [self.process.pid]
+        # multiprocessing resource_tracker 등 워커가 아닌 자식은 제외
+        return [
+            pid for pid in procstats.children(self.process.pid)
+            if "spawn_main" in procstats.cmdline(pid)
+        ]
+
+
+async def _drive(base_url: str, requests: list[tuple[str, dict]], concurrency: int) -> dict:
+    """요청 목록을 concurrency개 동시에 보내고 지연시간/오류 수집."""
+    latencies: list[float] = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in requests:
+        queue.put_nowait(item)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+
+        async def worker():
+            nonlocal errors
+            while not queue.empty():
+                path, body = queue.get_nowait()
+                t0 = time.perf_counter()
+                try:
+                    resp = await client.post(path, json=body)
+                    ok = resp.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - t0)
+                else:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+
+    return {"latencies": latencies, "errors": errors, "wall": wall}
+
+
+def _http_requests(scenario: str, args) -> list[tuple[str, dict]]:
+    if scenario == "comment":
+        return [
+            ("/analyze/comment", {"comment_text": CORPUS[i % len(CORPUS)], "transcript": TRANSCRIPT})
+            for i in range(args.requests)
+        ]
+    # 요청마다 다른 video_id → 합치기/캐시 없이 매번 전체 파이프라인 실행
+    return [
+        ("/analyze", {"video_url": f"bench{i:06d}", "max_comments": args.comments})
+        for i in range(args.requests)
+    ]
+
+
+def bench_http(scenario: str, args, server: BenchServer) -> dict:
+    requests = _http_requests(scenario, args)
+    # 워밍업 (첫 요청 비용 제외)
+    asyncio.run(_drive(server.base_url, requests[:1], 1))
+
+    pids = server.worker_pids()
+    before = procstats.snapshot(pids) if procstats.available() else {}
+    result = asyncio.run(_drive(server.base_url, requests, args.concurrency))
+    after = procstats.snapshot(pids) if procstats.available() else {}
+
+    ok = len(result["latencies"])
+    return {
+        "unit": "request",
+        "concurrency": args.concurrency,
+        "server_workers": args.workers,
+        "items": ok,
+        "errors": result["errors"],
+        "throughput_per_s": round(ok / result["wall"], 2) if result["wall"] else 0.0,
+        "comments_per_s": (
+            round(ok * args.comments / result["wall"], 1)
+            if scenario == "analyze" and result["wall"] else None
+        ),
+        "wall_seconds": round(result["wall"], 3),
+        "latency": latency_summary(result["latencies"]),
+        "workers": procstats.usage(before, after, result["wall"]),
+    }
+
+
+# ─── 비교 ────────────────────────────────────────────────
+
+def _change(before: float, after: float) -> float:
+    return (after - before) / before * 100 if before else 0.0
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """처리량 감소 / p95 증가가 threshold%를 넘으면 회귀로 표시. 회귀 목록 반환."""
+    regressions = []
+    print(f"\n비교: {baseline['meta'].get('commit', '?')[:10]} → {current['meta'].get('commit', '?')[:10]}")
+    print(f"{'지표':<40} {'이전':>12} {'현재':>12} {'변화':>9}")
+
+    def row(name: str, before: float, after: float, higher_is_better: bool) -> None:
+        change = _change(before, after)
+        worse = -change if higher_is_better else change
+        flag = "  ← 회귀" if worse > threshold else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:<40} {before:>12.2f} {after:>12.2f} {change:>+8.1f}%{flag}")
+
+    for name, cur in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+        row(f"{name}.throughput_per_s", base["throughput_per_s"], cur["throughput_per_s"], True)
+        if "latency" in cur and "latency" in base:
+            row(f"{name}.p95_ms", base["latency"]["p95_ms"], cur["latency"]["p95_ms"], False)
+        for node, stats in cur.get("nodes", {}).items():
+            base_node = base.get("nodes", {}).get(node)
+            if base_node:
+                row(
+                    f"{name}.{node}.p50_ms",
+                    base_node["latency"]["p50_ms"],
+                    stats["latency"]["p50_ms"],
+                    False,
+                )
+    return regressions
+
+
+# ─── main ────────────────────────────────────────────────
+
+def _git_commit() -> dict:
+    def git(*cmd: str) -> str:
+        return subprocess.run(
+            ["git", *cmd], cwd=PROJECT_ROOT, capture_output=True, text=True
+        ).stdout.strip()
+
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain"))}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m backend.bench", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-s", "--scenarios", default=",".join(SCENARIOS),
+                        help=f"쉼표 구분 ({', '.join(SCENARIOS)})")
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="동시 요청 / 프로세스 수")
+    parser.add_argument("-n", "--requests", type=int, default=100, help="요청(반복) 수")
+    parser.add_argument("--comments", type=int, default=200, help="영상당 / 실행당 댓글 수")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0, help="대역 LLM 응답 지연")
+    parser.add_argument("--api-latency-ms", type=float, default=5.0, help="대역 YouTube API 응답 지연")
+    parser.add_argument("--port", type=int, default=8765, help="벤치마크 서버 포트")
+    parser.add_argument("-o", "--output", type=Path, help="결과 JSON 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 볼 악화 비율(%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 exit 1")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        print(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    report = {
+        "meta": {
+            **_git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "args": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        },
+        "scenarios": {},
+    }
+
+    for name in ("rules", "nodes"):
+        if name in scenarios:
+            print(f"[{name}] 실행 중…", flush=True)
+            report["scenarios"][name] = (bench_rules if name == "rules" else bench_nodes)(args)
+
+    http_scenarios = [s for s in ("comment", "analyze") if s in scenarios]
+    if http_scenarios:
+        youtube = FakeYouTubeServer(args.comments, args.api_latency_ms).start()
+        try:
+            with BenchServer(args, youtube, args.port) as server:
+                for name in http_scenarios:
+                    print(f"[{name}] 실행 중…", flush=True)
+                    report["scenarios"][name] = bench_http(name, args, server)
+        finally:
+            youtube.stop()
+
+    for name, result in report["scenarios"].items():
+        latency = result.get("latency", {})
+        print(
+            f"{name:<8} {result['throughput_per_s']:>10} {result['unit']}/s"
+            + (f"  p50 {latency['p50_ms']}ms p95 {latency['p95_ms']}ms p99 {latency['p99_ms']}ms"
+               if latency else "")
+        )
+        for node, stats in result.get("nodes", {}).items():
+            print(f"  {node:<10} p50 {stats['latency']['p50_ms']}ms  {stats['comments_per_s']} comments/s")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과 저장: {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(baseline, report, args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
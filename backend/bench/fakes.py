@@ -0,0 +1,171 @@
+"""벤치마크용 로컬 대역: YouTube Data API 서버, Gemini LLM, 자막.
+
+모두 결정적(seed 고정)이라 같은 설정이면 커밋 간 같은 입력으로 비교할 수 있다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from backend.llm.schemas import CommentTagging
+
+# 깨끗한 댓글과 Rule 엔진 규칙 그룹을 고루 건드리는 댓글을 섞은 코퍼스
+CORPUS = [
+    "영상 잘 봤습니다 항상 응원해요",
+    "오늘도 좋은 정보 감사합니다!",
+    "3:15 이 부분 진짜 웃기네요 ㅋㅋㅋ",
+    "노래 너무 좋아요 매일 듣는 중",
+    "편집 퀄리티가 점점 좋아지네요",
+    "다음 영상은 언제 올라오나요?",
+    "ㅅㅂ 이걸 영상이라고 올렸냐",
+    "병신같은 소리 하고 있네",
+    "와 진짜 잘하신다~ ㅋㅋ 호구 인증",
+    "그러니까 망하지 한심하다 진짜",
+    "빠순이들 또 몰려왔네",
+    "구독해주세요 https://spam.example 에서 무료 이벤트",
+    "죽어라 진짜 꼴보기 싫다",
+    "못생긴 게 얼굴 들이밀지 마라",
+    "꼰대 같은 소리 좀 그만해",
+    "이번 콘텐츠는 좀 아쉬웠어요. 다음엔 더 기대할게요",
+]
+
+TRANSCRIPT = (
+    "안녕하세요 여러분 오늘은 새로운 앨범 준비 과정을 보여드리려고 합니다. "
+    "녹음실에서 있었던 일, 안무 연습, 그리고 팬분들께 드리는 메시지까지 준비했어요. "
+) * 20
+
+
+def make_comments(video_id: str, count: int) -> list[dict]:
+    """video_id별로 결정적인 commentThreads 아이템 목록."""
+    rng = random.Random(video_id)
+    items = []
+    for i in range(count):
+        text = rng.choice(CORPUS)
+        items.append({
+            "id": f"{video_id}-{i}",
+            "snippet": {
+                "totalReplyCount": 0,
+                "topLevelComment": {
+                    "id": f"{video_id}-{i}",
+                    "snippet": {
+                        "authorDisplayName": f"@user{rng.randrange(500)}",
+                        "textDisplay": text,
+                        "textOriginal": text,
+                        "likeCount": rng.randrange(200),
+                        "publishedAt": f"2025-01-{1 + i % 28:02d}T{i % 24:02d}:00:00Z",
+                    },
+                },
+            },
+        })
+    return items
+
+
+class FakeYouTubeServer:
+    """YouTube Data API v3의 videos / commentThreads / comments를 흉내 내는 HTTP 서버.
+
+    YOUTUBE_API_BASE_URL을 `base_url`로 지정하면 백엔드의 httpx 경로가 이 서버를 호출한다.
+    """
+
+    def __init__(self, comments_per_video: int = 200, latency_ms: float = 0.0):
+        self.comments_per_video = comments_per_video
+        self.latency = latency_ms / 1000
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakeYouTubeServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with fake._lock:
+                    fake.requests += 1
+                if fake.latency:
+                    time.sleep(fake.latency)
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                body = fake.respond(url.path.rsplit("/", 1)[-1], query)
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def respond(self, resource: str, query: dict) -> dict:
+        if resource == "videos":
+            video_id = query.get("id", "")
+            return {"items": [{"id": video_id, "snippet": {
+                "title": f"벤치마크 영상 {video_id}", "channelTitle": "벤치마크 채널",
+            }}]}
+        if resource == "commentThreads":
+            items = make_comments(query.get("videoId", ""), self.comments_per_video)
+            start = int(query.get("pageToken") or 0)
+            end = start + int(query.get("maxResults", 100))
+            page = {"items": items[start:end]}
+            if end < len(items):
+                page["nextPageToken"] = str(end)
+            return page
+        # comments.list (답글): 벤치마크 코퍼스에는 답글이 없다
+        return {"items": []}
+
+
+class FakeTaggingLLM:
+    """`get_tagging_llm()` 대역. latency_ms만큼 기다린 뒤 Rule 기반으로 그럴듯한 태깅을 반환."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency = latency_ms / 1000
+
+    @staticmethod
+    def _tag(messages: list) -> CommentTagging:
+        # 프롬프트 길이 기반의 결정적 점수 (내용 분석은 Rule 엔진 벤치 대상이 아님)
+        score = len(messages[-1].content) % 100
+        level = "safe" if score < 20 else "mild" if score < 40 else "moderate" if score < 60 \
+            else "severe" if score < 80 else "critical"
+        return CommentTagging(
+            toxicity_score=score,
+            toxicity_level=level,
+            categories=["PROFANITY"] if score >= 40 else [],
+            explanation="벤치마크 응답",
+            suggestion=None,
+        )
+
+    def invoke(self, messages: list) -> CommentTagging:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._tag(messages)
+
+    async def ainvoke(self, messages: list) -> CommentTagging:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._tag(messages)
+
+
+def fake_transcript(video_id: str) -> str:
+    return TRANSCRIPT
@@ -0,0 +1,144 @@
+"""import 시간 벤치마크 (`python -X importtime` 기반).
+
+    uv run python -m backend.bench.imports                 # 예산 초과 시 exit 1
+    uv run python -m backend.bench.imports --repeat 7 --top 15
+    uv run python -m backend.bench.imports -o imports.json
+
+대상마다 새 인터프리터를 `--repeat`번 띄워 top-level import 누적 시간의 중앙값을 재고,
+예산(ms)과 비교하고, 마지막 실행의 패키지별 self 시간 상위 항목을 출력한다.
+기동 경로에서 import되면 안 되는 무거운 모듈(provider SDK, Rule 엔진 등)이
+섞여 들어오면 시간과 상관없이 실패로 표시한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    argv: tuple[str, ...]
+    budget_ms: float
+    # 첫 사용 때 불러와야 하는 모듈 — 기동 시 import되면 실패
+    deferred: tuple[str, ...] = ()
+
+
+TARGETS = (
+    Target(
+        "backend.main",
+        ("-c", "import backend.main"),
+        budget_ms=1500,
+        deferred=(
+            "langchain_google_genai",
+            "google.genai",
+            "youtube_transcript_api",
+            "korean_profanity",
+            "numpy",
+        ),
+    ),
+    Target(
+        "collect_comments --stats",
+        ("scripts/collect_comments.py", "--stats"),
+        budget_ms=120,
+        deferred=("dotenv", "googleapiclient", "korean_profanity"),
+    ),
+)
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """`-X importtime` 출력 → (모듈, self μs, cumulative μs, 깊이) 목록."""
+    rows = []
+    for line in stderr.splitlines():
+        m = _LINE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2))
+    return rows
+
+
+def measure(target: Target) -> tuple[float, float, list[tuple[str, int, int, int]]]:
+    """1회 실행 → (top-level import 합계 ms, 프로세스 wall ms, 파싱된 행)."""
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *target.argv],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    wall = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"{target.name} 실행 실패:\n{proc.stderr[-2000:]}")
+    rows = parse_importtime(proc.stderr)
+    total = sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000
+    return total, wall, rows
+
+
+def run_target(target: Target, repeat: int, top: int) -> dict:
+    totals, walls = [], []
+    rows: list[tuple[str, int, int, int]] = []
+    for _ in range(repeat):
+        total, wall, rows = measure(target)
+        totals.append(total)
+        walls.append(wall)
+
+    imported = {name for name, *_ in rows}
+    leaked = [m for m in target.deferred if m in imported]
+    import_ms = statistics.median(totals)
+    # 최상위 패키지별 self 시간 합 (어느 의존성이 비싼지)
+    packages: dict[str, int] = {}
+    for name, self_us, _, _ in rows:
+        root = name.split(".", 1)[0]
+        packages[root] = packages.get(root, 0) + self_us
+    slowest = sorted(packages.items(), key=lambda kv: -kv[1])[:top]
+    return {
+        "import_ms": round(import_ms, 1),
+        "wall_ms": round(statistics.median(walls), 1),
+        "budget_ms": target.budget_ms,
+        "modules": len(imported),
+        "leaked": leaked,
+        "ok": import_ms <= target.budget_ms and not leaked,
+        "slowest": [{"package": name, "self_ms": round(us / 1000, 1)} for name, us in slowest],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="기동 경로 import 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="대상별 실행 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=8, help="출력할 느린 패키지 개수")
+    parser.add_argument("-o", "--output", help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for target in TARGETS:
+        r = results[target.name] = run_target(target, args.repeat, args.top)
+        mark = "OK  " if r["ok"] else "FAIL"
+        print(
+            f"{mark} {target.name:<28} import {r['import_ms']:>8.1f}ms"
+            f" / 예산 {target.budget_ms:,.0f}ms  (프로세스 {r['wall_ms']:.0f}ms, 모듈 {r['modules']}개)"
+        )
+        if r["leaked"]:
+            print(f"     기동 시 import되면 안 되는 모듈: {', '.join(r['leaked'])}")
+        for item in r["slowest"]:
+            print(f"       {item['self_ms']:>8.1f}ms  {item['package']}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과 저장: {args.output}")
+
+    return 0 if all(r["ok"] for r in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""같은 결과를 내야 하는 두 경로 비교.
+
+    uv sync --extra fast
+    uv run python -m backend.bench.parity                # 불일치 시 exit 1
+    uv run python -m backend.bench.parity --cases 50 --seed 7
+
+- 집계: NumPy / 순수 파이썬 경로(`graph/aggregate.py`). 같은 난수 테이블(안전/의심 행,
+  LLM 실패·누락, 반올림 경계 점수, 날짜 없음, 일/월 구간)을 두 경로로 `apply_verdicts` +
+  `build_summary`하고 판정 컬럼과 요약이 모두 같은지 확인한다.
+  NumPy가 없으면 비교할 수 없으므로 실패로 표시한다.
+- 판정 저장소: 댓글 텍스트와 그 정규화 형태(NFD, 공백/탭/NBSP 변형)가 판정 저장소
+  (`verdict_store.score_comments`)를 어느 순서로 거쳐도 정규화 텍스트를 직접 분석한 결과와 같은지 확인한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import sys
+import tempfile
+import unicodedata
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+from backend.bench.fakes import CORPUS
+from backend.graph import aggregate
+from backend.graph.table import CATEGORIES, CommentTable, category_order
+
+VERDICT_COLUMNS = ("score", "level", "mask", "order", "source", "explanation", "suggestion")
+
+
+@contextmanager
+def numpy_path(enabled: bool):
+    """`NUMPY_MIN_ROWS`를 바꿔 한쪽 경로를 강제."""
+    saved = aggregate.NUMPY_MIN_ROWS
+    aggregate.NUMPY_MIN_ROWS = 0 if enabled else sys.maxsize
+    try:
+        yield
+    finally:
+        aggregate.NUMPY_MIN_ROWS = saved
+
+
+def random_case(rng: random.Random) -> tuple[CommentTable, list[int], list[int], list[dict]]:
+    """(테이블, safe_idx, suspect_idx, llm_results) 하나."""
+    rows = rng.choice((1, 255, 256, 1000, 5000))
+    # 짧은 기간은 일 단위, 긴 기간은 월 단위 구간이 된다
+    span_days = rng.choice((0, 30, 60, 61, 400))
+    start = date(2025, 1, 1)
+
+    table = CommentTable()
+    for i in range(rows):
+        day = start + timedelta(days=rng.randint(0, span_days))
+        table.append(
+            {
+                "comment_id": f"c{i}",
+                "author": f"a{i % 17}",
+                "text": "",
+                "published_at": "" if rng.random() < 0.05 else f"{day.isoformat()}T00:00:00Z",
+                "like_count": rng.choice((0, 0, 1, rng.randint(0, 10_000))),
+            },
+            rule_score=rng.randint(0, 100),
+            rule_order=category_order(rng.sample(CATEGORIES, rng.randint(0, 3))),
+        )
+
+    order = list(range(rows))
+    rng.shuffle(order)
+    cut = rng.randint(0, rows)
+    safe_idx, suspect_idx = sorted(order[:cut]), sorted(order[cut:])
+
+    llm_results = []
+    # 끝의 일부는 결과 없음 (배치 미완료와 같은 모양)
+    for k, i in enumerate(suspect_idx[: rng.randint(0, len(suspect_idx))]):
+        failed = rng.random() < 0.1
+        llm_results.append({
+            "row": i,
+            # 5, 15, 25 … 는 AI×0.7 + Rule×0.3이 .5로 끝나기 쉬운 값
+            "toxicity_score": None if failed else rng.choice((rng.randint(0, 100), 5 + 10 * (k % 10))),
+            "categories": rng.sample(CATEGORIES, rng.randint(0, 2)),
+            "explanation": "" if failed else f"e{i}",
+            "suggestion": None if failed else f"s{i}",
+        })
+    return table, safe_idx, suspect_idx, llm_results
+
+
+def run_path(numpy: bool, case) -> tuple[CommentTable, dict]:
+    table, safe_idx, suspect_idx, llm_results = copy.deepcopy(case)
+    with numpy_path(numpy):
+        aggregate.apply_verdicts(table, safe_idx, suspect_idx, llm_results)
+        summary = aggregate.build_summary(table, len(safe_idx), len(suspect_idx))
+    return table, summary
+
+
+def compare(case) -> list[str]:
+    """두 경로의 차이 목록 (같으면 빈 목록)."""
+    np_table, np_summary = run_path(True, case)
+    py_table, py_summary = run_path(False, case)
+    diffs = [
+        name for name in VERDICT_COLUMNS
+        if list(getattr(np_table, name)) != list(getattr(py_table, name))
+    ]
+    diffs += [
+        f"summary.{key}" for key in py_summary if np_summary.get(key) != py_summary[key]
+    ]
+    return diffs
+
+
+def check_aggregate(cases: int, seed: int) -> bool:
+    if aggregate._numpy() is None:
+        print("FAIL NumPy가 설치되어 있지 않아 집계 경로를 비교할 수 없습니다 (uv sync --extra fast)")
+        return False
+
+    rng = random.Random(seed)
+    failures = 0
+    for n in range(cases):
+        case = random_case(rng)
+        diffs = compare(case)
+        if diffs:
+            failures += 1
+            print(f"FAIL case {n} ({len(case[0])}행): {', '.join(diffs)}")
+
+    mark = "OK  " if not failures else "FAIL"
+    print(f"{mark} 집계: {cases - failures}/{cases}개 테이블에서 두 경로 결과 일치")
+    return not failures
+
+
+def text_variants(text: str) -> list[str]:
+    """정규화하면 text와 같아지는 변형들."""
+    return [
+        unicodedata.normalize("NFD", text),
+        f"  {text}\t",
+        text.replace(" ", "  "),
+        text.replace(" ", "\u00a0"),
+        text.replace(" ", "\t\u3000"),
+    ]
+
+
+def check_verdict_normalization() -> bool:
+    from backend.storage.verdict_store import (
+        VerdictStore,
+        analysis_record,
+        normalize_text,
+        score_comments,
+    )
+    from korean_profanity import analyze_comment
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for n, text in enumerate(CORPUS):
+            expected = analysis_record(analyze_comment(normalize_text(text)))
+            variants = text_variants(text)
+            # 변형이 먼저 저장되는 경우와 원문이 먼저 저장되는 경우 모두
+            for order, texts in (("variant-first", [*variants, text]), ("text-first", [text, *variants])):
+                store = VerdictStore(Path(tmp) / f"{n}-{order}.db")
+                scores = [score_comments(store, [t])[1][0]["toxicityScore"] for t in texts]
+                if any(score != expected["toxicityScore"] for score in scores):
+                    failures += 1
+                    print(f"FAIL {order}: {text!r} → {scores} (기대 {expected['toxicityScore']})")
+
+    mark = "OK  " if not failures else "FAIL"
+    print(f"{mark} 판정 저장소: 텍스트 {len(CORPUS)}개 × 변형 {len(text_variants(''))}개가 정규화 텍스트와 같은 점수")
+    return not failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="같은 결과를 내야 하는 두 경로 비교")
+    parser.add_argument("--cases", type=int, default=20, help="집계 비교 난수 테이블 개수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    ok = check_aggregate(args.cases, args.seed)
+    ok = check_verdict_normalization() and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
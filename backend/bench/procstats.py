@@ -0,0 +1,81 @@
+"""/proc 기반 프로세스 CPU/메모리 측정 (Linux 전용, 없으면 빈 값)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PROC = Path("/proc")
+
+
+def available() -> bool:
+    return (_PROC / "self" / "stat").exists()
+
+
+def cpu_seconds(pid: int) -> float:
+    """프로세스의 누적 user+system CPU 시간(초)."""
+    stat = (_PROC / str(pid) / "stat").read_text()
+    # comm에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 파싱 (필드 14, 15 = utime, stime)
+    fields = stat[stat.rindex(")") + 2:].split()
+    return (int(fields[11]) + int(fields[12])) / _CLK_TCK
+
+
+def memory_kb(pid: int) -> dict[str, int]:
+    """VmRSS(현재) / VmHWM(최대) KB."""
+    result = {}
+    for line in (_PROC / str(pid) / "status").read_text().splitlines():
+        key, _, value = line.partition(":")
+        if key in ("VmRSS", "VmHWM"):
+            result[key] = int(value.split()[0])
+    return result
+
+
+def cmdline(pid: int) -> str:
+    try:
+        return (_PROC / str(pid) / "cmdline").read_bytes().replace(b"\0", b" ").decode(errors="replace")
+    except OSError:
+        return ""
+
+
+def children(pid: int) -> list[int]:
+    """pid의 직계 자식 프로세스 (uvicorn --workers의 워커)."""
+    result = []
+    for entry in _PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+        if ppid == pid:
+            result.append(int(entry.name))
+    return sorted(result)
+
+
+def snapshot(pids: list[int]) -> dict[int, dict]:
+    """pid별 CPU 시간 + 메모리. 이미 끝난 프로세스는 건너뛴다."""
+    result = {}
+    for pid in pids:
+        try:
+            result[pid] = {"cpu_seconds": cpu_seconds(pid), **memory_kb(pid)}
+        except (OSError, ValueError):
+            continue
+    return result
+
+
+def usage(before: dict[int, dict], after: dict[int, dict], wall_seconds: float) -> list[dict]:
+    """두 snapshot 사이의 워커별 CPU 사용률(%)과 RSS."""
+    workers = []
+    for pid, end in after.items():
+        start = before.get(pid, {"cpu_seconds": 0.0})
+        cpu = end["cpu_seconds"] - start["cpu_seconds"]
+        workers.append({
+            "pid": pid,
+            "cpu_seconds": round(cpu, 3),
+            "cpu_percent": round(cpu / wall_seconds * 100, 1) if wall_seconds else 0.0,
+            "rss_kb": end.get("VmRSS"),
+            "peak_rss_kb": end.get("VmHWM"),
+        })
+    return workers
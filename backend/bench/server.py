@@ -0,0 +1,22 @@
+"""벤치마크용 API 앱: backend.main.app에 LLM/자막 대역을 끼운 것.
+
+uvicorn 워커 프로세스마다 import되므로 설정은 환경 변수로 받는다.
+
+    BENCH_LLM_LATENCY_MS=200 YOUTUBE_API_BASE_URL=http://127.0.0.1:PORT \\
+        uv run uvicorn backend.bench.server:app --workers 2
+"""
+
+from __future__ import annotations
+
+import os
+
+import backend.graph.nodes.analyze as analyze_module
+import backend.graph.nodes.fetch as fetch_module
+from backend.bench.fakes import FakeTaggingLLM, fake_transcript
+from backend.main import app
+
+_llm = FakeTaggingLLM(latency_ms=float(os.environ.get("BENCH_LLM_LATENCY_MS", "0")))
+analyze_module.get_tagging_llm = lambda: _llm
+fetch_module._fetch_transcript = fake_transcript
+
+__all__ = ["app"]
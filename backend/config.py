@@ -14,12 +14,85 @@ class Settings(BaseSettings):
     google_api_key: str = Field(default="")
     gemini_model: str = Field(default="gemini-2.5-flash")
 
+    # YouTube Data API (비동기 httpx 경로)
+    youtube_api_base_url: str = Field(default="https://www.googleapis.com/youtube/v3")
+    youtube_max_retries: int = Field(default=3)
+
+    # 댓글 수집 한도 (요청별로 조정 가능, 상한은 max_comments_limit)
+    default_max_comments: int = Field(default=100)
+    max_comments_limit: int = Field(default=50_000)
+    # 이 개수를 넘으면 수집한 댓글을 임시 JSONL 파일로 내린다
+    comment_spill_threshold: int = Field(default=5_000)
+    comment_spool_dir: Path = Field(
+        default_factory=lambda: Path(__file__).resolve().parent.parent / ".cache" / "spool"
+    )
+
+    # async 분석 노드의 Gemini 동시 호출 수
+    llm_concurrency: int = Field(default=8)
+    # analyze 노드 한 번(= 체크포인트 한 번)에 처리할 suspect 수의 하한과, 실행당 최대 배치 수
+    analyze_batch_size: int = Field(default=100)
+    analyze_max_batches: int = Field(default=20)
+
+    # 동일 /analyze 요청 합치기: 완료 결과를 재사용하는 시간(초, 0이면 끔)과 최대 개수
+    analysis_cache_ttl_seconds: float = Field(default=30.0)
+    analysis_cache_size: int = Field(default=64)
+
+    # 이 크기(bytes) 이상의 JSON 응답은 gzip/br 압축
+    response_compress_min_bytes: int = Field(default=1024)
+    # 이 크기 이상이면 압축을 스레드에서 실행 (이벤트 루프를 막지 않도록)
+    response_compress_offload_bytes: int = Field(default=64 * 1024)
+
+    # POST /analyze/comments 한 번에 받을 최대 댓글 수
+    bulk_comments_limit: int = Field(default=1000)
+
+    # 백그라운드 작업 (POST /jobs)
+    job_workers: int = Field(default=2)
+    job_queue_size: int = Field(default=100)
+    job_ttl_seconds: int = Field(default=3600)
+    # SSE keep-alive 주기 (초)
+    job_heartbeat_seconds: float = Field(default=15.0)
+
     # Rule pre-screen 임계값 (이 점수 미만이고 카테고리 없으면 AI 스킵)
     prescreen_threshold: int = Field(default=20)
 
     # scripts/ 경로 (korean_profanity import용)
     project_root: Path = Field(default_factory=lambda: Path(__file__).resolve().parent.parent)
 
+    # 로컬 캐시/저장소 루트 (영상별 캐시 등)
+    cache_dir: Path = Field(
+        default_factory=lambda: Path(__file__).resolve().parent.parent / ".cache"
+    )
+    # 재분석 시 캐시된 댓글/자막을 재사용하고 새 댓글만 수집
+    video_cache_enabled: bool = Field(default=True)
+
+    # 분석 결과 저장소 (GET /results/{id})
+    result_store_enabled: bool = Field(default=True)
+    result_store_path: Path = Field(
+        default_factory=lambda: Path(__file__).resolve().parent.parent / ".cache" / "results.db"
+    )
+
+    # 중단된 /analyze · /jobs 실행을 run_id로 이어서 실행 (langgraph-checkpoint-sqlite + aiosqlite)
+    checkpoint_enabled: bool = Field(default=True)
+    checkpoint_path: Path = Field(
+        default_factory=lambda: Path(__file__).resolve().parent.parent / ".cache" / "checkpoints.db"
+    )
+    # 이 시간(초) 동안 진행이 없는 실패/중단 실행의 체크포인트와 스풀은 서버 기동 시 지운다
+    checkpoint_ttl_seconds: int = Field(default=86_400)
+
+    # 수집 스크립트 출력 + 통계 인덱스 (GET /stats/*, collect_comments.py --stats와 공유)
+    collection_data_dir: Path = Field(
+        default_factory=lambda: Path(__file__).resolve().parent.parent / "scripts" / "data"
+    )
+    collection_stats_path: Path = Field(
+        default_factory=lambda: Path(__file__).resolve().parent.parent / "scripts" / "data" / "stats.db"
+    )
+
+    # 댓글 텍스트 해시 → Rule/LLM 판정 저장소 (collect_comments.py와 공유). 본 텍스트는 다시 분석하지 않음
+    verdict_store_enabled: bool = Field(default=True)
+    verdict_store_path: Path = Field(
+        default_factory=lambda: Path(__file__).resolve().parent.parent / ".cache" / "verdicts.db"
+    )
+
     model_config = {"env_file": str(_env_path), "extra": "ignore"}
 
 
@@ -0,0 +1,311 @@
+"""판정 합산 + 요약 집계 (컬럼 단위 일괄 계산).
+
+validate 노드의 두 단계를 행 단위 루프 대신 컬럼 배열 단위로 처리한다.
+
+- `apply_verdicts`: safe / suspect 행의 판정 컬럼 채우기 (AI×0.7 + Rule×0.3, AI 하한선)
+- `build_summary`: score / level / mask / like_count / published_at 컬럼을 한 번 훑어 요약 통계
+
+NumPy가 설치되어 있고 행이 `NUMPY_MIN_ROWS` 이상이면 NumPy로 계산하고, 아니면 같은 식의
+순수 파이썬 경로로 계산한다. 두 경로의 결과는 같다 (`round()`와 `np.rint()`는 모두
+half-to-even, 합계는 정수 연산). NumPy는 첫 사용 때 불러온다 (기동 시간에 포함하지 않음).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from functools import lru_cache
+from typing import Sequence
+
+from backend.graph.table import (
+    CATEGORIES,
+    LEVELS,
+    SOURCES,
+    CommentTable,
+    category_order,
+    mask_categories,
+    merge_orders,
+    order_mask,
+)
+
+# 이보다 작은 테이블은 NumPy 변환 비용이 더 크다
+NUMPY_MIN_ROWS = 256
+
+# 심각도·유형 분포는 악성 댓글(score >= 30)만 집계
+TOXIC_THRESHOLD = 30
+# level 코드 = score가 넘은 경계 수 (LEVELS 순서: safe < mild < moderate < severe < critical)
+LEVEL_THRESHOLDS = (20, 40, 60, 80)
+PERCENTILES = (50, 75, 90, 95, 99)
+# 게시일 구간이 이 일수를 넘으면 월 단위로 묶는다
+MAX_DAY_BUCKETS = 60
+
+_RULE_ONLY = SOURCES.index("rule_only")
+_LLM_RULE = SOURCES.index("llm+rule")
+
+
+@lru_cache(maxsize=1)
+def _numpy():
+    """NumPy 모듈 (없으면 None)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _use_numpy(rows: int):
+    return _numpy() if rows >= NUMPY_MIN_ROWS else None
+
+
+# ─── 판정 합산 ───────────────────────────────────────────
+
+
+def fuse_score(ai_score: int, rule_score: int) -> int:
+    """AI×0.7 + Rule×0.3 가중 합산, AI 하한선(AI - 10) 보장, 최대 100."""
+    merged_score = round(ai_score * 0.7 + rule_score * 0.3)
+    return min(max(merged_score, ai_score - 10), 100)
+
+
+def apply_verdicts(
+    table: CommentTable,
+    safe_idx: Sequence[int],
+    suspect_idx: Sequence[int],
+    llm_results: list[dict],
+) -> None:
+    """safe / suspect 행의 판정 컬럼을 제자리에서 채운다.
+
+    - safe 행, LLM 실패한 suspect 행: Rule 결과 (`rule_only`)
+    - LLM 성공한 suspect 행: 가중 합산 점수 + 카테고리 union (`llm+rule`, AI 카테고리 먼저)
+
+    llm_results는 suspect_idx와 같은 순서다.
+    """
+    rule_rows = list(safe_idx)
+    fused_rows: list[int] = []
+    ai_scores: list[int] = []
+    # 카테고리 순서 병합은 벡터화할 수 없으므로 여기서 행마다 (조합 수만큼만 캐시 미스)
+    fused_orders: list[int] = []
+
+    # 텍스트 컬럼과 행 분류는 suspect 수만큼만 루프
+    for k, i in enumerate(suspect_idx):
+        lr = llm_results[k] if k < len(llm_results) else None
+        if lr and lr["toxicity_score"] is not None:
+            fused_rows.append(i)
+            ai_scores.append(lr["toxicity_score"])
+            fused_orders.append(
+                merge_orders(category_order(lr.get("categories", [])), table.rule_order[i])
+            )
+            table.explanation[i] = lr.get("explanation", "")
+            table.suggestion[i] = lr.get("suggestion")
+        else:
+            rule_rows.append(i)
+            table.explanation[i] = lr.get("explanation", "") if lr else ""
+            table.suggestion[i] = None
+    for i in safe_idx:
+        table.explanation[i] = ""
+        table.suggestion[i] = None
+
+    np = _use_numpy(len(rule_rows) + len(fused_rows))
+    if np is not None:
+        _apply_numpy(np, table, rule_rows, fused_rows, ai_scores, fused_orders)
+        return
+
+    for i in rule_rows:
+        table.score[i] = table.rule_score[i]
+        table.mask[i] = table.rule_mask[i]
+        table.order[i] = table.rule_order[i]
+        table.source[i] = _RULE_ONLY
+    for i, ai_score, order in zip(fused_rows, ai_scores, fused_orders):
+        table.score[i] = fuse_score(ai_score, table.rule_score[i])
+        table.mask[i] = order_mask(order)
+        table.order[i] = order
+        table.source[i] = _LLM_RULE
+    for i in rule_rows + fused_rows:
+        score = table.score[i]
+        table.level[i] = sum(score >= t for t in LEVEL_THRESHOLDS)
+
+
+def _apply_numpy(np, table, rule_rows, fused_rows, ai_scores, fused_orders) -> None:
+    # 테이블 컬럼을 복사 없이 보는 view (함수가 끝나면 해제되어 array 크기 변경이 다시 가능)
+    score = np.frombuffer(table.score, dtype=np.int16)
+    level = np.frombuffer(table.level, dtype=np.uint8)
+    mask = np.frombuffer(table.mask, dtype=np.uint32)
+    order = np.frombuffer(table.order, dtype=np.uint64)
+    source = np.frombuffer(table.source, dtype=np.uint8)
+    rule_score = np.frombuffer(table.rule_score, dtype=np.int16)
+    rule_mask = np.frombuffer(table.rule_mask, dtype=np.uint32)
+    rule_order = np.frombuffer(table.rule_order, dtype=np.uint64)
+
+    rows = np.asarray(rule_rows, dtype=np.intp)
+    score[rows] = rule_score[rows]
+    mask[rows] = rule_mask[rows]
+    order[rows] = rule_order[rows]
+    source[rows] = _RULE_ONLY
+
+    rows = np.asarray(fused_rows, dtype=np.intp)
+    ai = np.asarray(ai_scores, dtype=np.int64)
+    merged = np.rint(ai * 0.7 + rule_score[rows] * 0.3).astype(np.int64)
+    score[rows] = np.minimum(np.maximum(merged, ai - 10), 100)
+    mask[rows] = np.asarray([order_mask(o) for o in fused_orders], dtype=np.uint32)
+    order[rows] = np.asarray(fused_orders, dtype=np.uint64)
+    source[rows] = _LLM_RULE
+
+    rows = np.asarray(rule_rows + fused_rows, dtype=np.intp)
+    touched = score[rows]
+    level[rows] = sum((touched >= t).astype(np.uint8) for t in LEVEL_THRESHOLDS)
+
+
+# ─── 요약 집계 ───────────────────────────────────────────
+
+
+def build_summary(
+    tagged: CommentTable, skipped: int, analyzed: int, cached: int = 0
+) -> dict:
+    """판정 컬럼 → 요약 통계.
+
+    Args:
+        skipped: 이번 실행에서 Rule만으로 처리한 댓글 수.
+        analyzed: 이번 실행에서 LLM에 보낸 댓글 수.
+        cached: 영상 캐시에서 가져온 댓글 수.
+    """
+    total = len(tagged)
+    np = _use_numpy(total)
+    stats = _column_stats_numpy(np, tagged) if np is not None else _column_stats(tagged)
+
+    toxic_count = stats["toxic"]
+    clean_count = total - toxic_count
+    new_total = skipped + analyzed
+    total_likes = stats["likes"]
+
+    return {
+        "total_comments": total,
+        "clean_comments": clean_count,
+        "clean_percentage": round(clean_count / total * 100, 1) if total else 0,
+        "toxic_comments": toxic_count,
+        "toxic_percentage": round(toxic_count / total * 100, 1) if total else 0,
+        "average_toxicity_score": round(stats["score_sum"] / total, 1) if total else 0,
+        "category_distribution": {
+            c: n for c, n in zip(CATEGORIES, stats["categories"]) if n
+        },
+        "level_distribution": dict(zip(LEVELS, stats["levels"])),
+        "score_percentiles": {
+            f"p{p}": _nearest_rank(stats["sorted_scores"], p) for p in PERCENTILES
+        },
+        "likes_weighted": {
+            "total_likes": total_likes,
+            "average_toxicity_score": (
+                round(stats["weighted_sum"] / total_likes, 1) if total_likes else 0
+            ),
+            "toxic_like_share": (
+                round(stats["toxic_likes"] / total_likes * 100, 1) if total_likes else 0
+            ),
+        },
+        "toxicity_over_time": _time_histogram(*stats["buckets"]),
+        "pipeline_stats": {
+            "rule_skipped": skipped,
+            "llm_analyzed": analyzed,
+            "skip_ratio": round(skipped / new_total * 100, 1) if new_total else 0,
+            "cached": cached,
+        },
+    }
+
+
+def _nearest_rank(sorted_scores: Sequence[int], p: int) -> int:
+    """nearest-rank 백분위수 (항상 실제 점수 중 하나)."""
+    n = len(sorted_scores)
+    if not n:
+        return 0
+    return int(sorted_scores[max(1, -(-p * n // 100)) - 1])
+
+
+def _bucket_keys(published_at: list[str]) -> tuple[str, list[str]]:
+    """게시 시각(ISO 8601) → (구간 단위, 행별 구간 키). 게시 시각이 없는 행은 ""."""
+    days = [p[:10] for p in published_at]
+    distinct = set(days)
+    distinct.discard("")
+    if len(distinct) <= MAX_DAY_BUCKETS:
+        return "day", days
+    return "month", [d[:7] for d in days]
+
+
+def _column_stats(tagged: CommentTable) -> dict:
+    scores = tagged.score
+    likes = tagged.like_count
+    toxic_rows = [i for i, score in enumerate(scores) if score >= TOXIC_THRESHOLD]
+
+    level_counts = Counter(tagged.level[i] for i in toxic_rows)
+    mask_counts = Counter(tagged.mask[i] for i in toxic_rows)
+    category_counts: Counter = Counter()
+    for mask, count in mask_counts.items():
+        if mask:
+            for category in mask_categories(mask):
+                category_counts[category] += count
+
+    unit, keys = _bucket_keys(tagged.published_at)
+    buckets: dict[str, list[int]] = {}
+    for key, score in zip(keys, scores):
+        if key:
+            b = buckets.setdefault(key, [0, 0, 0])
+            b[0] += 1
+            b[1] += score >= TOXIC_THRESHOLD
+            b[2] += score
+
+    return {
+        "toxic": len(toxic_rows),
+        "score_sum": sum(scores),
+        "levels": [level_counts.get(code, 0) for code in range(len(LEVELS))],
+        "categories": [category_counts[c] for c in CATEGORIES],
+        "sorted_scores": sorted(scores),
+        "likes": sum(likes),
+        "weighted_sum": sum(s * n for s, n in zip(scores, likes)),
+        "toxic_likes": sum(likes[i] for i in toxic_rows),
+        "buckets": (unit, [(key, *buckets[key]) for key in sorted(buckets)]),
+    }
+
+
+def _column_stats_numpy(np, tagged: CommentTable) -> dict:
+    scores = np.frombuffer(tagged.score, dtype=np.int16).astype(np.int64)
+    likes = np.frombuffer(tagged.like_count, dtype=np.int64)
+    levels = np.frombuffer(tagged.level, dtype=np.uint8)
+    masks = np.frombuffer(tagged.mask, dtype=np.uint32)
+    toxic = scores >= TOXIC_THRESHOLD
+    toxic_masks = masks[toxic]
+
+    unit, keys = _bucket_keys(tagged.published_at)
+    keys = np.asarray(keys)
+    dated = keys != ""
+    periods, inverse = np.unique(keys[dated], return_inverse=True)
+    counts = np.bincount(inverse, minlength=len(periods))
+    toxic_counts = np.bincount(inverse, weights=toxic[dated], minlength=len(periods))
+    score_sums = np.bincount(inverse, weights=scores[dated], minlength=len(periods))
+
+    return {
+        "toxic": int(np.count_nonzero(toxic)),
+        "score_sum": int(scores.sum()),
+        "levels": np.bincount(levels[toxic], minlength=len(LEVELS)).tolist(),
+        "categories": [
+            int(np.count_nonzero(toxic_masks & (1 << bit))) for bit in range(len(CATEGORIES))
+        ],
+        "sorted_scores": np.sort(scores),
+        "likes": int(likes.sum()),
+        "weighted_sum": int(scores @ likes),
+        "toxic_likes": int(likes[toxic].sum()),
+        "buckets": (unit, [
+            (str(key), int(n), int(t), int(s))
+            for key, n, t, s in zip(periods, counts, toxic_counts, score_sums)
+        ]),
+    }
+
+
+def _time_histogram(unit: str, items: list[tuple[str, int, int, int]]) -> dict:
+    """구간 단위 + [(구간, 댓글 수, 악성 수, 점수 합)] → 시간대별 독성 히스토그램."""
+    return {
+        "bucket": unit,
+        "items": [
+            {
+                "period": key,
+                "total": count,
+                "toxic": toxic,
+                "average_toxicity_score": round(score_sum / count, 1),
+            }
+            for key, count, toxic, score_sum in items
+        ],
+    }
@@ -0,0 +1,63 @@
+"""sync/async 겸용 노드 래퍼.
+
+파이프라인은 `ainvoke`로 실행된다. async 구현이 있는 노드는 그대로 쓰고,
+아직 sync뿐인 노드(Rule 엔진, 디스크 캐시 등)는 스레드로 오프로드해
+이벤트 루프를 막지 않게 한다. `invoke`로 실행하면 sync 구현이 쓰인다.
+두 경로 모두 노드 실행 시간을 `nvc_node_duration_seconds`에 기록하고,
+프로파일링 중인 요청이면 노드 span을 단다 (sync 전용 노드는 스택 샘플링 포함).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import Awaitable, Callable
+
+from langchain_core.runnables import RunnableLambda
+
+from backend.graph.state import PipelineState
+from backend.metrics import NODE_DURATION
+from backend.profiling import sampled_span, span
+
+SyncNode = Callable[[PipelineState], dict]
+AsyncNode = Callable[[PipelineState], Awaitable[dict]]
+
+
+def to_thread(func: SyncNode) -> AsyncNode:
+    """sync 노드 → asyncio.to_thread로 실행하는 async 노드."""
+
+    async def run(state: PipelineState) -> dict:
+        return await asyncio.to_thread(func, state)
+
+    run.__name__ = f"a{func.__name__}"
+    return run
+
+
+def _timed(name: str, func: SyncNode, sampled: bool = False) -> SyncNode:
+    node_span = sampled_span if sampled else span
+
+    @functools.wraps(func)
+    def run(state: PipelineState) -> dict:
+        with NODE_DURATION.time(node=name), node_span(f"node:{name}"):
+            return func(state)
+
+    return run
+
+
+def _atimed(name: str, afunc: AsyncNode) -> AsyncNode:
+    @functools.wraps(afunc)
+    async def run(state: PipelineState) -> dict:
+        with NODE_DURATION.time(node=name), span(f"node:{name}"):
+            return await afunc(state)
+
+    return run
+
+
+def node(func: SyncNode, afunc: AsyncNode | None = None) -> RunnableLambda:
+    """invoke → func, ainvoke → afunc (없으면 func를 스레드 오프로드)."""
+    name = func.__name__.removesuffix("_node")
+    if afunc is not None:
+        return RunnableLambda(_timed(name, func), afunc=_atimed(name, afunc))
+    # sync 전용 노드 = CPU 위주 (Rule 엔진, 병합, 디스크 I/O)
+    sync = _timed(name, func, sampled=True)
+    return RunnableLambda(sync, afunc=to_thread(sync))
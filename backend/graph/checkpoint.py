@@ -0,0 +1,198 @@
+"""중단된 분석 실행 재개 (LangGraph SQLite 체크포인트).
+
+전체 분석 파이프라인은 `CHECKPOINT_PATH`의 SQLite 체크포인터를 붙여 컴파일한다.
+LangGraph가 노드(super-step)가 끝날 때마다 state를 저장하고, analyze 노드는
+suspect를 배치 단위로 나눠 배치마다 한 번씩 실행되므로 LLM 결과도 배치마다 저장된다.
+
+실행은 run_id(= 체크포인트 thread_id)로 구분한다.
+
+- 같은 run_id의 체크포인트에 남은 노드가 있으면 입력 대신 None으로 실행해 거기서부터 이어 간다.
+  이때 요청의 영상과 수집 옵션(`RESUME_KEYS`)이 체크포인트의 입력과 다르면
+  `RunConflictError`(API에서 409)로 거절한다. 체크포인트는 그대로 남는다.
+- 같은 run_id의 실행(/analyze, 스트리밍, /jobs)은 `run_lock`으로 프로세스 안에서 하나씩 실행된다.
+- 끝난 실행의 체크포인트는 바로 지운다 (결과는 결과 저장소 / 영상 캐시에 남음).
+- 입력 오류(ValueError)는 재개해도 같으므로 체크포인트를 지우고 그대로 던진다.
+- 그 밖의 실패는 `RunInterruptedError`(run_id 포함)로 감싼다.
+- 실패/중단된 채 `CHECKPOINT_TTL_SECONDS` 동안 이어지지 않은 실행은 서버 기동 시
+  `sweep_checkpoints`가 체크포인트와 스풀 파일을 함께 지운다. 어느 체크포인트도 가리키지 않는
+  오래된 스풀 파일(수집 중 종료 등)도 이때 지운다.
+
+CHECKPOINT_ENABLED=false면 체크포인터 없이 컴파일되고, 위 함수들은 재개 없이 그대로 실행한다.
+켜져 있는데 langgraph-checkpoint-sqlite / aiosqlite를 불러오지 못하면 기동을 실패시킨다
+(재개가 조용히 꺼진 채로 뜨지 않도록).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+from backend.config import settings
+from backend.graph.nodes.fetch import extract_video_id
+from backend.graph.spool import remove_spool, sweep_spools
+from backend.graph.state import PipelineState
+
+logger = logging.getLogger(__name__)
+
+
+class RunInterruptedError(RuntimeError):
+    """파이프라인 실행 실패. 같은 run_id로 다시 요청하면 이어서 실행된다."""
+
+    def __init__(self, run_id: str, error: Exception):
+        super().__init__(f"{error} (run_id={run_id}로 다시 요청하면 이어서 실행합니다)")
+        self.run_id = run_id
+
+
+class RunConflictError(RuntimeError):
+    """run_id의 체크포인트가 다른 영상/수집 옵션의 실행이다."""
+
+    def __init__(self, run_id: str, mismatched: list[str]):
+        super().__init__(
+            f"run_id={run_id}의 체크포인트와 요청이 다릅니다 ({', '.join(mismatched)}). "
+            "처음 요청과 같은 옵션으로 다시 요청하거나 run_id 없이 요청하세요"
+        )
+        self.run_id = run_id
+
+
+# 체크포인트에서 이어 갈 때 요청과 같아야 하는 입력 (video_id는 URL에서 따로 비교)
+RESUME_KEYS = ("max_comments", "include_replies", "max_replies_per_thread")
+
+# run_id → (lock, 대기/실행 중인 실행 수)
+_run_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+
+@asynccontextmanager
+async def open_checkpointer() -> AsyncIterator[Any | None]:
+    """SQLite 체크포인터 (비활성이면 None, 켜져 있는데 패키지가 없으면 RuntimeError)."""
+    if not settings.checkpoint_enabled:
+        yield None
+        return
+    try:
+        import aiosqlite
+        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+        from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    except ImportError as e:
+        raise RuntimeError(
+            f"CHECKPOINT_ENABLED=true인데 체크포인터 패키지를 불러오지 못했습니다 ({e}). "
+            "`uv sync`로 설치하거나 CHECKPOINT_ENABLED=false로 실행하세요"
+        ) from e
+
+    settings.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    async with aiosqlite.connect(str(settings.checkpoint_path)) as conn:
+        # CommentTable(array 컬럼)은 msgpack으로 못 싣기 때문에 pickle로 저장한다
+        saver = AsyncSqliteSaver(conn, serde=JsonPlusSerializer(pickle_fallback=True))
+        await saver.setup()
+        yield saver
+
+
+async def sweep_checkpoints(saver: Any | None, ttl_seconds: float) -> int:
+    """마지막 체크포인트가 ttl_seconds보다 오래된 실행을 스풀 파일과 함께 삭제. 지운 실행 수.
+
+    남은 실행이 가리키지 않는 오래된 스풀 파일도 지운다 (saver가 None이어도).
+    """
+    cutoff = time.time() - ttl_seconds
+    thread_ids = []
+    if saver is not None:
+        async with saver.conn.execute("SELECT DISTINCT thread_id FROM checkpoints") as cursor:
+            thread_ids = [row[0] async for row in cursor]
+
+    removed = 0
+    live_spools = []
+    for thread_id in thread_ids:
+        latest = await saver.aget_tuple(run_config(thread_id))
+        if latest is None:
+            continue
+        values = latest.checkpoint["channel_values"]
+        if datetime.fromisoformat(latest.checkpoint["ts"]).timestamp() >= cutoff:
+            if values.get("comments_path"):
+                live_spools.append(values["comments_path"])
+            continue
+        remove_spool(values)
+        await saver.adelete_thread(thread_id)
+        removed += 1
+    orphans = sweep_spools(settings.comment_spool_dir, ttl_seconds, keep=live_spools)
+    if removed or orphans:
+        logger.info("오래된 실행 체크포인트 %d개, 스풀 파일 %d개 삭제", removed, orphans)
+    return removed
+
+
+def run_config(run_id: str) -> dict:
+    """run_id → 실행 config (체크포인트 thread_id)."""
+    return {"configurable": {"thread_id": run_id}}
+
+
+async def resume_point(pipeline: Any, run_id: str):
+    """이어서 실행할 체크포인트의 StateSnapshot. 없거나 이미 끝난 실행이면 None."""
+    if pipeline.checkpointer is None:
+        return None
+    snapshot = await pipeline.aget_state(run_config(run_id))
+    return snapshot if snapshot.next else None
+
+
+@asynccontextmanager
+async def run_lock(run_id: str) -> AsyncIterator[None]:
+    """같은 run_id의 실행을 하나씩 (하나의 체크포인트 thread를 동시에 진행하지 않도록)."""
+    lock, users = _run_locks.get(run_id, (None, 0))
+    lock = lock or asyncio.Lock()
+    _run_locks[run_id] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, users = _run_locks[run_id]
+        if users == 1:
+            del _run_locks[run_id]
+        else:
+            _run_locks[run_id] = (lock, users - 1)
+
+
+def _mismatched_inputs(values: dict, state: PipelineState) -> list[str]:
+    """체크포인트 입력과 요청이 다른 항목 이름."""
+    mismatched = []
+    if extract_video_id(values["video_url"]) != extract_video_id(state["video_url"]):
+        mismatched.append("video_id")
+    mismatched += [key for key in RESUME_KEYS if values.get(key) != state.get(key)]
+    return mismatched
+
+
+async def check_resume(pipeline: Any, state: PipelineState):
+    """`state`로 이어서 실행할 체크포인트 (`resume_point`). 입력이 다르면 RunConflictError."""
+    run_id = state["run_id"]
+    resume = await resume_point(pipeline, run_id)
+    if resume is not None:
+        mismatched = _mismatched_inputs(resume.values, state)
+        if mismatched:
+            raise RunConflictError(run_id, mismatched)
+    return resume
+
+
+async def discard_run(pipeline: Any, run_id: str) -> None:
+    """run_id의 체크포인트 삭제."""
+    if pipeline.checkpointer is not None:
+        await pipeline.checkpointer.adelete_thread(run_id)
+
+
+async def ainvoke_resumable(pipeline: Any, state: PipelineState) -> PipelineState:
+    """`state["run_id"]` 실행을 (체크포인트가 있으면 이어서) 끝까지 실행."""
+    run_id = state["run_id"]
+    async with run_lock(run_id):
+        resume = await check_resume(pipeline, state)
+        if resume is not None:
+            logger.info("실행 재개: %s (다음 노드: %s)", run_id, ", ".join(resume.next))
+
+        try:
+            result = await pipeline.ainvoke(
+                None if resume is not None else state, run_config(run_id)
+            )
+        except ValueError:
+            await discard_run(pipeline, run_id)
+            raise
+        except Exception as e:
+            raise RunInterruptedError(run_id, e) from e
+
+        await discard_run(pipeline, run_id)
+        return result
@@ -1,74 +1,210 @@
 """Gemini LLM 분석 노드.
 
-suspect_comments를 하나씩 Gemini에 보내서 구조화된 태깅 결과를 받는다.
-transcript를 맥락으로 제공.
+suspect 행(`suspect_idx`)의 댓글을 Gemini에 보내서 구조화된 태깅 결과를 받는다.
+transcript를 맥락으로 제공. 결과 dict의 "row"는 table 행 번호다.
+
+노드 한 번은 아직 결과가 없는 suspect 배치 하나만 처리하고 `llm_results`에 이어 붙인다.
+남은 배치가 있으면 그래프가 analyze로 다시 돌아오므로, 체크포인터가 있으면 배치마다
+진행 상황이 저장된다. 배치 크기는 ANALYZE_BATCH_SIZE 이상이고 배치 수는
+ANALYZE_MAX_BATCHES를 넘지 않는다.
+
+sync 버전(analyze_node)은 하나씩 순차 호출하고,
+async 버전(aanalyze_node)은 LLM_CONCURRENCY개까지 동시에 호출한다.
+async 버전은 결과가 나올 때마다 custom 스트림으로 `llm_result` 이벤트를 내보낸다.
+
+판정 저장소가 켜져 있으면 같은 텍스트(해시)는 배치 안에서 한 번만 호출하고, 저장된 판정이 있으면
+호출하지 않는다. 새로 받은 판정은 배치마다 저장되어 다음 실행부터는 prescreen이 미리 채운다.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from langchain_core.messages import HumanMessage, SystemMessage
+from langgraph.config import get_stream_writer
 
+from backend.config import settings
 from backend.llm.gemini import get_tagging_llm
+from backend.metrics import LLM_ERRORS, LLM_REQUEST_DURATION
+from backend.profiling import span
 from backend.prompts import SYSTEM_PROMPT, build_user_prompt
 from backend.graph.state import PipelineState
+from backend.graph.table import CommentTable, order_categories
+from backend.storage.verdict_store import LLM_VERDICT_FIELDS, text_hash, verdict_store
 
 logger = logging.getLogger(__name__)
 
 
+def _build_messages(table: CommentTable, i: int, transcript: str, video_title: str) -> list:
+    """table i행 댓글에 대한 LLM 입력 메시지."""
+    # Rule이 사전 탐지한 카테고리를 레퍼런스로 전달
+    rule_order = table.rule_order[i]
+    rule_categories = order_categories(rule_order) if rule_order else []
+
+    user_prompt = build_user_prompt(
+        table.text[i],
+        transcript,
+        video_title=video_title,
+        rule_categories=rule_categories if rule_categories else None,
+    )
+    return [
+        SystemMessage(content=SYSTEM_PROMPT),
+        HumanMessage(content=user_prompt),
+    ]
+
+
+def _llm_result(row: int, comment_id: str, result) -> dict:
+    return {
+        "row": row,
+        "comment_id": comment_id,
+        "toxicity_score": result.toxicity_score,
+        "toxicity_level": result.toxicity_level,
+        "categories": result.categories,
+        "explanation": result.explanation,
+        "suggestion": result.suggestion,
+    }
+
+
+def _failed_result(row: int, comment_id: str, error: Exception) -> dict:
+    logger.warning("LLM 분석 실패 (comment_id=%s): %s", comment_id, error)
+    # 실패 시 Rule 결과로 폴백
+    return {
+        "row": row,
+        "comment_id": comment_id,
+        "toxicity_score": None,  # validate에서 Rule 결과 사용
+        "toxicity_level": None,
+        "categories": [],
+        "explanation": f"LLM 분석 실패: {error}",
+        "suggestion": None,
+    }
+
+
+def _batch_keys(table: CommentTable, batch) -> tuple[list, dict[str, dict]]:
+    """배치 행별 호출 키와 판정 저장소에 이미 있는 판정 (키 → 판정).
+
+    판정 저장소가 켜져 있으면 키는 텍스트 해시라서 같은 텍스트는 배치 안에서 한 번만 호출하고,
+    앞 배치나 다른 실행이 그 사이 저장한 판정은 호출 없이 쓴다. 꺼져 있으면 키는 행 번호.
+    """
+    if not settings.verdict_store_enabled:
+        return list(batch), {}
+    keys = [text_hash(table.text[i]) for i in batch]
+    return keys, verdict_store.llm_verdicts(keys, settings.gemini_model)
+
+
+def _remember(responses: dict) -> None:
+    """이번 배치에서 새로 받은 Gemini 응답(키 → 응답)을 판정 저장소에 기록."""
+    if not settings.verdict_store_enabled or not responses:
+        return
+    verdict_store.put_llm_verdicts(
+        {key: {f: getattr(r, f) for f in LLM_VERDICT_FIELDS} for key, r in responses.items()},
+        settings.gemini_model,
+    )
+
+
+def next_batch(state: PipelineState):
+    """아직 LLM 결과가 없는 다음 suspect 배치 (table 행 번호)."""
+    suspect_idx = state.get("suspect_idx", [])
+    done = len(state.get("llm_results", []))
+    size = max(settings.analyze_batch_size, -(-len(suspect_idx) // settings.analyze_max_batches))
+    return suspect_idx[done:done + size]
+
+
+def _stream_writer():
+    """custom 스트림 writer. stream_mode="custom"이 아니면 no-op, 그래프 밖 직접 호출이면 None 무시."""
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return lambda _: None
+
+
 def analyze_node(state: PipelineState) -> dict:
-    """LLM 분석: suspect_comments를 하나씩 태깅."""
-    suspect_comments = state.get("suspect_comments", [])
+    """LLM 분석: 다음 suspect 배치를 하나씩 태깅."""
+    batch = next_batch(state)
+    if not batch:
+        return {}
+
+    table = state["table"]
     transcript = state.get("transcript", "")
     video_title = state.get("video_title", "")
-    prescreen_results = state.get("prescreen_results", [])
 
-    # prescreen 결과를 comment_id로 인덱싱
-    prescreen_map = {pr["comment_id"]: pr for pr in prescreen_results}
+    llm = get_tagging_llm()
+    keys, known = _batch_keys(table, batch)
+    # 키 → 이번 배치의 Gemini 응답 (실패면 예외)
+    called: dict = {}
+    llm_results: list[dict] = []
+
+    for i, key in zip(batch, keys):
+        cid = table.comment_id[i]
+        if key in known:
+            llm_results.append({"row": i, "comment_id": cid, **known[key]})
+            continue
+        if key not in called:
+            try:
+                with span("llm_call", comment_id=cid, model=settings.gemini_model):
+                    with span("build_prompt"):
+                        messages = _build_messages(table, i, transcript, video_title)
+                    with LLM_REQUEST_DURATION.time(model=settings.gemini_model):
+                        called[key] = llm.invoke(messages)
+            except Exception as e:
+                LLM_ERRORS.inc(model=settings.gemini_model)
+                called[key] = e
+        outcome = called[key]
+        if isinstance(outcome, Exception):
+            llm_results.append(_failed_result(i, cid, outcome))
+        else:
+            llm_results.append(_llm_result(i, cid, outcome))
+
+    _remember({k: r for k, r in called.items() if not isinstance(r, Exception)})
+    return {"llm_results": [*state.get("llm_results", []), *llm_results]}
 
-    if not suspect_comments:
-        return {"llm_results": []}
+
+async def aanalyze_node(state: PipelineState) -> dict:
+    """LLM 분석 (async): 다음 suspect 배치를 동시에 태깅. 결과 순서는 suspect_idx 순서."""
+    batch = next_batch(state)
+    if not batch:
+        return {}
+
+    table = state["table"]
+    transcript = state.get("transcript", "")
+    video_title = state.get("video_title", "")
 
     llm = get_tagging_llm()
-    llm_results: list[dict] = []
+    semaphore = asyncio.Semaphore(settings.llm_concurrency)
+    emit = _stream_writer()
+    keys, known = await asyncio.to_thread(_batch_keys, table, batch)
+
+    async def call(i: int):
+        async with semaphore:
+            try:
+                with span("llm_call", comment_id=table.comment_id[i], model=settings.gemini_model):
+                    with span("build_prompt"):
+                        messages = _build_messages(table, i, transcript, video_title)
+                    with LLM_REQUEST_DURATION.time(model=settings.gemini_model):
+                        return await llm.ainvoke(messages)
+            except Exception:
+                LLM_ERRORS.inc(model=settings.gemini_model)
+                raise
+
+    # 같은 키의 행은 호출 하나를 같이 기다린다
+    calls: dict = {}
+    for i, key in zip(batch, keys):
+        if key not in known and key not in calls:
+            calls[key] = asyncio.ensure_future(call(i))
+
+    async def tag(i: int, key) -> dict:
+        cid = table.comment_id[i]
+        if key in known:
+            lr = {"row": i, "comment_id": cid, **known[key]}
+        else:
+            try:
+                lr = _llm_result(i, cid, await calls[key])
+            except Exception as e:
+                lr = _failed_result(i, cid, e)
+        emit({"type": "llm_result", "result": lr})
+        return lr
 
-    for comment in suspect_comments:
-        try:
-            # Rule이 사전 탐지한 카테고리를 레퍼런스로 전달
-            pr = prescreen_map.get(comment["comment_id"])
-            rule_categories = pr["matched_categories"] if pr else []
-
-            user_prompt = build_user_prompt(
-                comment["text"],
-                transcript,
-                video_title=video_title,
-                rule_categories=rule_categories if rule_categories else None,
-            )
-            messages = [
-                SystemMessage(content=SYSTEM_PROMPT),
-                HumanMessage(content=user_prompt),
-            ]
-            result = llm.invoke(messages)
-
-            llm_results.append({
-                "comment_id": comment["comment_id"],
-                "toxicity_score": result.toxicity_score,
-                "toxicity_level": result.toxicity_level,
-                "categories": result.categories,
-                "explanation": result.explanation,
-                "suggestion": result.suggestion,
-            })
-        except Exception as e:
-            logger.warning("LLM 분석 실패 (comment_id=%s): %s", comment["comment_id"], e)
-            # 실패 시 Rule 결과로 폴백
-            llm_results.append({
-                "comment_id": comment["comment_id"],
-                "toxicity_score": None,  # validate에서 Rule 결과 사용
-                "toxicity_level": None,
-                "categories": [],
-                "explanation": f"LLM 분석 실패: {e}",
-                "suggestion": None,
-            })
-
-    return {"llm_results": llm_results}
+    llm_results = await asyncio.gather(*(tag(i, key) for i, key in zip(batch, keys)))
+    responses = {key: task.result() for key, task in calls.items() if task.exception() is None}
+    await asyncio.to_thread(_remember, responses)
+    return {"llm_results": [*state.get("llm_results", []), *llm_results]}
@@ -0,0 +1,78 @@
+"""영상별 캐시 노드: 재분석 시 새 댓글만 수집·태깅.
+
+load_cache: 캐시된 자막/메타데이터/태깅 결과와 워터마크를 state에 올린다.
+save_cache: 이번 실행에서 새로 태깅된 댓글을 캐시에 append한다 (전체 수집이면 캐시를 새로 만든다).
+"""
+
+from __future__ import annotations
+
+from backend.config import settings
+from backend.graph.nodes.fetch import CACHE_ORDER, extract_video_id, request_options
+from backend.graph.state import PipelineState
+from backend.storage.video_cache import video_cache
+
+
+def _covers_request(fetch: dict, options: dict) -> bool:
+    """캐시 + 워터마크 이후 댓글이 이번 요청의 전체 수집과 같아지는지.
+
+    수집 옵션이 같고, 캐시를 만든 수집이 order=time으로 한도에 닿기 전에 영상 전체를 모았어야 한다.
+    """
+    return (
+        fetch.get("options") == options
+        and fetch.get("order") == CACHE_ORDER
+        and fetch.get("complete", False)
+    )
+
+
+def load_cache_node(state: PipelineState) -> dict:
+    """캐시 조회. 히트하면 자막 수집을 건너뛰고 워터마크 이후 댓글만 수집한다.
+
+    캐시가 이번 요청을 다 담지 못하면(옵션이 다르거나 영상 일부만 수집) 쓰지 않는다.
+    그러면 전체 수집 후 save_cache가 캐시를 새로 만든다.
+    """
+    video_id = extract_video_id(state["video_url"])
+
+    if not settings.video_cache_enabled or state.get("refresh"):
+        return {"video_id": video_id}
+
+    cached = video_cache.load(video_id)
+    if cached is None or not _covers_request(cached["fetch"], request_options(state)):
+        return {"video_id": video_id}
+
+    return {
+        "video_id": video_id,
+        "video_title": cached["video_title"],
+        "channel_title": cached["channel_title"],
+        "transcript": cached["transcript"],
+        "watermark": cached["watermark"],
+        "cached": cached["tagged"],
+    }
+
+
+def save_cache_node(state: PipelineState) -> dict:
+    """새로 태깅된 댓글 저장 (캐시에서 온 댓글은 제외). 캐시 없이 수집했으면 캐시를 새로 만든다."""
+    if not settings.video_cache_enabled:
+        return {}
+
+    tagged = state.get("tagged")
+    if tagged is None:
+        return {}
+    cached = state.get("cached")
+    cached_ids = set(cached.comment_id) if cached is not None else set()
+    new_rows = [i for i, cid in enumerate(tagged.comment_id) if cid not in cached_ids]
+
+    video_cache.save(
+        state["video_id"],
+        video_title=state.get("video_title", ""),
+        channel_title=state.get("channel_title", ""),
+        transcript=state.get("transcript", ""),
+        tagged=tagged,
+        rows=new_rows,
+        fetch={
+            "options": request_options(state),
+            "order": CACHE_ORDER,
+            "complete": state.get("fetch_complete", False),
+        },
+        rebuild=cached is None,
+    )
+    return {}
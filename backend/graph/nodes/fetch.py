@@ -1,22 +1,36 @@
-"""YouTube 데이터 수집 노드: transcript + comments."""
+"""YouTube 데이터 수집 노드: transcript + comments.
+
+각 노드는 sync(`invoke`)와 async(`ainvoke`) 구현을 함께 제공한다.
+sync 경로는 스레드별로 캐싱된 googleapiclient 클라이언트를,
+async 경로는 커넥션 풀을 공유하는 httpx 클라이언트(backend.youtube)를 사용한다.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import re
 import sys
 from pathlib import Path
-
-from youtube_transcript_api import YouTubeTranscriptApi
+from typing import AsyncIterator
 
 from backend.config import settings
+from backend.graph.spool import CommentSpool
 from backend.graph.state import CommentRaw, PipelineState
+from backend.profiling import span
+from backend.youtube import InstrumentedClient, YouTubeAPIError, get_async_youtube_client
 
 # scripts/ 모듈 import를 위해 경로 추가
 _scripts_dir = str(settings.project_root / "scripts")
 if _scripts_dir not in sys.path:
     sys.path.insert(0, _scripts_dir)
 
-from collect_comments import build_youtube_client, fetch_comments as _yt_fetch  # noqa: E402
+from collect_comments import (  # noqa: E402
+    build_youtube_client,
+    is_comments_unavailable,
+    iter_comments as _yt_iter_comments,
+    parse_comment,
+    parse_comment_thread,
+)
 
 
 def extract_video_id(url: str) -> str:
@@ -34,6 +48,75 @@ def extract_video_id(url: str) -> str:
     raise ValueError(f"유효한 YouTube URL이 아닙니다: {url}")
 
 
+def _to_comment_raw(c: dict) -> CommentRaw:
+    """collect_comments 레코드(camelCase) → CommentRaw."""
+    comment: CommentRaw = {
+        "comment_id": c["commentId"],
+        "author": c["author"],
+        "text": c["text"],
+        "published_at": c["publishedAt"],
+        "like_count": c["likeCount"],
+    }
+    if c.get("parentId"):
+        comment["parent_id"] = c["parentId"]
+    return comment
+
+
+# 영상 캐시가 켜져 있으면 이 순서로 수집한다 (워터마크 이후 증분 수집의 기준)
+CACHE_ORDER = "time"
+
+
+def request_options(state: PipelineState) -> dict:
+    """state의 요청별 수집 옵션 (없으면 설정 기본값). 영상 캐시 메타데이터에도 저장된다."""
+    return {
+        "max_comments": state.get("max_comments") or settings.default_max_comments,
+        "include_replies": state.get("include_replies", False),
+        "max_replies_per_thread": state.get("max_replies_per_thread", 100),
+    }
+
+
+def _fetch_options(state: PipelineState) -> dict:
+    """iter_comments 인자.
+
+    영상 캐시가 켜져 있으면 최신순(order=time)으로 수집한다. 캐시 워터마크가 있으면
+    워터마크 직전까지, 캐시된 댓글 수를 뺀 한도 안에서만 수집한다.
+    """
+    options = request_options(state)
+    if settings.video_cache_enabled:
+        options["order"] = CACHE_ORDER
+    if state.get("watermark"):
+        options["stop_at"] = state["watermark"]
+        options["max_comments"] -= len(state["cached"])
+    return options
+
+
+def _fetched(spool: CommentSpool, options: dict) -> dict:
+    """수집 결과 state. 한도에 닿기 전에 끝났으면(페이지 소진, 워터마크 도달) 영상 전체를 본 것이다."""
+    update = spool.to_state()
+    update["fetch_complete"] = update["comment_count"] < options["max_comments"]
+    return update
+
+
+def _youtube_client() -> InstrumentedClient:
+    """sync 경로의 스레드별 googleapiclient 클라이언트 (요청/오류 메트릭 계측)."""
+    return InstrumentedClient(build_youtube_client(settings.youtube_api_key))
+
+
+def _fetch_transcript(video_id: str) -> str:
+    """자막 텍스트 수집. 자막이 없으면 빈 문자열."""
+    with span("youtube:transcript"):
+        try:
+            from youtube_transcript_api import YouTubeTranscriptApi
+
+            transcript_list = YouTubeTranscriptApi.get_transcript(
+                video_id, languages=["ko", "en"]
+            )
+            return " ".join(entry["text"] for entry in transcript_list)
+        except Exception:
+            # 자막이 없는 경우 빈 문자열 (파이프라인은 계속 진행)
+            return ""
+
+
 def _fetch_video_info(video_id: str) -> tuple[str, str]:
     """YouTube Data API로 영상 제목과 채널명 가져오기.
 
@@ -43,7 +126,7 @@ def _fetch_video_info(video_id: str) -> tuple[str, str]:
     if not settings.youtube_api_key:
         return "", ""
     try:
-        youtube = build_youtube_client(settings.youtube_api_key)
+        youtube = _youtube_client()
         resp = youtube.videos().list(part="snippet", id=video_id).execute()
         items = resp.get("items", [])
         if items:
@@ -54,20 +137,107 @@ def _fetch_video_info(video_id: str) -> tuple[str, str]:
     return "", ""
 
 
+async def _afetch_video_info(video_id: str) -> tuple[str, str]:
+    """`_fetch_video_info`의 비동기 버전 (httpx)."""
+    if not settings.youtube_api_key:
+        return "", ""
+    try:
+        items = await get_async_youtube_client().list_videos(video_id)
+        if items:
+            snippet = items[0]["snippet"]
+            return snippet.get("title", ""), snippet.get("channelTitle", "")
+    except Exception:
+        pass
+    return "", ""
+
+
+async def _aiter_thread_replies(item: dict, max_replies: int) -> AsyncIterator[dict]:
+    """`collect_comments.iter_thread_replies`의 비동기 버전."""
+    total = item["snippet"].get("totalReplyCount", 0)
+    if total == 0 or max_replies <= 0:
+        return
+
+    inline = item.get("replies", {}).get("comments", [])
+    if len(inline) >= total:
+        for reply in inline[:max_replies]:
+            yield parse_comment(reply)
+        return
+
+    youtube = get_async_youtube_client()
+    count = 0
+    page_token = None
+    while count < max_replies:
+        try:
+            resp = await youtube.list_comments(
+                item["id"], max_results=min(100, max_replies - count), page_token=page_token
+            )
+        except YouTubeAPIError as e:
+            if is_comments_unavailable(str(e)):
+                break
+            raise
+
+        for reply in resp.get("items", []):
+            yield parse_comment(reply)
+            count += 1
+
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            break
+
+
+async def _aiter_comments(
+    video_id: str,
+    max_comments: int = 100,
+    include_replies: bool = False,
+    max_replies_per_thread: int = 100,
+    order: str = "relevance",
+    stop_at: str | None = None,
+) -> AsyncIterator[dict]:
+    """`collect_comments.iter_comments`의 비동기 버전.
+
+    페이지네이션, 답글 수집, 댓글 비활성/403 시 중단 규칙은 동일하다.
+    """
+    youtube = get_async_youtube_client()
+    count = 0
+    page_token = None
+    part = "snippet,replies" if include_replies else "snippet"
+
+    while count < max_comments:
+        per_page = min(100, max_comments - count)
+        try:
+            resp = await youtube.list_comment_threads(
+                video_id, max_results=per_page, page_token=page_token, order=order, part=part
+            )
+        except YouTubeAPIError as e:
+            if is_comments_unavailable(str(e)):
+                break
+            raise
+
+        for item in resp.get("items", []):
+            if count >= max_comments:
+                return
+            comment = parse_comment_thread(item)
+            if stop_at and comment["publishedAt"] <= stop_at:
+                return
+            yield comment
+            count += 1
+
+            if include_replies:
+                budget = min(max_replies_per_thread, max_comments - count)
+                async for reply in _aiter_thread_replies(item, budget):
+                    yield reply
+                    count += 1
+
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            break
+
+
 def fetch_transcript_node(state: PipelineState) -> dict:
     """YouTube 자막 + 제목 + 채널명 수집 노드."""
     video_id = extract_video_id(state["video_url"])
 
-    transcript_text = ""
-    try:
-        transcript_list = YouTubeTranscriptApi.get_transcript(
-            video_id, languages=["ko", "en"]
-        )
-        transcript_text = " ".join(entry["text"] for entry in transcript_list)
-    except Exception:
-        # 자막이 없는 경우 빈 문자열 (파이프라인은 계속 진행)
-        transcript_text = ""
-
+    transcript_text = _fetch_transcript(video_id)
     video_title, channel_title = _fetch_video_info(video_id)
 
     return {
@@ -78,25 +248,63 @@ def fetch_transcript_node(state: PipelineState) -> dict:
     }
 
 
+async def afetch_transcript_node(state: PipelineState) -> dict:
+    """fetch_transcript_node의 비동기 버전. 자막과 영상 정보를 동시에 수집."""
+    video_id = extract_video_id(state["video_url"])
+
+    # youtube-transcript-api는 sync 전용 → 스레드로 오프로드
+    transcript_text, (video_title, channel_title) = await asyncio.gather(
+        asyncio.to_thread(_fetch_transcript, video_id),
+        _afetch_video_info(video_id),
+    )
+
+    return {
+        "video_id": video_id,
+        "video_title": video_title,
+        "channel_title": channel_title,
+        "transcript": transcript_text,
+    }
+
+
 def fetch_comments_node(state: PipelineState) -> dict:
-    """YouTube 댓글 수집 노드."""
+    """YouTube 댓글 수집 노드.
+
+    API 응답 아이템은 도착하는 즉시 CommentRaw로 변환되고,
+    comment_spill_threshold를 넘으면 임시 파일로 스풀된다. 스풀은 수집 중 메모리만
+    제한한다 (prescreen이 전부 CommentTable로 읽어 들임, backend.graph.spool 참고).
+    """
     video_id = state["video_id"]
 
     if not settings.youtube_api_key:
         raise ValueError("YOUTUBE_API_KEY가 설정되지 않았습니다.")
 
-    youtube = build_youtube_client(settings.youtube_api_key)
-    raw_comments = _yt_fetch(youtube, video_id, max_comments=100)
-
-    comments: list[CommentRaw] = [
-        {
-            "comment_id": c["commentId"],
-            "author": c["author"],
-            "text": c["text"],
-            "published_at": c["publishedAt"],
-            "like_count": c["likeCount"],
-        }
-        for c in raw_comments
-    ]
+    youtube = _youtube_client()
+    options = _fetch_options(state)
+    spool = CommentSpool(settings.comment_spill_threshold, settings.comment_spool_dir)
+    try:
+        for c in _yt_iter_comments(youtube, video_id, **options):
+            spool.append(_to_comment_raw(c))
+    except BaseException:
+        spool.discard()
+        raise
+
+    return _fetched(spool, options)
+
+
+async def afetch_comments_node(state: PipelineState) -> dict:
+    """fetch_comments_node의 비동기 버전 (httpx)."""
+    video_id = state["video_id"]
+
+    if not settings.youtube_api_key:
+        raise ValueError("YOUTUBE_API_KEY가 설정되지 않았습니다.")
+
+    options = _fetch_options(state)
+    spool = CommentSpool(settings.comment_spill_threshold, settings.comment_spool_dir)
+    try:
+        async for c in _aiter_comments(video_id, **options):
+            spool.append(_to_comment_raw(c))
+    except BaseException:
+        spool.discard()
+        raise
 
-    return {"comments": comments}
+    return _fetched(spool, options)
@@ -1,55 +1,121 @@
 """Rule 기반 pre-screen 노드.
 
 scripts/korean_profanity.py의 analyze_comment()를 활용하여
-댓글을 safe / suspect로 분류한다.
+댓글을 safe / suspect로 분류한다. Rule 엔진 모듈은 첫 사용 때 import한다.
+
+판정 저장소(backend.storage.verdict_store)가 켜져 있으면 `VERDICT_CHUNK`개씩 텍스트 해시로
+저장된 Rule 판정을 먼저 찾고, 없는 텍스트만 분석해 저장한다. suspect 중 저장된 LLM 판정이 있는
+댓글은 suspect_idx 앞쪽에 두고 그 판정을 `llm_results`에 미리 채워, analyze는 나머지만 Gemini에 보낸다.
 """
 
 from __future__ import annotations
 
 import sys
-from pathlib import Path
+import time
+from functools import lru_cache
+from itertools import batched
 
 from backend.config import settings
-from backend.graph.state import CommentRaw, PipelineState, PrescreenResult
+from backend.graph.spool import iter_state_comments, remove_spool
+from backend.graph.state import PipelineState
+from backend.graph.table import CommentTable, category_order, index_array
+from backend.metrics import (
+    PRESCREEN_SKIP_RATIO,
+    RULE_ENGINE_COMMENTS,
+    RULE_ENGINE_SECONDS,
+    VERDICT_STORE_HITS,
+)
+from backend.storage.verdict_store import score_comments, verdict_store
+
+PRESCREEN_THRESHOLD = settings.prescreen_threshold
+# 판정 저장소 조회/기록 단위 (댓글 수)
+VERDICT_CHUNK = 1000
 
-# scripts/ import
-_scripts_dir = str(settings.project_root / "scripts")
-if _scripts_dir not in sys.path:
-    sys.path.insert(0, _scripts_dir)
 
-from korean_profanity import analyze_comment  # noqa: E402
+@lru_cache(maxsize=1)
+def rule_engine():
+    """scripts/korean_profanity 모듈 (첫 호출 시 import)."""
+    scripts_dir = str(settings.project_root / "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+
+    import korean_profanity
+
+    return korean_profanity
+
+
+def analyze_comment(text: str):
+    """korean_profanity.analyze_comment."""
+    return rule_engine().analyze_comment(text)
 
-PRESCREEN_THRESHOLD = settings.prescreen_threshold
+
+def _stored_llm_results(table: CommentTable, suspect_idx, suspect_hashes: list[str]):
+    """저장된 LLM 판정이 있는 suspect를 앞으로 → (새 suspect_idx, 미리 채운 llm_results)."""
+    known = verdict_store.llm_verdicts(suspect_hashes, settings.gemini_model)
+    if not known:
+        return suspect_idx, []
+
+    hits = [(i, known[h]) for i, h in zip(suspect_idx, suspect_hashes) if h in known]
+    misses = [i for i, h in zip(suspect_idx, suspect_hashes) if h not in known]
+    VERDICT_STORE_HITS.inc(len(hits), kind="llm")
+    llm_results = [{"row": i, "comment_id": table.comment_id[i], **verdict} for i, verdict in hits]
+    return index_array([i for i, _ in hits] + misses), llm_results
 
 
 def prescreen_node(state: PipelineState) -> dict:
-    """Rule pre-screen: 댓글을 safe / suspect로 분류."""
-    comments = state.get("comments", [])
-
-    prescreen_results: list[PrescreenResult] = []
-    safe_comments: list[CommentRaw] = []
-    suspect_comments: list[CommentRaw] = []
-
-    for comment in comments:
-        result = analyze_comment(comment["text"])
-
-        pr: PrescreenResult = {
-            "comment_id": comment["comment_id"],
-            "toxicity_score": result.toxicity_score,
-            "matched_categories": result.matched_categories,
-            "matched_patterns": result.matched_patterns,
-            "matched_rules": result.matched_rules,
-            "is_toxic": result.is_toxic,
-        }
-        prescreen_results.append(pr)
-
-        if result.toxicity_score < PRESCREEN_THRESHOLD and not result.matched_categories:
-            safe_comments.append(comment)
-        else:
-            suspect_comments.append(comment)
+    """Rule pre-screen: 댓글을 컬럼형 테이블로 옮기고 safe / suspect 행 번호로 분류.
+
+    댓글이 스풀 파일로 내려가 있으면 파일에서 스트리밍하고, 다 읽은 뒤 삭제한다.
+    입력 `comments` 리스트는 테이블로 옮긴 뒤 state에서 비운다.
+    """
+    table = CommentTable()
+    safe_idx = index_array()
+    suspect_idx = index_array()
+    suspect_hashes: list[str] = []
+    rule_seconds = 0.0
+    reused = 0
+    store = verdict_store if settings.verdict_store_enabled else None
+    # 영상 댓글만 comment_id를 기록 (댓글 분석 API의 ID는 요청 안에서만 쓰는 순번)
+    record_ids = bool(state.get("video_id"))
+
+    for chunk in batched(iter_state_comments(state), VERDICT_CHUNK):
+        start = time.perf_counter()
+        hashes, analyses, hits = score_comments(
+            store,
+            [c["text"] for c in chunk],
+            [c["comment_id"] for c in chunk] if record_ids else None,
+        )
+        rule_seconds += time.perf_counter() - start
+        reused += hits
+
+        for comment, h, analysis in zip(chunk, hashes, analyses):
+            score = analysis["toxicityScore"]
+            categories = analysis["matchedCategories"]
+            i = table.append(comment, score, category_order(categories))
+            if score < PRESCREEN_THRESHOLD and not categories:
+                safe_idx.append(i)
+            else:
+                suspect_idx.append(i)
+                suspect_hashes.append(h)
+
+    remove_spool(state)
+
+    if len(table):
+        RULE_ENGINE_COMMENTS.inc(len(table) - reused)
+        RULE_ENGINE_SECONDS.inc(rule_seconds)
+        PRESCREEN_SKIP_RATIO.set(len(safe_idx) / len(table))
+    if reused:
+        VERDICT_STORE_HITS.inc(reused, kind="rule")
+
+    # analyze 배치가 이어 붙일 결과 (재실행 시 이전 값 초기화)
+    llm_results: list[dict] = []
+    if store is not None and suspect_idx:
+        suspect_idx, llm_results = _stored_llm_results(table, suspect_idx, suspect_hashes)
 
     return {
-        "prescreen_results": prescreen_results,
-        "safe_comments": safe_comments,
-        "suspect_comments": suspect_comments,
+        "comments": [],
+        "table": table,
+        "safe_idx": safe_idx,
+        "suspect_idx": suspect_idx,
+        "llm_results": llm_results,
     }
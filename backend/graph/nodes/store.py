@@ -0,0 +1,27 @@
+"""결과 저장 노드: 최종 태깅 결과와 요약을 결과 저장소(SQLite)에 기록한다.
+
+저장된 결과는 GET /results/{result_id}로 페이지 단위 조회할 수 있다.
+"""
+
+from __future__ import annotations
+
+from backend.config import settings
+from backend.graph.state import PipelineState
+from backend.graph.table import CommentTable
+from backend.storage.result_store import result_store
+
+
+def save_result_node(state: PipelineState) -> dict:
+    """tagged 테이블 + summary 저장 → result_id."""
+    if not settings.result_store_enabled:
+        return {}
+
+    result_id = result_store.save(
+        state["video_id"],
+        video_title=state.get("video_title", ""),
+        channel_title=state.get("channel_title", ""),
+        transcript_length=len(state.get("transcript", "")),
+        tagged=state.get("tagged") or CommentTable(),
+        summary=state.get("summary", {}),
+    )
+    return {"result_id": result_id}
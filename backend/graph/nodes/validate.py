@@ -1,151 +1,97 @@
 """교차검증 + 최종 태깅 노드.
 
-Rule pre-screen 결과와 LLM 분석 결과를 합쳐서 최종 tagged_comments를 생성.
+Rule pre-screen 컬럼과 LLM 분석 결과를 합쳐서 table의 판정 컬럼을 채우고,
+캐시된 판정과 이어 붙인 최종 `tagged` 테이블과 요약을 만든다.
+판정 합산과 요약 집계는 컬럼 단위로 한 번에 계산한다 (`backend.graph.aggregate`).
+댓글 단위 판정(safe_verdict / suspect_verdict, tag_safe / tag_suspect)은 같은 식을 쓰며
+스트리밍 응답에서 재사용한다.
 """
 
 from __future__ import annotations
 
-from backend.graph.state import PipelineState, PrescreenResult, TaggedComment
+from backend.graph.aggregate import apply_verdicts, build_summary, fuse_score
+from backend.graph.state import PipelineState, TaggedComment
+from backend.graph.table import CommentTable, category_order, merge_orders
 
+# (score, category order, analysis_source, explanation, suggestion)
+Verdict = tuple[int, int, str, str, str | None]
 
-def _get_level(score: int) -> str:
-    """점수 → 독성 수준."""
-    if score >= 80:
-        return "critical"
-    if score >= 60:
-        return "severe"
-    if score >= 40:
-        return "moderate"
-    if score >= 20:
-        return "mild"
-    return "safe"
+
+def safe_verdict(table: CommentTable, i: int) -> Verdict:
+    """Safe 댓글: Rule 결과만 사용."""
+    return table.rule_score[i], table.rule_order[i], "rule_only", "", None
+
+
+def suspect_verdict(table: CommentTable, i: int, lr: dict | None) -> Verdict:
+    """Suspect 댓글: LLM + Rule 가중 합산 (LLM 실패 시 Rule 결과)."""
+    rule_score = table.rule_score[i]
+    rule_order = table.rule_order[i]
+
+    if lr and lr["toxicity_score"] is not None:
+        ai_score = lr["toxicity_score"]
+
+        # 가중 합산: AI×0.7 + Rule×0.3, AI 하한선 보장
+        final_score = fuse_score(ai_score, rule_score)
+
+        # 카테고리: union (AI 카테고리 먼저)
+        merged_order = merge_orders(category_order(lr.get("categories", [])), rule_order)
+
+        return (
+            final_score,
+            merged_order,
+            "llm+rule",
+            lr.get("explanation", ""),
+            lr.get("suggestion"),
+        )
+
+    # LLM 실패: Rule 결과만 사용
+    return rule_score, rule_order, "rule_only", lr.get("explanation", "") if lr else "", None
+
+
+def tag_safe(table: CommentTable, i: int) -> TaggedComment:
+    """Safe 댓글 i행 → TaggedComment (스트리밍용)."""
+    return table.tagged(i, *safe_verdict(table, i))
+
+
+def tag_suspect(table: CommentTable, i: int, lr: dict | None) -> TaggedComment:
+    """Suspect 댓글 i행 + LLM 결과 → TaggedComment (스트리밍용)."""
+    return table.tagged(i, *suspect_verdict(table, i, lr))
 
 
 def validate_node(state: PipelineState) -> dict:
     """Rule ↔ LLM 교차검증 + 최종 태깅."""
-    safe_comments = state.get("safe_comments", [])
-    suspect_comments = state.get("suspect_comments", [])
-    prescreen_results = state.get("prescreen_results", [])
+    table = state.get("table") or CommentTable()
+    safe_idx = state.get("safe_idx", [])
+    suspect_idx = state.get("suspect_idx", [])
+    # llm_results는 suspect_idx와 같은 순서
     llm_results = state.get("llm_results", [])
 
-    # prescreen 결과를 comment_id로 인덱싱
-    prescreen_map: dict[str, PrescreenResult] = {
-        pr["comment_id"]: pr for pr in prescreen_results
-    }
-    # LLM 결과를 comment_id로 인덱싱
-    llm_map: dict[str, dict] = {
-        lr["comment_id"]: lr for lr in llm_results
-    }
-
-    tagged: list[TaggedComment] = []
-
-    # 1. Safe 댓글: Rule 결과만 사용
-    for comment in safe_comments:
-        cid = comment["comment_id"]
-        pr = prescreen_map.get(cid)
-        score = pr["toxicity_score"] if pr else 0
-
-        tagged.append({
-            "comment_id": cid,
-            "author": comment["author"],
-            "text": comment["text"],
-            "published_at": comment["published_at"],
-            "like_count": comment["like_count"],
-            "toxicity_score": score,
-            "toxicity_level": _get_level(score),
-            "categories": pr["matched_categories"] if pr and pr["matched_categories"] else ["CLEAN"],
-            "explanation": "",
-            "suggestion": None,
-            "analysis_source": "rule_only",
-        })
-
-    # 2. Suspect 댓글: LLM + Rule 가중 합산
-    for comment in suspect_comments:
-        cid = comment["comment_id"]
-        pr = prescreen_map.get(cid)
-        lr = llm_map.get(cid)
-
-        rule_score = pr["toxicity_score"] if pr else 0
-        rule_categories = pr["matched_categories"] if pr else []
-
-        if lr and lr["toxicity_score"] is not None:
-            ai_score = lr["toxicity_score"]
-
-            # 가중 합산: AI×0.7 + Rule×0.3, AI 하한선 보장
-            merged_score = round(ai_score * 0.7 + rule_score * 0.3)
-            final_score = max(merged_score, ai_score - 10)
-            final_score = min(final_score, 100)
-
-            # 카테고리: union
-            ai_categories = lr.get("categories", [])
-            merged_categories = list(dict.fromkeys(ai_categories + rule_categories))
-
-            tagged.append({
-                "comment_id": cid,
-                "author": comment["author"],
-                "text": comment["text"],
-                "published_at": comment["published_at"],
-                "like_count": comment["like_count"],
-                "toxicity_score": final_score,
-                "toxicity_level": _get_level(final_score),
-                "categories": merged_categories if merged_categories else ["CLEAN"],
-                "explanation": lr.get("explanation", ""),
-                "suggestion": lr.get("suggestion"),
-                "analysis_source": "llm+rule",
-            })
-        else:
-            # LLM 실패: Rule 결과만 사용
-            tagged.append({
-                "comment_id": cid,
-                "author": comment["author"],
-                "text": comment["text"],
-                "published_at": comment["published_at"],
-                "like_count": comment["like_count"],
-                "toxicity_score": rule_score,
-                "toxicity_level": _get_level(rule_score),
-                "categories": rule_categories if rule_categories else ["CLEAN"],
-                "explanation": lr.get("explanation", "") if lr else "",
-                "suggestion": None,
-                "analysis_source": "rule_only",
-            })
-
-    # 3. Summary 집계
-    total = len(tagged)
-    toxic_count = sum(1 for t in tagged if t["toxicity_score"] >= 30)
-    avg_score = round(sum(t["toxicity_score"] for t in tagged) / total, 1) if total else 0
-
-    category_dist: dict[str, int] = {}
-    level_dist: dict[str, int] = {"safe": 0, "mild": 0, "moderate": 0, "severe": 0, "critical": 0}
-    for t in tagged:
-        # 심각도·유형 분포는 악성 댓글(score >= 30)만 집계
-        if t["toxicity_score"] >= 30:
-            level_dist[t["toxicity_level"]] = level_dist.get(t["toxicity_level"], 0) + 1
-            for cat in t["categories"]:
-                if cat != "CLEAN":
-                    category_dist[cat] = category_dist.get(cat, 0) + 1
-
-    skipped = len(safe_comments)
-    analyzed = len(suspect_comments)
-
-    clean_count = total - toxic_count
-
-    summary = {
-        "total_comments": total,
-        "clean_comments": clean_count,
-        "clean_percentage": round(clean_count / total * 100, 1) if total else 0,
-        "toxic_comments": toxic_count,
-        "toxic_percentage": round(toxic_count / total * 100, 1) if total else 0,
-        "average_toxicity_score": avg_score,
-        "category_distribution": category_dist,
-        "level_distribution": level_dist,
-        "pipeline_stats": {
-            "rule_skipped": skipped,
-            "llm_analyzed": analyzed,
-            "skip_ratio": round(skipped / total * 100, 1) if total else 0,
-        },
-    }
+    # 1-2. Safe 댓글: Rule 결과만 사용 / Suspect 댓글: LLM + Rule 가중 합산
+    apply_verdicts(table, safe_idx, suspect_idx, llm_results)
+
+    # 응답 순서: safe → suspect (둘 중 하나가 비어 있으면 이미 그 순서)
+    new = table.take(safe_idx + suspect_idx) if safe_idx and suspect_idx else table
+
+    # 3. 캐시된 이전 판정과 병합 (같은 comment_id는 이번 결과 우선)
+    cached = state.get("cached")
+    cached_count = 0
+    tagged = new
+    if cached is not None and len(cached):
+        new_ids = set(new.comment_id)
+        keep = [i for i, cid in enumerate(cached.comment_id) if cid not in new_ids]
+        tagged = cached.take(keep)
+        tagged.extend(new)
+        cached_count = len(keep)
+
+    # 4. Summary 집계
+    summary = build_summary(
+        tagged,
+        skipped=len(safe_idx),
+        analyzed=len(suspect_idx),
+        cached=cached_count,
+    )
 
     return {
-        "tagged_comments": tagged,
+        "tagged": tagged,
         "summary": summary,
     }
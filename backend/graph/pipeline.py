@@ -1,53 +1,97 @@
 """LangGraph 파이프라인 조립.
 
-START → fetch_transcript → fetch_comments → prescreen → (conditional) → analyze → validate → END
+START → load_cache → (conditional) → fetch_transcript → fetch_comments → prescreen
+      → (conditional) → analyze ⟲ (배치마다) → validate → save_cache → save_result → END
+
+모든 노드는 `node()`로 감싸 sync/async 구현을 함께 등록한다.
+API 서버는 `ainvoke`로 실행하므로 이벤트 루프가 블로킹되지 않는다.
+analyze는 suspect 배치 하나를 처리하고 남은 배치가 있으면 자기 자신으로 돌아간다.
+체크포인터를 넘기면 노드/배치마다 state가 저장된다 (backend.graph.checkpoint).
 """
 
 from __future__ import annotations
 
+from typing import Any
+
 from langgraph.graph import END, START, StateGraph
 
+from backend.config import settings
+
+from backend.graph.aio import node
 from backend.graph.state import PipelineState
-from backend.graph.nodes.fetch import fetch_comments_node, fetch_transcript_node
+from backend.graph.nodes.cache import load_cache_node, save_cache_node
+from backend.graph.nodes.fetch import (
+    afetch_comments_node,
+    afetch_transcript_node,
+    fetch_comments_node,
+    fetch_transcript_node,
+)
 from backend.graph.nodes.prescreen import prescreen_node
-from backend.graph.nodes.analyze import analyze_node
+from backend.graph.nodes.analyze import aanalyze_node, analyze_node
+from backend.graph.nodes.store import save_result_node
 from backend.graph.nodes.validate import validate_node
 
 
-def _should_run_llm(state: PipelineState) -> str:
-    """LLM 분석이 필요한지 판단 (conditional edge)."""
-    suspect = state.get("suspect_comments", [])
-    if suspect:
+def _needs_llm(state: PipelineState) -> str:
+    """suspect 중 아직 LLM 결과가 없는 댓글이 남았는지 (prescreen / analyze 뒤 conditional edge).
+
+    판정 저장소에서 다 채웠거나 마지막 배치까지 끝났으면 validate로 간다.
+    """
+    if len(state.get("llm_results", [])) < len(state.get("suspect_idx", [])):
         return "analyze"
     return "validate"
 
 
-def build_pipeline() -> StateGraph:
-    """전체 분석 파이프라인 빌드."""
+def _should_fetch_transcript(state: PipelineState) -> str:
+    """캐시 히트면 자막/영상 정보 수집을 건너뛴다 (conditional edge)."""
+    if state.get("cached") is not None:
+        return "fetch_comments"
+    return "fetch_transcript"
+
+
+def _recursion_limit() -> int:
+    # 노드 7개 + analyze 배치 수 (+ 여유)
+    return settings.analyze_max_batches + 15
+
+
+def build_pipeline(checkpointer: Any | None = None) -> StateGraph:
+    """전체 분석 파이프라인 빌드. checkpointer가 있으면 실행마다 run_config(run_id)가 필요하다."""
     graph = StateGraph(PipelineState)
 
     # 노드 등록
-    graph.add_node("fetch_transcript", fetch_transcript_node)
-    graph.add_node("fetch_comments", fetch_comments_node)
-    graph.add_node("prescreen", prescreen_node)
-    graph.add_node("analyze", analyze_node)
-    graph.add_node("validate", validate_node)
-
-    # 엣지: START → transcript → comments → prescreen
-    graph.add_edge(START, "fetch_transcript")
+    graph.add_node("load_cache", node(load_cache_node))
+    # fetch 노드: invoke → googleapiclient, ainvoke → httpx 비동기 경로
+    graph.add_node("fetch_transcript", node(fetch_transcript_node, afetch_transcript_node))
+    graph.add_node("fetch_comments", node(fetch_comments_node, afetch_comments_node))
+    graph.add_node("prescreen", node(prescreen_node))
+    graph.add_node("analyze", node(analyze_node, aanalyze_node))
+    graph.add_node("validate", node(validate_node))
+    graph.add_node("save_cache", node(save_cache_node))
+    graph.add_node("save_result", node(save_result_node))
+
+    # 엣지: START → 캐시 조회 → (히트면 자막 스킵) → comments → prescreen
+    graph.add_edge(START, "load_cache")
+    graph.add_conditional_edges("load_cache", _should_fetch_transcript, {
+        "fetch_transcript": "fetch_transcript",
+        "fetch_comments": "fetch_comments",
+    })
     graph.add_edge("fetch_transcript", "fetch_comments")
     graph.add_edge("fetch_comments", "prescreen")
 
-    # 조건부 엣지: suspect 있으면 LLM, 없으면 바로 validate
-    graph.add_conditional_edges("prescreen", _should_run_llm, {
+    # 조건부 엣지: LLM 결과가 빈 suspect가 남아 있으면 analyze (배치마다 반복), 아니면 validate
+    graph.add_conditional_edges("prescreen", _needs_llm, {
         "analyze": "analyze",
         "validate": "validate",
     })
+    graph.add_conditional_edges("analyze", _needs_llm, {
+        "analyze": "analyze",
+        "validate": "validate",
+    })
+    graph.add_edge("validate", "save_cache")
+    graph.add_edge("save_cache", "save_result")
+    graph.add_edge("save_result", END)
 
-    graph.add_edge("analyze", "validate")
-    graph.add_edge("validate", END)
-
-    return graph.compile()
+    return graph.compile(checkpointer=checkpointer).with_config(recursion_limit=_recursion_limit())
 
 
 def build_single_comment_pipeline() -> StateGraph:
@@ -58,16 +102,19 @@ def build_single_comment_pipeline() -> StateGraph:
     """
     graph = StateGraph(PipelineState)
 
-    graph.add_node("prescreen", prescreen_node)
-    graph.add_node("analyze", analyze_node)
-    graph.add_node("validate", validate_node)
+    graph.add_node("prescreen", node(prescreen_node))
+    graph.add_node("analyze", node(analyze_node, aanalyze_node))
+    graph.add_node("validate", node(validate_node))
 
     graph.add_edge(START, "prescreen")
-    graph.add_conditional_edges("prescreen", _should_run_llm, {
+    graph.add_conditional_edges("prescreen", _needs_llm, {
+        "analyze": "analyze",
+        "validate": "validate",
+    })
+    graph.add_conditional_edges("analyze", _needs_llm, {
         "analyze": "analyze",
         "validate": "validate",
     })
-    graph.add_edge("analyze", "validate")
     graph.add_edge("validate", END)
 
-    return graph.compile()
+    return graph.compile().with_config(recursion_limit=_recursion_limit())
@@ -0,0 +1,115 @@
+"""대용량 댓글 수집용 스풀.
+
+수집한 CommentRaw를 threshold까지는 메모리에 두고, 넘어서면 전부
+`COMMENT_SPOOL_DIR`의 임시 JSONL 파일로 내린다. 파이프라인 state에는 리스트 대신
+파일 경로만 남긴다.
+
+스풀이 줄이는 것은 수집(fetch) 동안과 fetch → prescreen 사이 state(체크포인트 포함)의
+메모리뿐이다. prescreen이 파일을 읽어 전부 CommentTable로 올리므로 그 뒤로는
+댓글 전체가 메모리에 있다.
+
+파일은 prescreen이 다 읽은 뒤 지운다. 그 전에 실패/중단된 실행의 파일은
+체크포인트 정리(`checkpoint.sweep_checkpoints`)와 `sweep_spools`가 지운다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+from backend.graph.state import CommentRaw, PipelineState
+
+
+SPOOL_PREFIX = "comments-"
+SPOOL_SUFFIX = ".jsonl"
+
+
+class CommentSpool:
+    """CommentRaw 레코드를 순서대로 모으는 버퍼."""
+
+    def __init__(self, threshold: int, directory: Path):
+        self.threshold = threshold
+        self.directory = directory
+        self._buffer: list[CommentRaw] = []
+        self._file: IO[str] | None = None
+        self._path: str | None = None
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, comment: CommentRaw) -> None:
+        if self._file is None and len(self._buffer) >= self.threshold:
+            self._spill()
+
+        if self._file is not None:
+            self._file.write(json.dumps(comment, ensure_ascii=False) + "\n")
+        else:
+            self._buffer.append(comment)
+        self._count += 1
+
+    def _spill(self) -> None:
+        """버퍼를 임시 파일로 옮기고 이후 레코드는 파일에 append."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, self._path = tempfile.mkstemp(
+            prefix=SPOOL_PREFIX, suffix=SPOOL_SUFFIX, dir=self.directory
+        )
+        self._file = os.fdopen(fd, "w", encoding="utf-8")
+        for comment in self._buffer:
+            self._file.write(json.dumps(comment, ensure_ascii=False) + "\n")
+        self._buffer = []
+
+    def to_state(self) -> dict:
+        """fetch_comments 노드의 state 업데이트로 변환."""
+        if self._file is None:
+            return {"comments": self._buffer, "comment_count": self._count}
+        self._file.close()
+        return {"comments": [], "comments_path": self._path, "comment_count": self._count}
+
+    def discard(self) -> None:
+        """수집 중 오류 시 임시 파일 정리."""
+        if self._file is not None:
+            self._file.close()
+            os.unlink(self._path)
+            self._file = None
+
+
+def iter_state_comments(state: PipelineState) -> Iterator[CommentRaw]:
+    """state의 댓글을 순회. 스풀 파일이 있으면 파일에서 스트리밍."""
+    path = state.get("comments_path")
+    if not path:
+        yield from state.get("comments", [])
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def remove_spool(state: PipelineState) -> None:
+    """스풀 파일 삭제 (소비 완료 후)."""
+    path = state.get("comments_path")
+    if path and os.path.exists(path):
+        os.unlink(path)
+
+
+def sweep_spools(directory: Path, max_age_seconds: float, keep: Iterable[str] = ()) -> int:
+    """directory에서 max_age_seconds보다 오래된 스풀 파일 삭제 (keep 경로 제외). 지운 파일 수.
+
+    수집 중 프로세스가 죽었거나 체크포인트 없이 실패한 실행이 남긴 파일을 정리한다.
+    """
+    if not directory.is_dir():
+        return 0
+    cutoff = time.time() - max_age_seconds
+    keep = {os.path.abspath(path) for path in keep}
+    removed = 0
+    for path in directory.glob(f"{SPOOL_PREFIX}*{SPOOL_SUFFIX}"):
+        if str(path.absolute()) in keep or path.stat().st_mtime >= cutoff:
+            continue
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
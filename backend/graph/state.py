@@ -1,8 +1,15 @@
-"""LangGraph 파이프라인 상태 정의."""
+"""LangGraph 파이프라인 상태 정의.
+
+댓글 데이터는 prescreen부터 컬럼형 `CommentTable`(backend.graph.table) 하나로 다루고,
+분류는 행 번호 배열로 주고받는다. TaggedComment dict는 API 경계에서만 만든다.
+"""
 
 from __future__ import annotations
 
-from typing import TypedDict
+from array import array
+from typing import NotRequired, TypedDict
+
+from backend.graph.table import CommentTable
 
 
 class CommentRaw(TypedDict):
@@ -13,27 +20,18 @@ class CommentRaw(TypedDict):
     text: str
     published_at: str
     like_count: int
-
-
-class PrescreenResult(TypedDict):
-    """Rule pre-screen 결과."""
-
-    comment_id: str
-    toxicity_score: int
-    matched_categories: list[str]
-    matched_patterns: list[str]
-    matched_rules: list[str]
-    is_toxic: bool
+    parent_id: NotRequired[str]  # 답글이면 상위 댓글 ID
 
 
 class TaggedComment(TypedDict):
-    """최종 태깅된 댓글."""
+    """최종 태깅된 댓글 (API 응답 레코드)."""
 
     comment_id: str
     author: str
     text: str
     published_at: str
     like_count: int
+    parent_id: str | None
     # 태깅 결과
     toxicity_score: int
     toxicity_level: str  # safe | mild | moderate | severe | critical
@@ -50,21 +48,36 @@ class PipelineState(TypedDict, total=False):
     # 입력
     video_url: str
     video_id: str
+    run_id: str  # 실행 ID (체크포인트 thread_id, backend.graph.checkpoint)
+
+    # 수집 옵션 (요청별)
+    max_comments: int
+    include_replies: bool
+    max_replies_per_thread: int
+    refresh: bool  # True면 영상 캐시 무시
+
+    # 영상 캐시 (재분석)
+    watermark: str  # 캐시된 최상위 댓글의 최신 published_at
+    cached: CommentTable  # 캐시된 판정 (판정 컬럼 채워짐)
 
     # 수집 데이터
     video_title: str
     channel_title: str
     transcript: str
-    comments: list[CommentRaw]
+    comments: list[CommentRaw]  # prescreen이 table로 옮긴 뒤 비운다
+    comments_path: str  # 댓글이 많으면 스풀 JSONL 경로 (comments는 비어 있음)
+    comment_count: int
+    fetch_complete: bool  # 수집 한도에 닿기 전에 끝남 (영상 전체를 수집)
 
     # Pre-screen
-    prescreen_results: list[PrescreenResult]
-    safe_comments: list[CommentRaw]
-    suspect_comments: list[CommentRaw]
+    table: CommentTable  # 이번 실행의 댓글 + Rule 컬럼 (validate가 판정 컬럼을 채움)
+    safe_idx: array  # table 행 번호 (array("I"))
+    suspect_idx: array
 
-    # LLM 분석
+    # LLM 분석 (suspect_idx와 같은 순서, 각 dict의 "row"는 table 행 번호)
     llm_results: list[dict]
 
     # 최종
-    tagged_comments: list[TaggedComment]
+    tagged: CommentTable  # 캐시 + 이번 실행 판정 (응답 순서)
     summary: dict
+    result_id: str  # 결과 저장소 ID (저장소 비활성 시 없음)
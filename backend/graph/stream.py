@@ -0,0 +1,163 @@
+"""파이프라인 진행 상황 스트리밍.
+
+`pipeline.astream`의 updates/custom/values 스트림을 API 이벤트로 변환한다.
+
+- node:    노드 하나가 끝날 때마다 (노드 이름 + 누적 카운트)
+- verdict: 댓글 하나의 태깅이 확정될 때마다 (캐시 → Rule-only safe → 저장된 LLM 판정 → LLM 순)
+- result:  마지막 이벤트. `/analyze` 응답과 같은 모양의 최종 결과
+
+verdict 이벤트는 validate 노드와 같은 tag_safe / tag_suspect로 만들기 때문에
+최종 결과의 tagged_comments와 내용이 같다 (순서만 완료 순).
+state의 컬럼형 테이블은 여기서(API 경계) 처음 dict로 만들어진다.
+
+`state["run_id"]`의 체크포인트가 남아 있으면 이어서 실행한다. 이때 체크포인트에 이미 있는
+결과(캐시, Rule-only safe, 끝난 LLM 배치)를 먼저 같은 이벤트로 다시 보내므로
+구독자는 처음부터 실행한 것과 같은 verdict 집합을 받는다.
+"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from typing import Any, AsyncIterator
+
+from backend.graph.checkpoint import (
+    RunInterruptedError,
+    check_resume,
+    discard_run,
+    run_config,
+    run_lock,
+)
+from backend.graph.nodes.validate import tag_safe, tag_suspect
+from backend.graph.state import PipelineState
+from backend.graph.table import CommentTable
+
+STREAM_MODES = ["updates", "custom", "values"]
+
+
+def new_progress() -> dict[str, int]:
+    """누적 카운트 초기값."""
+    return {
+        "fetched": 0,
+        "cached": 0,
+        "prescreened": 0,
+        "safe": 0,
+        "suspect": 0,
+        "llm_tagged": 0,
+    }
+
+
+def result_payload(state: PipelineState, include_comments: bool = True) -> dict:
+    """최종 state → AnalyzeVideoResponse 모양의 dict (tagged 테이블을 dict로 materialize).
+
+    include_comments=False면 tagged_comments 없이 메타데이터와 요약만.
+    """
+    table = state.get("tagged")
+    total = len(table) if table is not None else 0
+    payload = {
+        "result_id": state.get("result_id"),
+        "run_id": state.get("run_id"),
+        "video_id": state.get("video_id", ""),
+        "video_title": state.get("video_title", ""),
+        "channel_title": state.get("channel_title", ""),
+        "transcript_length": len(state.get("transcript", "")),
+        "total_comments": total,
+    }
+    if include_comments:
+        payload["tagged_comments"] = table.rows() if total else []
+    payload["summary"] = state.get("summary", {})
+    return payload
+
+
+async def astream_analysis(
+    pipeline: Any,
+    state: PipelineState,
+    include_comments: bool = True,
+) -> AsyncIterator[dict]:
+    """파이프라인을 실행하며 node / verdict / result 이벤트를 순서대로 yield.
+
+    include_comments=False면 result 이벤트에 tagged_comments를 넣지 않는다 (verdict로 이미 보낸 경우).
+    실패는 `checkpoint.ainvoke_resumable`과 같이 ValueError는 그대로, 나머지는 RunInterruptedError로 던진다.
+    run_id 체크포인트의 입력이 요청과 다르면 실행 전에 RunConflictError를 던진다.
+    """
+    progress = new_progress()
+    table = CommentTable()
+    final: dict = {}
+
+    def verdict(comment: dict) -> dict:
+        return {"type": "verdict", "comment": comment, "progress": dict(progress)}
+
+    def on_update(name: str, update: dict):
+        nonlocal table
+
+        if name == "load_cache":
+            cached = update.get("cached")
+            if cached is not None:
+                progress["cached"] = len(cached)
+                for i in range(len(cached)):
+                    yield verdict(cached.row(i))
+
+        elif name == "fetch_comments":
+            progress["fetched"] = update.get("comment_count", len(update.get("comments", [])))
+
+        elif name == "prescreen":
+            table = update["table"]
+            progress["prescreened"] = len(table)
+            progress["suspect"] = len(update["suspect_idx"])
+            progress["safe"] = len(update["safe_idx"])
+            for i in update["safe_idx"]:
+                yield verdict(tag_safe(table, i))
+            # 판정 저장소에서 미리 채운 LLM 판정 (재개 시에는 끝난 배치 결과까지 포함)
+            for lr in update.get("llm_results", []):
+                yield on_llm_result(lr)
+
+        yield {"type": "node", "node": name, "progress": dict(progress)}
+
+    def on_llm_result(lr: dict) -> dict:
+        progress["llm_tagged"] += 1
+        return verdict(tag_suspect(table, lr["row"], lr))
+
+    run_id = state.get("run_id")
+    async with run_lock(run_id) if run_id else nullcontext():
+        resume = await check_resume(pipeline, state) if run_id else None
+        if resume is not None:
+            # 체크포인트까지의 결과를 노드 순서대로 다시 보낸다
+            values = resume.values
+            if "cached" in values:
+                for event in on_update("load_cache", values):
+                    yield event
+            if "comment_count" in values:
+                for event in on_update("fetch_comments", values):
+                    yield event
+            if "table" in values:
+                for event in on_update("prescreen", values):
+                    yield event
+
+        config = run_config(run_id) if run_id else None
+        try:
+            async for mode, chunk in pipeline.astream(
+                None if resume is not None else state, config, stream_mode=STREAM_MODES
+            ):
+                if mode == "values":
+                    final = chunk
+                    continue
+
+                if mode == "custom":
+                    if chunk.get("type") == "llm_result":
+                        yield on_llm_result(chunk["result"])
+                    continue
+
+                for name, update in chunk.items():
+                    for event in on_update(name, update or {}):
+                        yield event
+        except ValueError:
+            if run_id:
+                await discard_run(pipeline, run_id)
+            raise
+        except Exception as e:
+            if not run_id:
+                raise
+            raise RunInterruptedError(run_id, e) from e
+
+        if run_id:
+            await discard_run(pipeline, run_id)
+    yield {"type": "result", "result": result_payload(final, include_comments)}
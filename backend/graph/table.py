@@ -0,0 +1,280 @@
+"""컬럼형 댓글 테이블.
+
+파이프라인 state는 댓글 dict 목록을 단계마다 복사해 들고 다니지 않는다.
+댓글 원본은 `CommentTable`의 컬럼(list / array)에 한 번만 저장하고,
+safe / suspect 분류는 행 번호 배열(`array("I")`)로, Rule 결과와 최종 판정은
+같은 행 번호의 score / level / 카테고리 비트마스크 / source 컬럼으로 둔다.
+
+dict(TaggedComment)는 API 응답·스트리밍 이벤트처럼 밖으로 내보낼 때만 `row()` / `rows()`로 만든다.
+카테고리는 집계·필터용 비트마스크와, 출력 순서(AI 카테고리 먼저, 그 뒤 Rule 카테고리)를 담은
+순서 코드(4비트 슬롯마다 `CATEGORIES` 인덱스 + 1)를 함께 둔다.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Sequence, get_args
+
+from backend.llm.schemas import TOXIC_CATEGORIES, TOXICITY_LEVELS
+
+if TYPE_CHECKING:
+    from backend.graph.state import CommentRaw, TaggedComment
+
+CATEGORIES: tuple[str, ...] = get_args(TOXIC_CATEGORIES)
+LEVELS: tuple[str, ...] = get_args(TOXICITY_LEVELS)
+SOURCES: tuple[str, ...] = ("rule_only", "llm", "llm+rule")
+
+CLEAN = "CLEAN"
+_CATEGORY_BITS = {c: 1 << i for i, c in enumerate(CATEGORIES)}
+_CATEGORY_CODES = {c: i + 1 for i, c in enumerate(CATEGORIES)}
+_SLOT_BITS = 4
+_LEVEL_CODES = {level: i for i, level in enumerate(LEVELS)}
+_SOURCE_CODES = {source: i for i, source in enumerate(SOURCES)}
+
+
+def category_mask(categories: Iterable[str]) -> int:
+    """카테고리 목록 → 비트마스크. CLEAN(및 알 수 없는 값)은 비트가 없다."""
+    mask = 0
+    for category in categories:
+        mask |= _CATEGORY_BITS.get(category, 0)
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def _mask_categories(mask: int) -> tuple[str, ...]:
+    return tuple(c for c in CATEGORIES if mask & _CATEGORY_BITS[c]) or (CLEAN,)
+
+
+def mask_categories(mask: int) -> list[str]:
+    """비트마스크 → 카테고리 목록 (정규 순서). 비어 있으면 ["CLEAN"]."""
+    return list(_mask_categories(mask))
+
+
+def category_order(categories: Iterable[str]) -> int:
+    """카테고리 목록 → 순서 코드. 중복은 처음 것만, CLEAN(및 알 수 없는 값)은 뺀다."""
+    order = 0
+    shift = 0
+    seen = 0
+    for category in categories:
+        bit = _CATEGORY_BITS.get(category, 0)
+        if bit & ~seen:
+            seen |= bit
+            order |= _CATEGORY_CODES[category] << shift
+            shift += _SLOT_BITS
+    return order
+
+
+@lru_cache(maxsize=1024)
+def _order_categories(order: int) -> tuple[str, ...]:
+    categories = []
+    while order:
+        categories.append(CATEGORIES[(order & 0xF) - 1])
+        order >>= _SLOT_BITS
+    return tuple(categories) or (CLEAN,)
+
+
+def order_categories(order: int) -> list[str]:
+    """순서 코드 → 카테고리 목록 (저장한 순서). 비어 있으면 ["CLEAN"]."""
+    return list(_order_categories(order))
+
+
+@lru_cache(maxsize=1024)
+def order_mask(order: int) -> int:
+    """순서 코드 → 비트마스크."""
+    return category_mask(_order_categories(order))
+
+
+@lru_cache(maxsize=4096)
+def merge_orders(first: int, second: int) -> int:
+    """first 뒤에 second 중 first에 없는 카테고리를 이어 붙인 순서 코드 (`unique(first + second)`)."""
+    return category_order(_order_categories(first) + _order_categories(second))
+
+
+def level_for(score: int) -> str:
+    """점수 → 독성 수준."""
+    if score >= 80:
+        return "critical"
+    if score >= 60:
+        return "severe"
+    if score >= 40:
+        return "moderate"
+    if score >= 20:
+        return "mild"
+    return "safe"
+
+
+def index_array(indices: Iterable[int] = ()) -> array:
+    """행 번호 배열."""
+    return array("I", indices)
+
+
+@dataclass
+class CommentTable:
+    """댓글 원본 + Rule 결과 + 최종 판정 컬럼. 모든 컬럼은 길이가 같다.
+
+    Rule 컬럼은 prescreen이, 판정 컬럼은 validate(또는 캐시 로드)가 채운다.
+    """
+
+    # 댓글 원본
+    comment_id: list[str] = field(default_factory=list)
+    author: list[str] = field(default_factory=list)
+    text: list[str] = field(default_factory=list)
+    published_at: list[str] = field(default_factory=list)
+    like_count: array = field(default_factory=lambda: array("q"))
+    parent_id: list[str | None] = field(default_factory=list)
+
+    # Rule pre-screen
+    rule_score: array = field(default_factory=lambda: array("h"))
+    rule_mask: array = field(default_factory=lambda: array("I"))
+    rule_order: array = field(default_factory=lambda: array("Q"))
+
+    # 최종 판정
+    score: array = field(default_factory=lambda: array("h"))
+    level: bytearray = field(default_factory=bytearray)
+    mask: array = field(default_factory=lambda: array("I"))
+    order: array = field(default_factory=lambda: array("Q"))
+    source: bytearray = field(default_factory=bytearray)
+    explanation: list[str] = field(default_factory=list)
+    suggestion: list[str | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.comment_id)
+
+    # ─── 쓰기 ────────────────────────────────────────────
+
+    def append(self, comment: CommentRaw, rule_score: int = 0, rule_order: int = 0) -> int:
+        """댓글 한 행 추가 (판정 컬럼은 safe/0으로 채움) → 행 번호. rule_order는 `category_order()` 값."""
+        self.comment_id.append(comment["comment_id"])
+        self.author.append(comment["author"])
+        self.text.append(comment["text"])
+        self.published_at.append(comment["published_at"])
+        self.like_count.append(comment["like_count"])
+        self.parent_id.append(comment.get("parent_id"))
+        self.rule_score.append(rule_score)
+        self.rule_mask.append(order_mask(rule_order))
+        self.rule_order.append(rule_order)
+        self.score.append(0)
+        self.level.append(0)
+        self.mask.append(0)
+        self.order.append(0)
+        self.source.append(0)
+        self.explanation.append("")
+        self.suggestion.append(None)
+        return len(self.comment_id) - 1
+
+    def set_verdict(
+        self,
+        i: int,
+        score: int,
+        order: int,
+        source: str,
+        explanation: str = "",
+        suggestion: str | None = None,
+    ) -> None:
+        """i행의 최종 판정 기록. level은 score에서, mask는 order에서 계산한다."""
+        self.score[i] = score
+        self.level[i] = _LEVEL_CODES[level_for(score)]
+        self.mask[i] = order_mask(order)
+        self.order[i] = order
+        self.source[i] = _SOURCE_CODES[source]
+        self.explanation[i] = explanation
+        self.suggestion[i] = suggestion
+
+    @classmethod
+    def from_tagged(cls, tagged: Iterable[TaggedComment]) -> CommentTable:
+        """판정이 끝난 댓글(dict) → 테이블 (영상 캐시 로드용)."""
+        table = cls()
+        for t in tagged:
+            i = table.append(t)
+            table.score[i] = t["toxicity_score"]
+            table.level[i] = _LEVEL_CODES[t["toxicity_level"]]
+            table.order[i] = category_order(t["categories"])
+            table.mask[i] = order_mask(table.order[i])
+            table.source[i] = _SOURCE_CODES[t["analysis_source"]]
+            table.explanation[i] = t["explanation"]
+            table.suggestion[i] = t["suggestion"]
+        return table
+
+    def take(self, indices: Sequence[int]) -> CommentTable:
+        """지정한 행만 순서대로 담은 새 테이블 (문자열은 복사하지 않고 공유)."""
+        return CommentTable(**{
+            name: _take(column, indices) for name, column in vars(self).items()
+        })
+
+    def extend(self, other: CommentTable) -> None:
+        """other의 모든 행을 뒤에 붙인다."""
+        for name, column in vars(self).items():
+            column.extend(getattr(other, name))
+
+    # ─── 읽기 (경계에서만 dict로) ─────────────────────────
+
+    def comment(self, i: int) -> CommentRaw:
+        """i행 댓글 원본."""
+        comment: CommentRaw = {
+            "comment_id": self.comment_id[i],
+            "author": self.author[i],
+            "text": self.text[i],
+            "published_at": self.published_at[i],
+            "like_count": self.like_count[i],
+        }
+        if self.parent_id[i]:
+            comment["parent_id"] = self.parent_id[i]
+        return comment
+
+    def tagged(
+        self,
+        i: int,
+        score: int,
+        order: int,
+        source: str,
+        explanation: str,
+        suggestion: str | None,
+    ) -> TaggedComment:
+        """i행 댓글 원본 + 주어진 판정 → TaggedComment."""
+        return {
+            "comment_id": self.comment_id[i],
+            "author": self.author[i],
+            "text": self.text[i],
+            "published_at": self.published_at[i],
+            "like_count": self.like_count[i],
+            "parent_id": self.parent_id[i],
+            "toxicity_score": score,
+            "toxicity_level": level_for(score),
+            "categories": order_categories(order),
+            "explanation": explanation,
+            "suggestion": suggestion,
+            "analysis_source": source,
+        }
+
+    def row(self, i: int) -> TaggedComment:
+        """i행 최종 판정 → TaggedComment."""
+        return {
+            "comment_id": self.comment_id[i],
+            "author": self.author[i],
+            "text": self.text[i],
+            "published_at": self.published_at[i],
+            "like_count": self.like_count[i],
+            "parent_id": self.parent_id[i],
+            "toxicity_score": self.score[i],
+            "toxicity_level": LEVELS[self.level[i]],
+            "categories": order_categories(self.order[i]),
+            "explanation": self.explanation[i],
+            "suggestion": self.suggestion[i],
+            "analysis_source": SOURCES[self.source[i]],
+        }
+
+    def rows(self, indices: Iterable[int] | None = None) -> list[TaggedComment]:
+        """행들(기본: 전체) → TaggedComment 목록."""
+        if indices is None:
+            indices = range(len(self))
+        return [self.row(i) for i in indices]
+
+
+def _take(column, indices: Sequence[int]):
+    if isinstance(column, array):
+        return array(column.typecode, [column[i] for i in indices])
+    if isinstance(column, bytearray):
+        return bytearray(column[i] for i in indices)
+    return [column[i] for i in indices]
@@ -0,0 +1,210 @@
+"""백그라운드 분석 작업 (POST /jobs).
+
+요청은 큐에 들어가고 즉시 job id를 돌려준다. 고정 개수의 워커 태스크가 큐에서
+작업을 꺼내 `astream_analysis`로 파이프라인을 실행하며, 진행 이벤트를
+작업 상태에 반영하고 구독자(SSE)에게 전달한다.
+
+- 큐가 가득 차면 submit이 JobQueueFullError를 던진다 (API에서 503).
+- 끝난 작업은 job_ttl_seconds 후 다음 submit 때 정리된다.
+- 실패(또는 서버 종료로 취소)한 작업은 같은 run_id로 다시 submit하면 체크포인트부터 이어서 실행된다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+from backend.graph.checkpoint import RunConflictError
+from backend.graph.state import PipelineState
+from backend.graph.stream import astream_analysis, new_progress
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobQueueFullError(RuntimeError):
+    """작업 큐가 가득 참."""
+
+
+@dataclass
+class Job:
+    """분석 작업 하나의 상태. 이벤트 루프 안에서만 변경된다."""
+
+    id: str
+    state: PipelineState
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    current_node: str | None = None
+    progress: dict[str, int] = field(default_factory=new_progress)
+    verdicts: list[dict] = field(default_factory=list)
+    result: dict | None = None
+    error: str | None = None
+    _listeners: set[asyncio.Queue] = field(default_factory=set, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+    def status_event(self) -> dict:
+        return {
+            "type": "status",
+            "job_id": self.id,
+            "status": self.status,
+            "current_node": self.current_node,
+            "progress": dict(self.progress),
+            "error": self.error,
+        }
+
+    def snapshot(self, offset: int = 0, limit: int | None = None) -> dict:
+        """GET /jobs/{id} 응답. verdicts는 지금까지 확정된 것 중 [offset:offset+limit]."""
+        end = None if limit is None else offset + limit
+        return {
+            "job_id": self.id,
+            "run_id": self.state.get("run_id"),
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "current_node": self.current_node,
+            "progress": dict(self.progress),
+            "verdict_count": len(self.verdicts),
+            "verdicts": self.verdicts[offset:end],
+            "result": self.result,
+            "error": self.error,
+        }
+
+    def publish(self, event: dict | None) -> None:
+        """구독자에게 이벤트 전달. None은 스트림 종료 신호."""
+        for queue in self._listeners:
+            queue.put_nowait(event)
+
+
+class JobManager:
+    """bounded 큐 + 워커 풀."""
+
+    def __init__(self, pipeline: Any, workers: int, queue_size: int, ttl_seconds: float):
+        self.pipeline = pipeline
+        self.workers = workers
+        self.ttl_seconds = ttl_seconds
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=queue_size)
+        self._jobs: dict[str, Job] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def running(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == RUNNING)
+
+    def submit(self, state: PipelineState) -> Job:
+        self._prune()
+        job = Job(id=uuid.uuid4().hex, state=state)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFullError("분석 작업 큐가 가득 찼습니다. 잠시 후 다시 시도하세요.")
+        self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    async def subscribe(self, job: Job, heartbeat: float) -> AsyncIterator[dict | None]:
+        """현재 상태 → 지금까지의 verdict → 실시간 이벤트 순으로 yield.
+
+        heartbeat초 동안 이벤트가 없으면 None(keep-alive)을 yield한다.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        # 등록과 스냅샷 복사 사이에 await가 없으므로 이벤트가 빠지거나 중복되지 않는다
+        job._listeners.add(queue)
+        backlog = list(job.verdicts)
+        try:
+            yield job.status_event()
+            for comment in backlog:
+                yield {"type": "verdict", "comment": comment}
+            if job.done:
+                return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is None:
+                    return
+                yield event
+        finally:
+            job._listeners.discard(queue)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.ttl_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.done and job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = RUNNING
+        job.started_at = time.time()
+        job.publish(job.status_event())
+
+        try:
+            async for event in astream_analysis(self.pipeline, job.state):
+                if event["type"] == "result":
+                    job.result = event["result"]
+                    continue
+                job.progress = event["progress"]
+                if event["type"] == "node":
+                    job.current_node = event["node"]
+                elif event["type"] == "verdict":
+                    job.verdicts.append(event["comment"])
+                job.publish(event)
+            job.status = SUCCEEDED
+        except asyncio.CancelledError:
+            job.status = FAILED
+            job.error = "서버 종료로 작업이 취소되었습니다."
+            raise
+        except Exception as e:
+            if not isinstance(e, (ValueError, RunConflictError)):
+                logger.exception("작업 실패: %s", job.id)
+            job.status = FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            job.publish(job.status_event())
+            job.publish(None)
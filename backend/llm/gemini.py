@@ -1,18 +1,29 @@
-"""Gemini LLM 클라이언트 설정."""
+"""Gemini LLM 클라이언트 설정.
+
+langchain_google_genai(google.genai 포함)는 import만 1초 가까이 걸리므로
+첫 `get_tagging_llm()` 호출(보통 기동 워밍업) 때 불러온다.
+"""
 
 from __future__ import annotations
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from backend.config import settings
 from backend.llm.schemas import CommentTagging
 
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
 
+@lru_cache(maxsize=1)
 def get_tagging_llm() -> ChatGoogleGenerativeAI:
-    """구조화된 출력용 Gemini LLM 인스턴스."""
+    """구조화된 출력용 Gemini LLM 인스턴스. 프로세스에서 한 번만 생성된다."""
     if not settings.google_api_key:
         raise ValueError("GOOGLE_API_KEY가 설정되지 않았습니다.")
 
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     llm = ChatGoogleGenerativeAI(
         model=settings.gemini_model,
         google_api_key=settings.google_api_key,
@@ -1,75 +1,358 @@
 """FastAPI 서버 — LangGraph 악성 댓글 태깅 파이프라인.
 
+파이프라인은 `ainvoke`로 실행된다. 네트워크/LLM I/O는 async로,
+남은 sync 노드는 스레드로 오프로드되어 이벤트 루프를 막지 않는다.
+오래 걸리는 분석은 POST /jobs로 큐에 넣고 GET /jobs/{id}/events(SSE)로 진행을 받는다.
+동시에 들어온 같은 /analyze 요청은 한 번만 실행해 결과를 공유한다(backend.singleflight).
+POST /analyze?stream=true는 태깅 결과를 확정되는 대로 NDJSON으로 흘려보낸다.
+/analyze와 /jobs 실행은 run_id별로 체크포인트되어, 실패한 실행을 같은 run_id로 다시 요청하면
+마지막으로 끝난 노드/배치부터 이어서 실행한다(backend.graph.checkpoint).
+영상/수집 옵션이 체크포인트와 다른 재개 요청은 409로 거절한다.
+
 실행:
     uv run uvicorn backend.main:app --reload --port 8000
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import uuid
+from contextlib import AsyncExitStack, asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
+from backend.config import settings
+from backend.graph.checkpoint import (
+    RunConflictError,
+    RunInterruptedError,
+    ainvoke_resumable,
+    check_resume,
+    open_checkpointer,
+    sweep_checkpoints,
+)
 from backend.graph.pipeline import build_pipeline, build_single_comment_pipeline
+from backend.graph.state import PipelineState
+from backend.graph.nodes.fetch import extract_video_id
+from backend.graph.stream import astream_analysis, result_payload
+from backend.jobs import JobManager, JobQueueFullError
+from backend.metrics import ANALYSES_INFLIGHT, CONTENT_TYPE, HTTP_REQUEST_DURATION, JOBS, REGISTRY
+from backend.profiling import is_enabled as profiling_enabled, profile
+from backend.serialization import dumps, json_response, parse_fields, project_comments
+from backend.singleflight import SingleFlight
 from backend.models.schemas import (
     AnalyzeCommentRequest,
     AnalyzeCommentResponse,
+    AnalyzeCommentsRequest,
+    AnalyzeCommentsResponse,
     AnalyzeVideoRequest,
     AnalyzeVideoResponse,
+    AuthorStatsResponse,
+    CategoryCountResponse,
+    ChannelStatsResponse,
+    DailyVolumeResponse,
+    JobCreatedResponse,
+    JobStatusResponse,
+    ResultPageResponse,
+    StoredResultResponse,
     TaggedCommentResponse,
+    TimeBucketResponse,
 )
+from backend.storage.collection_stats import collection_stats
+from backend.storage.result_store import SORT_COLUMNS, result_store
+from backend.youtube import close_async_youtube_client
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
+_PROCESS_START = time.perf_counter()
+
+
+async def _run_warm_up(app: FastAPI) -> None:
+    """백그라운드 워밍업. 끝나면 /ready가 ready를 보고한다."""
+    from backend.warmup import warm_up
+
+    start = time.perf_counter()
+    try:
+        app.state.warmup_timings = await asyncio.to_thread(warm_up)
+    except Exception:
+        logger.exception("워밍업 실패 (요청 처리는 계속 가능)")
+    app.state.warmup_ms = round((time.perf_counter() - start) * 1000, 1)
+    app.state.ready = True
+    logger.info("워밍업 완료: %.1fms %s", app.state.warmup_ms, app.state.warmup_timings)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """파이프라인을 한 번만 컴파일해 모든 요청이 공유하고, 워밍업을 시작한다."""
+    app.state.ready = False
+    app.state.warmup_ms = None
+    app.state.warmup_timings = {}
+    app.state.first_request_ms = None
+
+    resources = AsyncExitStack()
+    # 종료 시 (작업 정리 뒤) httpx 커넥션 풀을 닫는다
+    resources.push_async_callback(close_async_youtube_client)
+    checkpointer = await resources.enter_async_context(open_checkpointer())
+    await sweep_checkpoints(checkpointer, settings.checkpoint_ttl_seconds)
+
+    start = time.perf_counter()
+    app.state.pipeline = build_pipeline(checkpointer)
+    app.state.single_comment_pipeline = build_single_comment_pipeline()
+    app.state.compile_ms = round((time.perf_counter() - start) * 1000, 1)
+    app.state.startup_ms = round((time.perf_counter() - _PROCESS_START) * 1000, 1)
+    logger.info(
+        "파이프라인 컴파일 %.1fms, 시작까지 %.1fms", app.state.compile_ms, app.state.startup_ms
+    )
+
+    app.state.jobs = JobManager(
+        app.state.pipeline,
+        workers=settings.job_workers,
+        queue_size=settings.job_queue_size,
+        ttl_seconds=settings.job_ttl_seconds,
+    )
+    app.state.jobs.start()
+    app.state.analyses = SingleFlight(
+        settings.analysis_cache_ttl_seconds, max_entries=settings.analysis_cache_size
+    )
+    JOBS.set_function(lambda: app.state.jobs.queued, state="queued")
+    JOBS.set_function(lambda: app.state.jobs.running, state="running")
+    ANALYSES_INFLIGHT.set_function(lambda: app.state.analyses.inflight)
+
+    warm_up_task = asyncio.create_task(_run_warm_up(app))
+    yield
+    warm_up_task.cancel()
+    await app.state.jobs.stop()
+    await resources.aclose()
+
+
 app = FastAPI(
     title="NVC Chat Talk — 악성 댓글 태깅 API",
     description="LangGraph 기반 Rule + Gemini AI 통합 파이프라인",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """엔드포인트별 지연시간 히스토그램 (path는 라우트 템플릿, 예: /jobs/{job_id})."""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            path=route.path if route is not None else "unmatched",
+            status=str(status),
+        )
+
+
+@app.middleware("http")
+async def measure_first_request(request: Request, call_next):
+    """기동 후 첫 분석 요청의 지연시간 기록 (헬스체크 제외)."""
+    if request.app.state.first_request_ms is not None or request.url.path in ("/health", "/ready", "/metrics"):
+        return await call_next(request)
+
+    start = time.perf_counter()
+    response = await call_next(request)
+    if request.app.state.first_request_ms is None:
+        request.app.state.first_request_ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(
+            "첫 요청 지연: %s %.1fms", request.url.path, request.app.state.first_request_ms
+        )
+    return response
+
+
+def _video_state(req: AnalyzeVideoRequest) -> PipelineState:
+    """영상 분석 요청 → 파이프라인 초기 state (run_id 미지정이면 새로 발급)."""
+    return {
+        "run_id": req.run_id or uuid.uuid4().hex,
+        "video_url": req.video_url,
+        "max_comments": req.max_comments,
+        "include_replies": req.include_replies,
+        "max_replies_per_thread": req.max_replies_per_thread,
+        "refresh": req.refresh,
+    }
+
+
+PROFILE_QUERY = Query(
+    default=None,
+    alias="profile",
+    description="1이면 응답에 span 트리(노드/LLM 호출/API 페이지 시간)를 붙인다 (X-Profile: 1도 동일)",
+)
+
+FIELDS_QUERY = Query(
+    default=None,
+    description="댓글 필드 projection (예: comment_id,toxicity_score)",
+)
+
+
+def _parse_fields(fields: str | None) -> list[str] | None:
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _analysis_key(video_id: str, req: AnalyzeVideoRequest) -> tuple:
+    """결과가 같아지는 요청끼리 같은 키 (URL 표기 차이는 video_id로 흡수).
+
+    run_id를 지정한 재개 요청은 같은 run_id끼리만 합친다. refresh 요청은 영상 캐시를 무시하므로
+    일반 요청의 실행에 붙지 않고 refresh 요청끼리만 합친다.
+    """
+    return (
+        video_id,
+        req.max_comments,
+        req.include_replies,
+        req.max_replies_per_thread,
+        req.run_id,
+        req.refresh,
+    )
+
+
+def _conflict(e: RunConflictError) -> HTTPException:
+    return HTTPException(status_code=409, detail=str(e), headers={"X-Run-Id": e.run_id})
+
+
+async def _check_resume(pipeline, state: PipelineState) -> None:
+    """run_id 체크포인트의 입력이 요청과 다르면 409."""
+    try:
+        await check_resume(pipeline, state)
+    except RunConflictError as e:
+        raise _conflict(e)
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _ndjson(record: dict) -> bytes:
+    return dumps(record) + b"\n"
+
+
+async def _stream_analysis(pipeline, state: PipelineState):
+    """NDJSON 레코드: verdict(확정 순) … → summary (마지막).
+
+    응답 헤더가 이미 나간 뒤라 실패는 error 레코드로 알린다 (재개 가능하면 run_id 포함).
+    """
+    try:
+        async for event in astream_analysis(pipeline, state, include_comments=False):
+            if event["type"] == "verdict":
+                yield _ndjson({"type": "verdict", "comment": event["comment"]})
+            elif event["type"] == "result":
+                yield _ndjson({"type": "summary", **event["result"]})
+    except RunConflictError as e:
+        yield _ndjson({"type": "error", "detail": str(e), "run_id": e.run_id})
+    except RunInterruptedError as e:
+        logger.exception("파이프라인 오류 (stream, run_id=%s)", e.run_id)
+        yield _ndjson({"type": "error", "detail": f"분석 중 오류: {e}", "run_id": e.run_id})
+    except Exception as e:
+        logger.exception("파이프라인 오류 (stream)")
+        yield _ndjson({"type": "error", "detail": f"분석 중 오류: {e}"})
+
+
 @app.post("/analyze", response_model=AnalyzeVideoResponse)
-async def analyze_video(req: AnalyzeVideoRequest):
-    """전체 영상 분석: URL → 댓글 수집 → Rule pre-screen → LLM 분석 → 태깅."""
+async def analyze_video(
+    req: AnalyzeVideoRequest,
+    request: Request,
+    stream: bool = Query(
+        default=False,
+        description="true면 NDJSON 스트리밍 (Accept: application/x-ndjson도 동일)",
+    ),
+    fields: str | None = FIELDS_QUERY,
+    profile_param: str | None = PROFILE_QUERY,
+):
+    """전체 영상 분석: URL → 댓글 수집 → Rule pre-screen → LLM 분석 → 태깅.
+
+    스트리밍 모드에서는 safe 댓글의 Rule-only 결과가 먼저, LLM 결과가 완료되는 대로
+    나가고, 요약이 마지막 레코드로 나간다.
+
+    일반 모드에서는 같은 영상·옵션의 동시 요청이 하나의 실행을 공유하고,
+    직후 요청은 완료 캐시에서 바로 응답한다 (X-Analysis-Source: run | coalesced | cache).
+    refresh=true는 완료 캐시를 건너뛴다.
+
+    응답은 파이프라인 결과를 Pydantic 재검증 없이 바로 인코딩한다 (backend.serialization).
+    프로파일링 요청은 합치기/완료 캐시를 거치지 않고 직접 실행해 `profile`을 붙인다.
+    """
     logger.info("분석 시작: %s", req.video_url)
 
-    pipeline = build_pipeline()
+    pipeline = request.app.state.pipeline
+    comment_fields = _parse_fields(fields)
+
+    # 실행 전에 잘못된 URL은 400으로 거른다
+    try:
+        video_id = extract_video_id(req.video_url)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        state = _video_state(req)
+        # 응답 헤더가 나가기 전에 재개 입력 충돌을 409로 거른다 (실행 직전에 한 번 더 확인됨)
+        await _check_resume(pipeline, state)
+        return StreamingResponse(
+            _stream_analysis(pipeline, state),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={"X-Run-Id": state["run_id"]},
+        )
+
+    async def run() -> dict:
+        return result_payload(await ainvoke_resumable(pipeline, _video_state(req)))
 
     try:
-        result = pipeline.invoke({"video_url": req.video_url})
+        if profiling_enabled(profile_param, request.headers.get("x-profile")):
+            with profile("analyze", video_id=video_id) as root:
+                payload = await run()
+            payload = {**payload, "profile": root.to_dict()}
+            source = "run"
+        else:
+            payload, source = await request.app.state.analyses.run(
+                _analysis_key(video_id, req), run, use_cache=not req.refresh
+            )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except RunConflictError as e:
+        raise _conflict(e)
+    except RunInterruptedError as e:
+        logger.exception("파이프라인 오류 (run_id=%s)", e.run_id)
+        raise HTTPException(
+            status_code=500, detail=f"분석 중 오류: {e}", headers={"X-Run-Id": e.run_id}
+        )
     except Exception as e:
         logger.exception("파이프라인 오류")
         raise HTTPException(status_code=500, detail=f"분석 중 오류: {e}")
 
-    tagged = result.get("tagged_comments", [])
-    summary = result.get("summary", {})
+    summary = payload["summary"]
 
     logger.info(
-        "분석 완료: %d개 댓글, %d개 악성 (skip %s%%)",
+        "분석 완료 (%s): %d개 댓글, %d개 악성 (skip %s%%)",
+        source,
         summary.get("total_comments", 0),
         summary.get("toxic_comments", 0),
         summary.get("pipeline_stats", {}).get("skip_ratio", 0),
     )
 
-    return AnalyzeVideoResponse(
-        video_id=result.get("video_id", ""),
-        video_title=result.get("video_title", ""),
-        channel_title=result.get("channel_title", ""),
-        transcript_length=len(result.get("transcript", "")),
-        total_comments=len(tagged),
-        tagged_comments=[TaggedCommentResponse(**t) for t in tagged],
-        summary=summary,
+    return await json_response(
+        request,
+        project_comments(payload, "tagged_comments", comment_fields),
+        headers={"X-Analysis-Source": source},
     )
 
 
 @app.post("/analyze/comment", response_model=AnalyzeCommentResponse)
-async def analyze_single_comment(req: AnalyzeCommentRequest):
+async def analyze_single_comment(
+    req: AnalyzeCommentRequest,
+    request: Request,
+    profile_param: str | None = PROFILE_QUERY,
+):
     """단일 댓글 분석 (POC): 댓글 텍스트 + 선택적 transcript → 태깅."""
-    pipeline = build_single_comment_pipeline()
+    pipeline = request.app.state.single_comment_pipeline
 
     # 단일 댓글을 comments 리스트로 래핑
     comment_id = str(uuid.uuid4())[:8]
@@ -88,22 +371,267 @@ async def analyze_single_comment(req: AnalyzeCommentRequest):
         ],
     }
 
+    root = None
     try:
-        result = pipeline.invoke(initial_state)
+        if profiling_enabled(profile_param, request.headers.get("x-profile")):
+            with profile("analyze_comment") as root:
+                result = await pipeline.ainvoke(initial_state)
+        else:
+            result = await pipeline.ainvoke(initial_state)
     except Exception as e:
         logger.exception("단일 댓글 분석 오류")
         raise HTTPException(status_code=500, detail=f"분석 중 오류: {e}")
 
-    tagged = result.get("tagged_comments", [])
-    if not tagged:
+    tagged = result.get("tagged")
+    if tagged is None or not len(tagged):
         raise HTTPException(status_code=500, detail="태깅 결과 없음")
 
     return AnalyzeCommentResponse(
-        tagged_comment=TaggedCommentResponse(**tagged[0]),
+        tagged_comment=TaggedCommentResponse(**tagged.row(0)),
+        profile=root.to_dict() if root is not None else None,
     )
 
 
+@app.post("/analyze/comments", response_model=AnalyzeCommentsResponse)
+async def analyze_comments(
+    req: AnalyzeCommentsRequest,
+    request: Request,
+    fields: str | None = FIELDS_QUERY,
+):
+    """댓글 일괄 분석: Rule pre-screen을 한 번에 돌리고 suspect만 LLM에 동시 호출.
+
+    결과는 입력 순서이며, summary는 이 배치 전체의 통계다.
+    """
+    pipeline = request.app.state.single_comment_pipeline
+    comment_fields = _parse_fields(fields)
+
+    # 내부 comment_id는 입력 순번 (호출 측 ID는 중복될 수 있으므로 응답에서만 복원)
+    initial_state = {
+        "video_url": "",
+        "video_id": "",
+        "video_title": req.video_title,
+        "transcript": req.transcript,
+        "comments": [
+            {
+                "comment_id": str(i),
+                "author": item.author,
+                "text": item.text,
+                "published_at": "",
+                "like_count": item.like_count,
+            }
+            for i, item in enumerate(req.comments)
+        ],
+    }
+
+    try:
+        result = await pipeline.ainvoke(initial_state)
+    except Exception as e:
+        logger.exception("일괄 분석 오류")
+        raise HTTPException(status_code=500, detail=f"분석 중 오류: {e}")
+
+    # tagged 행 → 입력 순번, 응답에서만 dict로 만든다
+    tagged_table = result["tagged"]
+    row_of = [0] * len(req.comments)
+    for row, cid in enumerate(tagged_table.comment_id):
+        row_of[int(cid)] = row
+    results = []
+    for i, item in enumerate(req.comments):
+        tagged = tagged_table.row(row_of[i])
+        tagged["comment_id"] = item.comment_id if item.comment_id is not None else str(i)
+        results.append(tagged)
+
+    logger.info(
+        "일괄 분석 완료: %d개 댓글 (LLM %d개)",
+        len(results),
+        result["summary"]["pipeline_stats"]["llm_analyzed"],
+    )
+    payload = {"results": results, "summary": result["summary"]}
+    return await json_response(request, project_comments(payload, "results", comment_fields))
+
+
+@app.post("/jobs", response_model=JobCreatedResponse, status_code=202)
+async def create_job(req: AnalyzeVideoRequest, request: Request):
+    """영상 분석을 백그라운드 작업으로 등록하고 job id를 즉시 반환."""
+    state = _video_state(req)
+    await _check_resume(request.app.state.pipeline, state)
+    try:
+        job = request.app.state.jobs.submit(state)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    logger.info("작업 등록: %s (%s, run_id=%s)", job.id, req.video_url, job.state["run_id"])
+    return JobCreatedResponse(job_id=job.id, run_id=job.state["run_id"], status=job.status)
+
+
+def _get_job(request: Request, job_id: str):
+    job = request.app.state.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return job
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job(
+    job_id: str,
+    request: Request,
+    offset: int = Query(default=0, ge=0, description="부분 결과 시작 위치"),
+    limit: int = Query(default=100, ge=0, le=1000, description="부분 결과 최대 개수"),
+):
+    """작업 상태, 진행 카운트, 지금까지 확정된 태깅 결과."""
+    return _get_job(request, job_id).snapshot(offset, limit)
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request):
+    """작업 진행 SSE 스트림.
+
+    status → (지금까지의) verdict → node / verdict 실시간 이벤트 → 최종 status 순.
+    """
+    job = _get_job(request, job_id)
+    jobs = request.app.state.jobs
+
+    async def event_stream():
+        async for event in jobs.subscribe(job, heartbeat=settings.job_heartbeat_seconds):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            data = dumps(event).decode("utf-8")
+            yield f"event: {event['type']}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/results", response_model=list[StoredResultResponse])
+async def list_results(
+    video_id: str = Query(description="영상 ID"),
+    limit: int = Query(default=20, ge=1, le=100),
+):
+    """영상의 저장된 분석 결과 목록 (최신순, 댓글 제외)."""
+    return await asyncio.to_thread(result_store.list_for_video, video_id, limit)
+
+
+@app.get("/results/{result_id}", response_model=ResultPageResponse)
+async def get_result(
+    result_id: str,
+    request: Request,
+    limit: int = Query(default=50, ge=1, le=500, description="페이지 크기"),
+    cursor: str | None = Query(default=None, description="이전 페이지의 next_cursor"),
+    level: list[str] | None = Query(default=None, description="toxicity_level 필터 (반복 가능)"),
+    category: str | None = Query(default=None, description="카테고리 필터"),
+    sort: str = Query(default="seq", description=f"정렬: {' | '.join(SORT_COLUMNS)}"),
+    fields: str | None = FIELDS_QUERY,
+):
+    """저장된 분석 결과: 요약 + 태깅 댓글 한 페이지 (커서 페이지네이션)."""
+    comment_fields = _parse_fields(fields)
+    stored = await asyncio.to_thread(result_store.get, result_id)
+    if stored is None:
+        raise HTTPException(status_code=404, detail=f"결과를 찾을 수 없습니다: {result_id}")
+
+    try:
+        page = await asyncio.to_thread(
+            result_store.page,
+            result_id,
+            limit=limit,
+            cursor=cursor,
+            levels=level,
+            category=category,
+            sort=sort,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return await json_response(request, project_comments({**stored, **page}, "items", comment_fields))
+
+
+def _collection_stats(query: str, **kwargs):
+    """통계 인덱스를 증분 갱신(바뀐 채널만)한 뒤 질의."""
+    collection_stats.update()
+    return getattr(collection_stats, query)(**kwargs)
+
+
+CHANNEL_QUERY = Query(default=None, description="채널 키 (GET /stats/channels의 channel_key)")
+VIDEO_QUERY = Query(default=None, description="영상 ID")
+
+
+@app.get("/stats/channels", response_model=list[ChannelStatsResponse])
+async def stats_channels():
+    """수집된 채널별 통계."""
+    return await asyncio.to_thread(_collection_stats, "channels")
+
+
+@app.get("/stats/toxicity", response_model=list[TimeBucketResponse])
+async def stats_toxicity(
+    channel: str | None = CHANNEL_QUERY,
+    video_id: str | None = VIDEO_QUERY,
+    bucket: str = Query(default="day", description="구간: day | month"),
+):
+    """게시 시각 구간별 독성 추이 (채널/영상 필터)."""
+    try:
+        return await asyncio.to_thread(
+            _collection_stats, "toxicity_over_time", channel=channel, video_id=video_id, bucket=bucket
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/stats/categories", response_model=list[CategoryCountResponse])
+async def stats_categories(
+    channel: str | None = CHANNEL_QUERY,
+    video_id: str | None = VIDEO_QUERY,
+    limit: int = Query(default=10, ge=1, le=100),
+):
+    """많이 걸린 카테고리 순위."""
+    return await asyncio.to_thread(
+        _collection_stats, "top_categories", channel=channel, video_id=video_id, limit=limit
+    )
+
+
+@app.get("/stats/authors", response_model=list[AuthorStatsResponse])
+async def stats_authors(
+    channel: str | None = CHANNEL_QUERY,
+    limit: int = Query(default=20, ge=1, le=500),
+):
+    """독성 댓글이 많은 작성자 (채널 지정이 없으면 전체 채널)."""
+    return await asyncio.to_thread(_collection_stats, "top_authors", channel=channel, limit=limit)
+
+
+@app.get("/stats/volume", response_model=list[DailyVolumeResponse])
+async def stats_volume(
+    channel: str | None = CHANNEL_QUERY,
+    video_id: str | None = VIDEO_QUERY,
+):
+    """게시일별 댓글 수."""
+    return await asyncio.to_thread(
+        _collection_stats, "volume_by_day", channel=channel, video_id=video_id
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 (text exposition format)."""
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 @app.get("/health")
 async def health():
-    """헬스체크."""
+    """헬스체크 (liveness)."""
     return {"status": "ok"}
+
+
+@app.get("/ready")
+async def ready(request: Request):
+    """Readiness: 파이프라인 컴파일 + 워밍업이 끝나야 200."""
+    state = request.app.state
+    body = {
+        "status": "ready" if state.ready else "warming_up",
+        "startup_ms": state.startup_ms,
+        "compile_ms": state.compile_ms,
+        "warmup_ms": state.warmup_ms,
+        "warmup": state.warmup_timings,
+        "first_request_ms": state.first_request_ms,
+    }
+    return JSONResponse(body, status_code=200 if state.ready else 503)
@@ -0,0 +1,248 @@
+"""Prometheus 메트릭 (GET /metrics).
+
+외부 의존성 없이 Counter / Gauge / Histogram과 text exposition format(0.0.4)만 구현한다.
+모든 메트릭은 프로세스 로컬이며 스레드 안전하다 (sync 노드는 스레드에서 실행됨).
+
+    from backend.metrics import NODE_DURATION
+    with NODE_DURATION.time(node="prescreen"):
+        ...
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 초 단위 지연시간 버킷 (HTTP 요청, 노드, LLM 호출 공용)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 라벨은 {self.labelnames}여야 합니다 (받음: {tuple(labels)})")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """단조 증가 카운터."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """현재 값. set_function을 주면 스크레이프 시점에 계산한다."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._functions: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, func: Callable[[], float], **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = func
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, func in functions.items():
+            try:
+                values[key] = func()
+            except Exception:
+                continue
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (+ _sum, _count)."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # key → (버킷별 개수, 합계)
+        self._values: dict[tuple[str, ...], tuple[list[int], float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """with 블록의 실행 시간을 관측 (예외가 나도 기록)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted((k, (list(c), t)) for k, (c, t) in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: list[_Metric] = []
+
+    def register(self, metric: _Metric) -> None:
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        return "\n".join(m.render() for m in self._metrics) + "\n"
+
+
+REGISTRY = Registry()
+
+
+# ─── 메트릭 정의 ──────────────────────────────────────────
+
+HTTP_REQUEST_DURATION = Histogram(
+    "nvc_http_request_duration_seconds",
+    "HTTP request latency by endpoint (streaming responses: until headers are sent).",
+    ("method", "path", "status"),
+)
+
+NODE_DURATION = Histogram(
+    "nvc_node_duration_seconds",
+    "LangGraph node execution time.",
+    ("node",),
+)
+
+LLM_REQUEST_DURATION = Histogram(
+    "nvc_llm_request_duration_seconds",
+    "Gemini tagging call latency.",
+    ("model",),
+)
+LLM_ERRORS = Counter(
+    "nvc_llm_errors_total",
+    "Gemini tagging calls that failed (falls back to rule result).",
+    ("model",),
+)
+
+YOUTUBE_API_REQUESTS = Counter(
+    "nvc_youtube_api_requests_total",
+    "YouTube Data API HTTP requests (including retries) by resource and status.",
+    ("resource", "status"),
+)
+YOUTUBE_API_ERRORS = Counter(
+    "nvc_youtube_api_errors_total",
+    "YouTube Data API calls that failed after retries, by resource and reason.",
+    ("resource", "reason"),
+)
+
+RULE_ENGINE_COMMENTS = Counter(
+    "nvc_rule_engine_comments_total",
+    "Comments scored by the rule engine.",
+)
+RULE_ENGINE_SECONDS = Counter(
+    "nvc_rule_engine_seconds_total",
+    "Time spent in the rule engine (throughput = comments_total / seconds_total).",
+)
+VERDICT_STORE_HITS = Counter(
+    "nvc_verdict_store_hits_total",
+    "Comments whose rule / LLM verdict was reused from the verdict store (by text hash).",
+    ("kind",),
+)
+PRESCREEN_SKIP_RATIO = Gauge(
+    "nvc_prescreen_skip_ratio",
+    "Share of comments the last prescreen run resolved without the LLM (0-1).",
+)
+
+JOBS = Gauge(
+    "nvc_jobs",
+    "Background analysis jobs by state.",
+    ("state",),
+)
+ANALYSES_INFLIGHT = Gauge(
+    "nvc_analyses_inflight",
+    "Distinct /analyze pipeline runs in progress (after coalescing).",
+)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+from backend.config import settings
+
 
 # ─── 요청 ────────────────────────────────────────────────
 
@@ -11,6 +13,23 @@ class AnalyzeVideoRequest(BaseModel):
     """전체 영상 분석 요청."""
 
     video_url: str = Field(description="YouTube 영상 URL")
+    max_comments: int = Field(
+        default=settings.default_max_comments,
+        ge=1,
+        le=settings.max_comments_limit,
+        description="수집할 최대 댓글 수 (답글 포함)",
+    )
+    include_replies: bool = Field(default=False, description="답글도 수집할지 여부")
+    refresh: bool = Field(default=False, description="영상 캐시를 무시하고 전체 재수집")
+    max_replies_per_thread: int = Field(
+        default=100, ge=0, le=1000, description="스레드당 최대 답글 수",
+    )
+    run_id: str | None = Field(
+        default=None,
+        min_length=1,
+        max_length=128,
+        description="중단된 실행의 run_id (지정하면 마지막으로 끝난 노드/배치부터 이어서 실행)",
+    )
 
 
 class AnalyzeCommentRequest(BaseModel):
@@ -20,6 +39,27 @@ class AnalyzeCommentRequest(BaseModel):
     transcript: str = Field(default="", description="영상 자막 맥락 (선택)")
 
 
+class BulkCommentItem(BaseModel):
+    """일괄 분석할 댓글 하나."""
+
+    text: str = Field(description="댓글 텍스트")
+    comment_id: str | None = Field(default=None, description="호출 측 ID (없으면 입력 순번)")
+    author: str = Field(default="")
+    like_count: int = Field(default=0, ge=0)
+
+
+class AnalyzeCommentsRequest(BaseModel):
+    """댓글 일괄 분석 요청."""
+
+    comments: list[BulkCommentItem] = Field(
+        min_length=1,
+        max_length=settings.bulk_comments_limit,
+        description="분석할 댓글 목록",
+    )
+    transcript: str = Field(default="", description="공통 영상 자막 맥락 (선택)")
+    video_title: str = Field(default="", description="공통 영상 제목 (선택)")
+
+
 # ─── 응답 ────────────────────────────────────────────────
 
 class TaggedCommentResponse(BaseModel):
@@ -30,6 +70,7 @@ class TaggedCommentResponse(BaseModel):
     text: str
     published_at: str
     like_count: int
+    parent_id: str | None = None
     toxicity_score: int
     toxicity_level: str
     categories: list[str]
@@ -44,6 +85,31 @@ class PipelineStatsResponse(BaseModel):
     rule_skipped: int
     llm_analyzed: int
     skip_ratio: float
+    cached: int = 0
+
+
+class LikesWeightedResponse(BaseModel):
+    """좋아요 수 가중 독성."""
+
+    total_likes: int
+    average_toxicity_score: float
+    toxic_like_share: float
+
+
+class TimeBucketResponse(BaseModel):
+    """게시 시각 구간 하나의 독성 집계."""
+
+    period: str
+    total: int
+    toxic: int
+    average_toxicity_score: float
+
+
+class ToxicityOverTimeResponse(BaseModel):
+    """게시 시각 구간별 독성 히스토그램 (`bucket`: day | month)."""
+
+    bucket: str
+    items: list[TimeBucketResponse]
 
 
 class SummaryResponse(BaseModel):
@@ -57,12 +123,18 @@ class SummaryResponse(BaseModel):
     average_toxicity_score: float
     category_distribution: dict[str, int]
     level_distribution: dict[str, int]
+    # 이전 버전에서 저장된 결과에는 없을 수 있음
+    score_percentiles: dict[str, int] = {}
+    likes_weighted: LikesWeightedResponse | None = None
+    toxicity_over_time: ToxicityOverTimeResponse | None = None
     pipeline_stats: PipelineStatsResponse
 
 
 class AnalyzeVideoResponse(BaseModel):
     """전체 영상 분석 응답."""
 
+    result_id: str | None = None  # GET /results/{result_id}로 다시 조회
+    run_id: str | None = None  # 실행 ID (체크포인트 키)
     video_id: str
     video_title: str = ""
     channel_title: str = ""
@@ -70,9 +142,115 @@ class AnalyzeVideoResponse(BaseModel):
     total_comments: int
     tagged_comments: list[TaggedCommentResponse]
     summary: SummaryResponse
+    profile: dict | None = None  # ?profile=1일 때 span 트리
 
 
 class AnalyzeCommentResponse(BaseModel):
     """단일 댓글 분석 응답."""
 
     tagged_comment: TaggedCommentResponse
+    profile: dict | None = None  # ?profile=1일 때 span 트리
+
+
+class AnalyzeCommentsResponse(BaseModel):
+    """댓글 일괄 분석 응답. results는 입력 순서."""
+
+    results: list[TaggedCommentResponse]
+    summary: SummaryResponse
+
+
+class StoredResultResponse(BaseModel):
+    """저장된 분석 결과 메타데이터 + 요약."""
+
+    result_id: str
+    video_id: str
+    video_title: str = ""
+    channel_title: str = ""
+    transcript_length: int
+    total_comments: int
+    summary: SummaryResponse
+    created_at: float
+
+
+class ResultPageResponse(StoredResultResponse):
+    """저장된 분석 결과의 태깅 댓글 한 페이지."""
+
+    items: list[TaggedCommentResponse]
+    next_cursor: str | None = None
+
+
+class ChannelStatsResponse(BaseModel):
+    """수집된 채널 하나의 통계."""
+
+    channel_key: str
+    channel_id: str
+    name: str
+    handle: str
+    subscriber_count: int
+    collected_at: str | None = None
+    rules_version: str | None = None
+    videos: int
+    total_comments: int
+    toxic_comments: int
+    toxic_percentage: float
+    average_toxicity_score: float
+
+
+class CategoryCountResponse(BaseModel):
+    """카테고리별 댓글 수."""
+
+    category: str
+    count: int
+
+
+class AuthorStatsResponse(BaseModel):
+    """작성자별 독성 댓글 집계 (채널 전체)."""
+
+    author: str
+    toxic_comments: int
+    total_comments: int
+    average_toxicity_score: float
+    channels: int
+
+
+class DailyVolumeResponse(BaseModel):
+    """게시일별 댓글 수."""
+
+    day: str
+    comments: int
+
+
+class JobProgressResponse(BaseModel):
+    """작업 진행 카운트 (누적)."""
+
+    fetched: int = 0
+    cached: int = 0
+    prescreened: int = 0
+    safe: int = 0
+    suspect: int = 0
+    llm_tagged: int = 0
+
+
+class JobCreatedResponse(BaseModel):
+    """작업 생성 응답."""
+
+    job_id: str
+    run_id: str
+    status: str
+
+
+class JobStatusResponse(BaseModel):
+    """작업 상태 + 지금까지 확정된 태깅 결과 (부분 결과)."""
+
+    job_id: str
+    run_id: str | None = None  # 실패한 작업은 이 값으로 다시 등록하면 이어서 실행
+    status: str  # queued | running | succeeded | failed
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    current_node: str | None = None
+    progress: JobProgressResponse
+    verdict_count: int
+    verdicts: list[TaggedCommentResponse]
+    result: AnalyzeVideoResponse | None = None
+    error: str | None = None
@@ -0,0 +1,147 @@
+"""요청 단위 프로파일링 (`?profile=1` 또는 `X-Profile: 1`).
+
+프로파일링 중인 요청은 contextvar에 루트 span을 두고, 노드/LLM 호출/YouTube API 페이지가
+`span()`으로 자식 span을 단다. 루트 span이 없으면 `span()`은 contextvar 조회 한 번만 하고
+아무것도 기록하지 않는다.
+
+CPU 위주의 sync 노드는 `sampled_span()`으로 감싸 실행 스레드의 파이썬 스택을
+주기적으로 샘플링하고, 접힌 스택(`a;b;c` → 샘플 수) 상위 항목을 span에 붙인다.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+SAMPLE_INTERVAL = 0.005  # 초
+TOP_STACKS = 15
+MAX_STACK_DEPTH = 40
+
+
+@dataclass
+class Span:
+    name: str
+    start: float = field(default_factory=time.perf_counter)
+    end: float | None = None
+    attrs: dict[str, Any] = field(default_factory=dict)
+    children: list[Span] = field(default_factory=list)
+    stacks: Counter | None = None
+
+    def to_dict(self, origin: float | None = None) -> dict:
+        """ms 단위 트리. start_ms는 루트 span 시작 기준."""
+        origin = self.start if origin is None else origin
+        end = self.end if self.end is not None else time.perf_counter()
+        data: dict[str, Any] = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round((end - self.start) * 1000, 3),
+        }
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.stacks:
+            total = sum(self.stacks.values())
+            data["samples"] = {
+                "interval_ms": SAMPLE_INTERVAL * 1000,
+                "total": total,
+                "top_stacks": [
+                    {"stack": stack, "count": count}
+                    for stack, count in self.stacks.most_common(TOP_STACKS)
+                ],
+            }
+        if self.children:
+            data["children"] = [
+                c.to_dict(origin) for c in sorted(self.children, key=lambda c: c.start)
+            ]
+        return data
+
+
+_current: ContextVar[Span | None] = ContextVar("profile_span", default=None)
+
+
+def is_enabled(query_value: str | None, header_value: str | None) -> bool:
+    """`?profile=` / `X-Profile:` 값 → 프로파일링 여부."""
+    value = query_value if query_value is not None else header_value
+    return value is not None and value.lower() in ("1", "true", "yes", "on")
+
+
+@contextmanager
+def profile(name: str, **attrs: Any) -> Iterator[Span]:
+    """루트 span 시작. with 블록 안의 span()들이 이 트리에 기록된다."""
+    root = Span(name, attrs=attrs)
+    token = _current.set(root)
+    try:
+        yield root
+    finally:
+        root.end = time.perf_counter()
+        _current.reset(token)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span | None]:
+    """현재 span의 자식 span. 프로파일링 중이 아니면 no-op."""
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(name, attrs=attrs)
+    # 동시 실행되는 태스크/스레드가 같은 부모에 붙여도 list.append는 원자적
+    parent.children.append(child)
+    token = _current.set(child)
+    try:
+        yield child
+    finally:
+        child.end = time.perf_counter()
+        _current.reset(token)
+
+
+def _fold(frame) -> str:
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class _Sampler(threading.Thread):
+    """대상 스레드의 스택을 interval마다 샘플링."""
+
+    def __init__(self, thread_id: int, stacks: Counter):
+        super().__init__(daemon=True, name="profile-sampler")
+        self.thread_id = thread_id
+        self.stacks = stacks
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(SAMPLE_INTERVAL):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[_fold(frame)] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+@contextmanager
+def sampled_span(name: str, **attrs: Any) -> Iterator[Span | None]:
+    """span() + 현재 스레드 스택 샘플링 (CPU 위주 sync 코드용)."""
+    with span(name, **attrs) as current:
+        if current is None:
+            yield None
+            return
+
+        current.stacks = Counter()
+        sampler = _Sampler(threading.get_ident(), current.stacks)
+        sampler.start()
+        try:
+            yield current
+        finally:
+            sampler.stop()
@@ -0,0 +1,93 @@
+"""대용량 응답 직렬화.
+
+파이프라인 결과(TaggedComment TypedDict)는 이미 응답 스키마 모양이므로
+Pydantic 모델을 다시 만들지 않고 바로 JSON으로 인코딩한다.
+
+- orjson으로 인코딩
+- `?fields=comment_id,toxicity_score`로 댓글 필드 projection
+- 응답이 response_compress_min_bytes 이상이면 Accept-Encoding에 따라 br(brotli 설치 시) / gzip 압축.
+  response_compress_offload_bytes 이상이면 압축은 스레드에서 실행해 이벤트 루프를 막지 않는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+from backend.config import settings
+from backend.models.schemas import TaggedCommentResponse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMMENT_FIELDS = frozenset(TaggedCommentResponse.model_fields)
+
+
+def dumps(obj: Any) -> bytes:
+    """UTF-8 JSON bytes."""
+    return orjson.dumps(obj)
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """`fields` 쿼리 → 댓글 필드 목록. 없거나 비어 있으면 None(전체).
+
+    Raises:
+        ValueError: 알 수 없는 필드가 있는 경우.
+    """
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in names if f not in COMMENT_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"알 수 없는 필드: {', '.join(unknown)} (사용 가능: {', '.join(sorted(COMMENT_FIELDS))})"
+        )
+    return names or None
+
+
+def project_comments(payload: dict, key: str, fields: list[str] | None) -> dict:
+    """payload[key]의 댓글들을 fields만 남긴 새 payload. 원본은 변경하지 않는다."""
+    if fields is None:
+        return payload
+    return {**payload, key: [{f: c[f] for f in fields if f in c} for c in payload[key]]}
+
+
+def _encode(body: bytes, accept_encoding: str) -> tuple[bytes, str | None]:
+    if len(body) < settings.response_compress_min_bytes:
+        return body, None
+    if brotli is not None and "br" in accept_encoding:
+        return brotli.compress(body, quality=4), "br"
+    if "gzip" in accept_encoding:
+        return gzip.compress(body, compresslevel=5), "gzip"
+    return body, None
+
+
+async def json_response(
+    request: Request,
+    payload: Any,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """payload를 검증 없이 인코딩(+압축)한 JSON 응답. 큰 본문의 압축은 스레드에서."""
+    body = dumps(payload)
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if len(body) >= settings.response_compress_offload_bytes:
+        body, encoding = await asyncio.to_thread(_encode, body, accept_encoding)
+    else:
+        body, encoding = _encode(body, accept_encoding)
+    response = Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
+    response.headers["Vary"] = "Accept-Encoding"
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    return response
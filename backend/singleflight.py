@@ -0,0 +1,81 @@
+"""동일 분석 요청 합치기 (single-flight) + 짧은 결과 캐시.
+
+같은 키(video_id + 분석 옵션)의 요청이 동시에 들어오면 파이프라인은 한 번만 실행되고
+나머지 요청은 그 실행에 붙어 같은 결과를 받는다. 끝난 결과는 ttl_seconds 동안
+메모리에 두어 바로 이어지는 요청에 즉시 응답한다. 실패한 실행은 캐시하지 않는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+# 응답 출처
+RUN = "run"
+COALESCED = "coalesced"
+CACHED = "cache"
+
+
+class SingleFlight:
+    """키별 in-flight 실행 공유 + TTL 결과 캐시 (이벤트 루프 하나에서만 사용)."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 64):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._done: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+    def _cached(self, key: Hashable) -> tuple[bool, Any]:
+        entry = self._done.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._done[key]
+            return False, None
+        return True, value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        self._done[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._done.move_to_end(key)
+        while len(self._done) > self.max_entries:
+            self._done.popitem(last=False)
+
+    async def run(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        use_cache: bool = True,
+    ) -> tuple[Any, str]:
+        """key의 결과를 반환. (결과, 출처: run | coalesced | cache)
+
+        use_cache=False면 완료 캐시는 건너뛰지만 진행 중인 실행에는 붙는다.
+        """
+        if use_cache:
+            hit, value = self._cached(key)
+            if hit:
+                return value, CACHED
+
+        task = self._inflight.get(key)
+        if task is not None:
+            # shield: 이 요청이 끊겨도 공유 실행은 계속된다
+            return await asyncio.shield(task), COALESCED
+
+        task = asyncio.ensure_future(func())
+        self._inflight[key] = task
+
+        def _finish(t: asyncio.Task) -> None:
+            self._inflight.pop(key, None)
+            if not t.cancelled() and t.exception() is None:
+                self._store(key, t.result())
+
+        task.add_done_callback(_finish)
+        return await asyncio.shield(task), RUN
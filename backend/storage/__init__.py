@@ -0,0 +1 @@
+"""로컬 디스크 저장소 모듈."""
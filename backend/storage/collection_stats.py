@@ -0,0 +1,21 @@
+"""수집 데이터 통계 인덱스 (GET /stats/*).
+
+`scripts/collect_comments.py`가 `COLLECTION_DATA_DIR`(기본 scripts/data)에 쌓은 채널별 수집 결과를
+`scripts/stats_index.py`의 SQLite 인덱스(`COLLECTION_STATS_PATH`)로 조회한다.
+`collect_comments.py --stats`와 같은 인덱스 파일을 쓰며, 조회 전에 바뀐 채널만 증분 반영한다.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from backend.config import settings
+
+# scripts/ 모듈 import를 위해 경로 추가
+_scripts_dir = str(settings.project_root / "scripts")
+if _scripts_dir not in sys.path:
+    sys.path.insert(0, _scripts_dir)
+
+from stats_index import StatsIndex  # noqa: E402
+
+collection_stats = StatsIndex(settings.collection_stats_path, settings.collection_data_dir)
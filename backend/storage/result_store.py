@@ -0,0 +1,309 @@
+"""분석 결과 저장소 (SQLite).
+
+파이프라인 실행 하나(= result_id 하나)의 요약과 태깅 결과를 저장하고,
+댓글은 페이지 단위로 조회한다.
+
+테이블:
+    results            — 실행별 영상 메타데이터 + summary(JSON)
+    tagged_comments    — 실행별 태깅 결과 (seq = 파이프라인 결과 순서, 본문은 text_hash로 참조)
+    comment_texts      — 댓글 본문 (text_hash = 본문 해시). 같은 본문은 실행·영상이 달라도 한 번만 저장
+    comment_categories — (result_id, seq, category) 카테고리 필터용
+
+페이지네이션은 keyset 커서(정렬 값 + seq)라 깊은 페이지도 OFFSET 없이 조회한다.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import TypedDict
+
+from backend.config import settings
+from backend.graph.state import TaggedComment
+from backend.graph.table import LEVELS, SOURCES, CommentTable, mask_categories, order_categories
+
+# sort 파라미터 → (컬럼, 방향). 같은 값은 seq 오름차순으로 안정 정렬
+SORT_COLUMNS: dict[str, tuple[str, str]] = {
+    "seq": ("seq", "ASC"),
+    "score": ("toxicity_score", "DESC"),
+    "likes": ("like_count", "DESC"),
+}
+
+_COMMENT_COLUMNS = (
+    "comment_id",
+    "author",
+    "text",
+    "published_at",
+    "like_count",
+    "parent_id",
+    "toxicity_score",
+    "toxicity_level",
+    "explanation",
+    "suggestion",
+    "analysis_source",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    result_id         TEXT PRIMARY KEY,
+    video_id          TEXT NOT NULL,
+    video_title       TEXT NOT NULL,
+    channel_title     TEXT NOT NULL,
+    transcript_length INTEGER NOT NULL,
+    total_comments    INTEGER NOT NULL,
+    summary           TEXT NOT NULL,
+    created_at        REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_video ON results (video_id, created_at);
+
+CREATE TABLE IF NOT EXISTS comment_texts (
+    text_hash BLOB PRIMARY KEY,
+    text      TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS tagged_comments (
+    result_id       TEXT NOT NULL REFERENCES results (result_id) ON DELETE CASCADE,
+    seq             INTEGER NOT NULL,
+    comment_id      TEXT NOT NULL,
+    author          TEXT NOT NULL,
+    text_hash       BLOB NOT NULL,
+    published_at    TEXT NOT NULL,
+    like_count      INTEGER NOT NULL,
+    parent_id       TEXT,
+    toxicity_score  INTEGER NOT NULL,
+    toxicity_level  TEXT NOT NULL,
+    categories      TEXT NOT NULL,
+    explanation     TEXT NOT NULL,
+    suggestion      TEXT,
+    analysis_source TEXT NOT NULL,
+    PRIMARY KEY (result_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_comments_level ON tagged_comments (result_id, toxicity_level, seq);
+CREATE INDEX IF NOT EXISTS idx_comments_score ON tagged_comments (result_id, toxicity_score, seq);
+CREATE INDEX IF NOT EXISTS idx_comments_likes ON tagged_comments (result_id, like_count, seq);
+
+CREATE TABLE IF NOT EXISTS comment_categories (
+    result_id TEXT NOT NULL,
+    seq       INTEGER NOT NULL,
+    category  TEXT NOT NULL,
+    PRIMARY KEY (result_id, category, seq)
+);
+"""
+
+
+def text_key(text: str) -> bytes:
+    """댓글 본문 → comment_texts 키 (원문 그대로의 해시)."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class StoredResult(TypedDict):
+    """저장된 실행 메타데이터 + 요약."""
+
+    result_id: str
+    video_id: str
+    video_title: str
+    channel_title: str
+    transcript_length: int
+    total_comments: int
+    summary: dict
+    created_at: float
+
+
+class CommentPage(TypedDict):
+    items: list[TaggedComment]
+    next_cursor: str | None
+
+
+def encode_cursor(value: int, seq: int) -> str:
+    raw = json.dumps([value, seq]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int]:
+    """커서 문자열 → (정렬 값, seq). 형식이 틀리면 ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, seq = json.loads(raw)
+        return int(value), int(seq)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+class ResultStore:
+    """SQLite 결과 저장소. 호출마다 연결을 열어 스레드 간 공유 문제를 피한다."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def save(
+        self,
+        video_id: str,
+        video_title: str,
+        channel_title: str,
+        transcript_length: int,
+        tagged: CommentTable,
+        summary: dict,
+    ) -> str:
+        """실행 결과 저장 → result_id. 댓글 행은 테이블 컬럼에서 바로 만든다.
+
+        본문은 comment_texts에 없는 것만 넣는다 (재분석·캐시 병합으로 같은 댓글이 실행마다 다시 저장됨).
+        """
+        result_id = uuid.uuid4().hex
+        keys = [text_key(text) for text in tagged.text]
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    result_id,
+                    video_id,
+                    video_title,
+                    channel_title,
+                    transcript_length,
+                    len(tagged),
+                    json.dumps(summary, ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO comment_texts VALUES (?, ?)", zip(keys, tagged.text)
+            )
+            conn.executemany(
+                "INSERT INTO tagged_comments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        result_id, seq, tagged.comment_id[seq], tagged.author[seq],
+                        keys[seq], tagged.published_at[seq], tagged.like_count[seq],
+                        tagged.parent_id[seq], tagged.score[seq], LEVELS[tagged.level[seq]],
+                        json.dumps(order_categories(tagged.order[seq]), ensure_ascii=False),
+                        tagged.explanation[seq], tagged.suggestion[seq],
+                        SOURCES[tagged.source[seq]],
+                    )
+                    for seq in range(len(tagged))
+                ),
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO comment_categories VALUES (?, ?, ?)",
+                (
+                    (result_id, seq, category)
+                    for seq, mask in enumerate(tagged.mask)
+                    for category in mask_categories(mask)
+                ),
+            )
+        return result_id
+
+    def get(self, result_id: str) -> StoredResult | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM results WHERE result_id = ?", (result_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        result = dict(row)
+        result["summary"] = json.loads(result["summary"])
+        return result
+
+    def list_for_video(self, video_id: str, limit: int = 20) -> list[StoredResult]:
+        """영상의 최근 실행 목록 (최신순)."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM results WHERE video_id = ? ORDER BY created_at DESC LIMIT ?",
+                (video_id, limit),
+            ).fetchall()
+        results = []
+        for row in rows:
+            result = dict(row)
+            result["summary"] = json.loads(result["summary"])
+            results.append(result)
+        return results
+
+    def page(
+        self,
+        result_id: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        levels: list[str] | None = None,
+        category: str | None = None,
+        sort: str = "seq",
+    ) -> CommentPage:
+        """태깅 결과 한 페이지.
+
+        Args:
+            levels: toxicity_level 필터 (여러 개면 OR).
+            category: 이 카테고리를 가진 댓글만.
+            sort: "seq"(결과 순서) | "score"(점수 높은 순) | "likes"(좋아요 많은 순).
+            cursor: 이전 페이지의 next_cursor.
+
+        Raises:
+            ValueError: sort 또는 cursor가 잘못된 경우.
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"지원하지 않는 정렬입니다: {sort} ({', '.join(SORT_COLUMNS)})")
+        column, direction = SORT_COLUMNS[sort]
+
+        where = ["t.result_id = ?"]
+        params: list = [result_id]
+        if levels:
+            where.append(f"t.toxicity_level IN ({', '.join('?' * len(levels))})")
+            params.extend(levels)
+        if category:
+            where.append(
+                "EXISTS (SELECT 1 FROM comment_categories c "
+                "WHERE c.result_id = t.result_id AND c.category = ? AND c.seq = t.seq)"
+            )
+            params.append(category)
+        if cursor:
+            value, seq = decode_cursor(cursor)
+            if column == "seq":
+                where.append("t.seq > ?")
+                params.append(seq)
+            else:
+                op = "<" if direction == "DESC" else ">"
+                where.append(f"(t.{column} {op} ? OR (t.{column} = ? AND t.seq > ?))")
+                params.extend([value, value, seq])
+
+        order = "t.seq ASC" if column == "seq" else f"t.{column} {direction}, t.seq ASC"
+        sql = (
+            f"SELECT t.*, x.text FROM tagged_comments t "
+            f"JOIN comment_texts x ON x.text_hash = t.text_hash WHERE {' AND '.join(where)} "
+            f"ORDER BY {order} LIMIT ?"
+        )
+        params.append(limit + 1)
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        items: list[TaggedComment] = []
+        for row in rows:
+            item = {col: row[col] for col in _COMMENT_COLUMNS}
+            item["categories"] = json.loads(row["categories"])
+            items.append(item)
+
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = encode_cursor(last[column], last["seq"])
+        return {"items": items, "next_cursor": next_cursor}
+
+
+result_store = ResultStore(settings.result_store_path)
@@ -0,0 +1,41 @@
+"""댓글 판정 저장소 (텍스트 해시 기준, 채널·실행 간 공유).
+
+`scripts/verdict_store.py`의 SQLite 저장소(`VERDICT_STORE_PATH`)를 연다.
+정규화한 댓글 텍스트의 해시로 Rule 판정(규칙 버전별)과 LLM 판정(모델별)을 찾으므로
+한 번 본 텍스트는 prescreen의 Rule 분석도, analyze의 Gemini 호출도 다시 하지 않는다.
+`collect_comments.py`와 같은 파일을 쓴다.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from backend.config import settings
+
+# scripts/ 모듈 import를 위해 경로 추가
+_scripts_dir = str(settings.project_root / "scripts")
+if _scripts_dir not in sys.path:
+    sys.path.insert(0, _scripts_dir)
+
+from verdict_store import (  # noqa: E402
+    VerdictStore,
+    analysis_record,
+    normalize_text,
+    score_comments,
+    text_hash,
+)
+
+# LLM 결과 dict(analyze 노드) 중 저장하는 판정 필드
+LLM_VERDICT_FIELDS = ("toxicity_score", "toxicity_level", "categories", "explanation", "suggestion")
+
+verdict_store = VerdictStore(settings.verdict_store_path)
+
+__all__ = [
+    "LLM_VERDICT_FIELDS",
+    "VerdictStore",
+    "analysis_record",
+    "normalize_text",
+    "score_comments",
+    "text_hash",
+    "verdict_store",
+]
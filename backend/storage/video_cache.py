@@ -0,0 +1,161 @@
+"""영상별 로컬 캐시: 댓글 + 자막 + 영상 메타데이터 + 댓글별 태깅 결과.
+
+디렉토리 구조 ({cache_dir}/videos/{video_id}/):
+    metadata.json   — 제목, 채널명, 워터마크(마지막으로 본 published_at), 수집 옵션
+    transcript.txt  — 자막 원문
+    comments.jsonl  — CommentRaw (append-only)
+    verdicts.jsonl  — 댓글별 태깅 결과 (append-only, 같은 comment_id는 뒤 레코드 우선)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Sequence, TypedDict
+
+from backend.config import settings
+from backend.graph.state import CommentRaw, TaggedComment
+from backend.graph.table import CommentTable
+
+# TaggedComment 중 댓글 원본(CommentRaw)이 아닌 태깅 필드
+_VERDICT_FIELDS = (
+    "toxicity_score",
+    "toxicity_level",
+    "categories",
+    "explanation",
+    "suggestion",
+    "analysis_source",
+)
+
+
+class CachedVideo(TypedDict):
+    """캐시에서 읽은 영상 데이터."""
+
+    video_id: str
+    video_title: str
+    channel_title: str
+    transcript: str
+    watermark: str
+    fetch: dict  # 수집 옵션, 순서(order), 영상 전체 수집 여부(complete)
+    tagged: CommentTable  # 판정 컬럼이 채워진 테이블
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _append_jsonl(path: Path, records: list[dict]) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class VideoCache:
+    """영상 단위 캐시 저장소."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._lock = threading.Lock()
+
+    def _dir(self, video_id: str) -> Path:
+        return self.root / "videos" / video_id
+
+    def load(self, video_id: str) -> CachedVideo | None:
+        """캐시된 영상 로드. 분석 이력이 없으면 None."""
+        video_dir = self._dir(video_id)
+        metadata_path = video_dir / "metadata.json"
+        if not metadata_path.exists():
+            return None
+
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+        transcript_path = video_dir / "transcript.txt"
+        transcript = transcript_path.read_text(encoding="utf-8") if transcript_path.exists() else ""
+
+        comments = {c["comment_id"]: c for c in _read_jsonl(video_dir / "comments.jsonl")}
+        verdicts = {v["comment_id"]: v for v in _read_jsonl(video_dir / "verdicts.jsonl")}
+
+        tagged: list[TaggedComment] = [
+            {**comment, **{k: verdicts[cid][k] for k in _VERDICT_FIELDS}}
+            for cid, comment in comments.items()
+            if cid in verdicts
+        ]
+
+        return {
+            "video_id": video_id,
+            "video_title": metadata.get("video_title", ""),
+            "channel_title": metadata.get("channel_title", ""),
+            "transcript": transcript,
+            "watermark": metadata.get("watermark", ""),
+            "fetch": metadata.get("fetch", {}),
+            "tagged": CommentTable.from_tagged(tagged),
+        }
+
+    def save(
+        self,
+        video_id: str,
+        video_title: str,
+        channel_title: str,
+        transcript: str,
+        tagged: CommentTable,
+        rows: Sequence[int],
+        fetch: dict,
+        rebuild: bool = False,
+    ) -> None:
+        """tagged 테이블의 rows(새로 태깅된 행)를 append하고 메타데이터/워터마크/수집 정보 갱신.
+
+        rebuild면 기존 댓글·판정을 지우고 rows로 새로 만든다 (전체 수집 결과).
+        """
+        video_dir = self._dir(video_id)
+        with self._lock:
+            video_dir.mkdir(parents=True, exist_ok=True)
+
+            metadata_path = video_dir / "metadata.json"
+            if rebuild:
+                # 메타데이터부터 지워서 중간에 멈추면 캐시 없음으로 보이게 한다
+                for name in ("metadata.json", "comments.jsonl", "verdicts.jsonl"):
+                    (video_dir / name).unlink(missing_ok=True)
+            metadata = (
+                json.loads(metadata_path.read_text(encoding="utf-8"))
+                if metadata_path.exists()
+                else {}
+            )
+
+            transcript_path = video_dir / "transcript.txt"
+            if transcript or not transcript_path.exists():
+                transcript_path.write_text(transcript, encoding="utf-8")
+
+            comments: list[CommentRaw] = []
+            verdicts: list[dict] = []
+            for i in rows:
+                comments.append(tagged.comment(i))
+                t = tagged.row(i)
+                verdicts.append({"comment_id": t["comment_id"], **{k: t[k] for k in _VERDICT_FIELDS}})
+
+            _append_jsonl(video_dir / "comments.jsonl", comments)
+            _append_jsonl(video_dir / "verdicts.jsonl", verdicts)
+
+            # 워터마크: 지금까지 본 최상위 댓글의 최신 published_at
+            top_level = [c["published_at"] for c in comments if not c.get("parent_id")]
+            watermark = max([metadata.get("watermark", ""), *top_level])
+
+            metadata.update({
+                "video_id": video_id,
+                "video_title": video_title or metadata.get("video_title", ""),
+                "channel_title": channel_title or metadata.get("channel_title", ""),
+                "watermark": watermark,
+                "comment_count": metadata.get("comment_count", 0) + len(comments),
+                "fetch": fetch,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            })
+            tmp_path = metadata_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(metadata, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp_path, metadata_path)
+
+
+video_cache = VideoCache(settings.cache_dir)
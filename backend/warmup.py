@@ -0,0 +1,55 @@
+"""서버 시작 시 워밍업.
+
+첫 요청이 regex 엔진 초기화, 프롬프트 템플릿 로드, LLM 클라이언트 생성 비용을
+떠안지 않도록 미리 한 번씩 실행해 둔다.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rule 엔진 전 규칙 그룹을 한 번씩 거치도록 만든 샘플
+_WARMUP_COMMENTS = [
+    "ㅅㅂ 시1발 병신 와 진짜 잘하신다~ㅋㅋ 호구 죽어 못생겼다 한심하다",
+    "그러니까 망하지 빠순이 한남 빨갱이 꼰대 촌놈 구독해주세요 https://x.y",
+    "영상 잘 봤습니다",
+]
+
+
+def warm_up() -> dict[str, float]:
+    """Rule 엔진 / 프롬프트 템플릿 / LLM 클라이언트 워밍업.
+
+    Returns:
+        단계별 소요 시간 (ms).
+    """
+    timings: dict[str, float] = {}
+
+    start = time.perf_counter()
+    from backend.graph.nodes.prescreen import analyze_comment
+
+    for text in _WARMUP_COMMENTS:
+        analyze_comment(text)
+    timings["rule_engine_ms"] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    from backend.prompts import build_user_prompt
+
+    build_user_prompt("워밍업", "워밍업 자막", video_title="워밍업", rule_categories=["PROFANITY"])
+    build_user_prompt("워밍업")
+    timings["prompts_ms"] = (time.perf_counter() - start) * 1000
+
+    if settings.google_api_key:
+        start = time.perf_counter()
+        from backend.llm.gemini import get_tagging_llm
+
+        get_tagging_llm()
+        timings["llm_client_ms"] = (time.perf_counter() - start) * 1000
+    else:
+        logger.warning("GOOGLE_API_KEY 없음 — LLM 클라이언트 워밍업 생략")
+
+    return {k: round(v, 1) for k, v in timings.items()}
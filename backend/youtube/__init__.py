@@ -0,0 +1,22 @@
+"""YouTube Data API 비동기 클라이언트 모듈.
+
+googleapiclient의 blocking execute() 대신 커넥션 풀을 공유하는
+httpx.AsyncClient로 videos.list / commentThreads.list를 호출한다.
+sync 경로의 googleapiclient 클라이언트는 `InstrumentedClient`로 감싸 같은 메트릭을 남긴다.
+"""
+
+from backend.youtube.client import (
+    AsyncYouTubeClient,
+    YouTubeAPIError,
+    close_async_youtube_client,
+    get_async_youtube_client,
+)
+from backend.youtube.instrument import InstrumentedClient
+
+__all__ = [
+    "AsyncYouTubeClient",
+    "InstrumentedClient",
+    "YouTubeAPIError",
+    "close_async_youtube_client",
+    "get_async_youtube_client",
+]
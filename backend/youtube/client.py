@@ -0,0 +1,178 @@
+"""httpx 기반 YouTube Data API v3 비동기 클라이언트.
+
+프로세스 전역에서 하나의 AsyncClient(커넥션 풀)를 재사용한다.
+일시적 오류(429/5xx/네트워크)는 지수 백오프로 재시도하고,
+그 외 오류는 YouTubeAPIError로 올려 호출부가 처리 방식을 결정한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import httpx
+
+from backend.config import settings
+from backend.profiling import span
+from backend.youtube.instrument import TRANSPORT_ERROR, record_failure, record_request
+
+logger = logging.getLogger(__name__)
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class YouTubeAPIError(Exception):
+    """YouTube Data API 오류 응답.
+
+    메시지에 reason(commentsDisabled, quotaExceeded 등)을 포함하므로
+    googleapiclient HttpError와 같은 문자열 검사로 분기할 수 있다.
+    """
+
+    def __init__(self, status_code: int, reason: str, message: str):
+        self.status_code = status_code
+        self.reason = reason
+        super().__init__(f"HTTP {status_code} {reason}: {message}")
+
+
+def _parse_error(resp: httpx.Response) -> YouTubeAPIError:
+    """오류 응답 본문에서 reason/message 추출."""
+    reason, message = "", resp.reason_phrase
+    try:
+        error = resp.json().get("error", {})
+        message = error.get("message", message)
+        errors = error.get("errors") or [{}]
+        reason = errors[0].get("reason", "")
+    except ValueError:
+        pass
+    if resp.status_code == 403 and not reason:
+        reason = "forbidden"
+    return YouTubeAPIError(resp.status_code, reason, message)
+
+
+class AsyncYouTubeClient:
+    """API 키 하나에 묶인 YouTube Data API 비동기 클라이언트."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str | None = None,
+        max_retries: int | None = None,
+        timeout: float = 15.0,
+    ):
+        self.api_key = api_key
+        self.max_retries = settings.youtube_max_retries if max_retries is None else max_retries
+        self._http = httpx.AsyncClient(
+            base_url=base_url or settings.youtube_api_base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+
+    async def get(self, resource: str, **params) -> dict:
+        """`GET {base_url}/{resource}` 호출. None 값 파라미터는 제외."""
+        with span(f"youtube:{resource}") as page_span:
+            resp = await self._get(resource, params)
+            if page_span is not None:
+                page_span.attrs["items"] = len(resp.get("items", []))
+            return resp
+
+    async def _get(self, resource: str, params: dict) -> dict:
+        query = {k: v for k, v in params.items() if v is not None}
+        query["key"] = self.api_key
+
+        attempt = 0
+        while True:
+            try:
+                resp = await self._http.get(f"/{resource}", params=query)
+            except httpx.TransportError as e:
+                record_request(resource, TRANSPORT_ERROR)
+                if attempt >= self.max_retries:
+                    record_failure(resource, TRANSPORT_ERROR)
+                    raise
+                logger.warning("YouTube API 네트워크 오류 (%s), 재시도 %d: %s", resource, attempt + 1, e)
+            else:
+                record_request(resource, resp.status_code)
+                if resp.status_code == 200:
+                    return resp.json()
+                if resp.status_code not in _RETRY_STATUS or attempt >= self.max_retries:
+                    error = _parse_error(resp)
+                    record_failure(resource, error.reason or str(resp.status_code))
+                    raise error
+                logger.warning("YouTube API %d (%s), 재시도 %d", resp.status_code, resource, attempt + 1)
+
+            await asyncio.sleep(0.5 * 2**attempt)
+            attempt += 1
+
+    async def list_videos(self, video_id: str, part: str = "snippet") -> list[dict]:
+        """videos.list — 영상 리소스 목록."""
+        resp = await self.get("videos", part=part, id=video_id)
+        return resp.get("items", [])
+
+    async def list_comment_threads(
+        self,
+        video_id: str,
+        max_results: int = 100,
+        page_token: str | None = None,
+        order: str = "relevance",
+        part: str = "snippet",
+    ) -> dict:
+        """commentThreads.list — 한 페이지 응답 그대로 반환."""
+        return await self.get(
+            "commentThreads",
+            part=part,
+            videoId=video_id,
+            maxResults=max_results,
+            order=order,
+            textFormat="plainText",
+            pageToken=page_token,
+        )
+
+    async def list_comments(
+        self,
+        parent_id: str,
+        max_results: int = 100,
+        page_token: str | None = None,
+    ) -> dict:
+        """comments.list — 특정 스레드의 답글 한 페이지."""
+        return await self.get(
+            "comments",
+            part="snippet",
+            parentId=parent_id,
+            maxResults=max_results,
+            textFormat="plainText",
+            pageToken=page_token,
+        )
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+
+# ─── 프로세스 전역 클라이언트 ────────────────────────────────
+
+_client: AsyncYouTubeClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_async_youtube_client() -> AsyncYouTubeClient:
+    """현재 이벤트 루프에서 재사용할 AsyncYouTubeClient.
+
+    httpx 커넥션 풀은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다.
+    """
+    global _client, _client_loop
+
+    if not settings.youtube_api_key:
+        raise ValueError("YOUTUBE_API_KEY가 설정되지 않았습니다.")
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop or _client.api_key != settings.youtube_api_key:
+        _client = AsyncYouTubeClient(settings.youtube_api_key)
+        _client_loop = loop
+    return _client
+
+
+async def close_async_youtube_client() -> None:
+    """전역 클라이언트의 커넥션 풀 정리 (서버 종료 시)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -0,0 +1,93 @@
+"""YouTube Data API 호출 계측 (sync / async 공용).
+
+`record_request` / `record_failure`가 요청·실패 메트릭을 한 곳에서 기록한다.
+async 경로(`AsyncYouTubeClient`)는 HTTP 시도마다 직접 부르고,
+sync 경로(googleapiclient)는 `InstrumentedClient`로 감싸 `execute()`마다 기록한다.
+googleapiclient는 재시도하지 않으므로(num_retries=0) sync 경로의 실패 요청은 곧 최종 실패다.
+"""
+
+from __future__ import annotations
+
+from backend.metrics import YOUTUBE_API_ERRORS, YOUTUBE_API_REQUESTS
+from backend.profiling import span
+
+TRANSPORT_ERROR = "transport_error"
+
+
+def record_request(resource: str, status: int | str) -> None:
+    """HTTP 시도 한 번 (재시도 포함)."""
+    YOUTUBE_API_REQUESTS.inc(resource=resource, status=str(status))
+
+
+def record_failure(resource: str, reason: str) -> None:
+    """재시도 후에도 실패한 호출 한 번."""
+    YOUTUBE_API_ERRORS.inc(resource=resource, reason=reason)
+
+
+def _http_error_status(error: Exception) -> tuple[int | str, str]:
+    """googleapiclient 예외 → (status, reason). HttpError가 아니면 네트워크 오류."""
+    from googleapiclient.errors import HttpError
+
+    if not isinstance(error, HttpError):
+        return TRANSPORT_ERROR, TRANSPORT_ERROR
+    status = error.resp.status
+    details = error.error_details
+    reason = ""
+    if isinstance(details, list) and details and isinstance(details[0], dict):
+        reason = details[0].get("reason", "")
+    if status == 403 and not reason:
+        reason = "forbidden"
+    return status, reason or str(status)
+
+
+class _InstrumentedRequest:
+    def __init__(self, request, resource: str):
+        self._request = request
+        self._resource = resource
+
+    def execute(self, *args, **kwargs):
+        with span(f"youtube:{self._resource}") as page_span:
+            try:
+                resp = self._request.execute(*args, **kwargs)
+            except Exception as e:
+                status, reason = _http_error_status(e)
+                record_request(self._resource, status)
+                record_failure(self._resource, reason)
+                raise
+            record_request(self._resource, 200)
+            if page_span is not None:
+                page_span.attrs["items"] = len(resp.get("items", []))
+            return resp
+
+
+class _InstrumentedResource:
+    def __init__(self, resource, name: str):
+        self._resource = resource
+        self._name = name
+
+    def __getattr__(self, method: str):
+        factory = getattr(self._resource, method)
+
+        def build_request(*args, **kwargs):
+            return _InstrumentedRequest(factory(*args, **kwargs), self._name)
+
+        return build_request
+
+
+class InstrumentedClient:
+    """googleapiclient youtube 서비스 래퍼. `execute()`마다 메트릭과 span을 남긴다.
+
+    `youtube.commentThreads().list(...).execute()` 모양 그대로 쓴다.
+    resource 라벨은 async 경로와 같은 리소스 이름(commentThreads, videos, comments …)이다.
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name: str):
+        factory = getattr(self._client, name)
+
+        def build_resource(*args, **kwargs):
+            return _InstrumentedResource(factory(*args, **kwargs), name)
+
+        return build_resource
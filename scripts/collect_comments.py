@@ -9,6 +9,23 @@ Usage:
     python scripts/collect_comments.py --channel "침착맨"   # 특정 채널만
     python scripts/collect_comments.py --guide              # API 키 발급 안내
     python scripts/collect_comments.py --stats              # 수집 통계 조회
+    python scripts/collect_comments.py --plan               # 오늘 할당량으로 수집할 채널 계획
+    python scripts/collect_comments.py --workers 8 --channel-workers 2   # 병렬 수집
+
+With ``--workers``/``--channel-workers`` videos (and channels) are collected
+on bounded thread pools. All threads share one rate limiter and one quota
+ledger.
+
+Output goes to scripts/data/{channel}/ as append-only JSONL, committed
+video by video (see ``collection_store``): a rerun skips videos that are
+already in the manifest, ``--fresh`` starts the channel over.
+``python scripts/corpus.py convert`` turns it into a compressed columnar
+corpus for corpus-wide scans.
+
+Rule verdicts are looked up in the content-addressed verdict store shared
+with the backend (``verdict_store``, .cache/verdicts.db or
+$VERDICT_STORE_PATH) before scoring: a text seen before in any channel or
+run is not analyzed again.
 """
 
 from __future__ import annotations
@@ -18,16 +35,27 @@ import io
 import json
 import os
 import sys
-import time
-from datetime import datetime, timezone
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Iterator
 
 # Windows cp949 인코딩 문제 방지
 if sys.stdout.encoding != "utf-8":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
 
-from dotenv import load_dotenv
+from collection_store import ChannelStore
+from youtube_quota import (
+    DEFAULT_DAILY_BUDGET,
+    DISCOVERY_MODES,
+    MeteredClient,
+    QuotaAccountant,
+    QuotaExceededError,
+    RateLimiter,
+    estimate_channel_cost,
+    plan_collection,
+)
 
 # ─── Paths ─────────────────────────────────────────────────────────
 
@@ -35,8 +63,19 @@ SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 CHANNELS_FILE = SCRIPT_DIR / "channels.json"
 DATA_DIR = SCRIPT_DIR / "data"
+QUOTA_FILE = DATA_DIR / "quota.json"
+# Shared with the backend pipeline (VERDICT_STORE_PATH overrides both)
+VERDICT_STORE = PROJECT_ROOT / ".cache" / "verdicts.db"
 
-load_dotenv(PROJECT_ROOT / ".env")
+# Default request rate shared by all collection threads (requests/second)
+DEFAULT_RATE = 10.0
+
+
+def load_env() -> None:
+    """Load PROJECT_ROOT/.env. Deferred so --stats/--guide skip importing dotenv."""
+    from dotenv import load_dotenv
+
+    load_dotenv(PROJECT_ROOT / ".env")
 
 
 # ─── API Guide ─────────────────────────────────────────────────────
@@ -62,20 +101,62 @@ API_GUIDE = """
      YOUTUBE_API_KEY=AIzaSy...your_key_here
 
   ---------------------------------------------------------------
-  무료 할당량: 일일 10,000 units
-  채널 1개 (50영상 x 100댓글) = 약 3,000 units
-  하루에 약 3개 채널 수집 가능
+  무료 할당량: 일일 10,000 units (태평양 시간 자정 리셋)
+  search.list = 100 units, 그 외 list 호출 = 1 unit
+  채널 1개 (50영상 x 100댓글)
+    --discovery search   : 약 150 units (search.list 100 포함)
+    --discovery playlist : 약 50 units (업로드 재생목록, 기본값)
+  channelId가 없으면 핸들 조회 실패 시 search.list(100)를 쓰므로 예산은 +101 units로 잡음
+  사용량은 scripts/data/quota.json에 기록되며 --budget으로 예산 조정
 ================================================================
 """
 
 
 # ─── YouTube API Client ───────────────────────────────────────────
 
+_client_local = threading.local()
+
+
 def build_youtube_client(api_key: str):
-    """Build YouTube Data API v3 client."""
-    from googleapiclient.discovery import build
+    """Build (or reuse) a YouTube Data API v3 client.
+
+    The client is built once per thread and API key from the discovery
+    document bundled with google-api-python-client (``static_discovery``),
+    so repeated calls skip fetching/parsing the discovery document.
+    Caching is per thread because the underlying httplib2 transport is not
+    thread-safe.
+    """
+    clients: dict = getattr(_client_local, "clients", None)
+    if clients is None:
+        clients = _client_local.clients = {}
+
+    client = clients.get(api_key)
+    if client is None:
+        from googleapiclient.discovery import build
+
+        client = build(
+            "youtube",
+            "v3",
+            developerKey=api_key,
+            static_discovery=True,
+            cache_discovery=False,
+        )
+        clients[api_key] = client
+    return client
 
-    return build("youtube", "v3", developerKey=api_key)
+
+class ThreadLocalClient:
+    """Client proxy that forwards to the calling thread's own client.
+
+    Lets a single ``MeteredClient`` be shared by collection threads while
+    every thread keeps its own httplib2 transport (see ``build_youtube_client``).
+    """
+
+    def __init__(self, api_key: str):
+        self._api_key = api_key
+
+    def __getattr__(self, name: str):
+        return getattr(build_youtube_client(self._api_key), name)
 
 
 def resolve_channel_id(youtube, handle: str) -> str | None:
@@ -91,6 +172,8 @@ def resolve_channel_id(youtube, handle: str) -> str | None:
         ).execute()
         if resp.get("items"):
             return resp["items"][0]["id"]
+    except QuotaExceededError:
+        raise
     except Exception:
         pass
 
@@ -104,6 +187,8 @@ def resolve_channel_id(youtube, handle: str) -> str | None:
         ).execute()
         if resp.get("items"):
             return resp["items"][0]["snippet"]["channelId"]
+    except QuotaExceededError:
+        raise
     except Exception:
         pass
 
@@ -130,8 +215,21 @@ def get_channel_info(youtube, channel_id: str) -> dict:
     }
 
 
-def get_recent_videos(youtube, channel_id: str, max_videos: int = 50) -> list[dict]:
-    """Fetch recent video IDs from a channel."""
+def get_recent_videos(
+    youtube, channel_id: str, max_videos: int = 50, discovery: str = "playlist"
+) -> list[dict]:
+    """Fetch recent video IDs from a channel.
+
+    ``discovery="playlist"`` reads the channel's uploads playlist
+    (playlistItems.list, 1 unit per page); ``"search"`` uses search.list
+    (100 units per page).
+    """
+    if discovery == "search":
+        return _search_recent_videos(youtube, channel_id, max_videos)
+    return _playlist_recent_videos(youtube, channel_id, max_videos)
+
+
+def _search_recent_videos(youtube, channel_id: str, max_videos: int) -> list[dict]:
     videos: list[dict] = []
     page_token = None
 
@@ -161,6 +259,40 @@ def get_recent_videos(youtube, channel_id: str, max_videos: int = 50) -> list[di
     return videos[:max_videos]
 
 
+def _playlist_recent_videos(youtube, channel_id: str, max_videos: int) -> list[dict]:
+    # The uploads playlist ID is the channel ID with "UC" replaced by "UU",
+    # which saves a channels.list(part=contentDetails) call.
+    uploads_id = "UU" + channel_id[2:]
+    videos: list[dict] = []
+    page_token = None
+
+    while len(videos) < max_videos:
+        per_page = min(50, max_videos - len(videos))
+        resp = youtube.playlistItems().list(
+            part="snippet,contentDetails",
+            playlistId=uploads_id,
+            maxResults=per_page,
+            pageToken=page_token,
+        ).execute()
+
+        for item in resp.get("items", []):
+            details = item["contentDetails"]
+            # Private/deleted uploads have no videoPublishedAt
+            if "videoPublishedAt" not in details:
+                continue
+            videos.append({
+                "videoId": details["videoId"],
+                "title": item["snippet"]["title"],
+                "publishedAt": details["videoPublishedAt"],
+            })
+
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            break
+
+    return videos[:max_videos]
+
+
 def get_video_stats(youtube, video_ids: list[str]) -> dict[str, dict]:
     """Fetch view/comment counts for multiple videos (batch of 50)."""
     stats: dict[str, dict] = {}
@@ -182,58 +314,277 @@ def get_video_stats(youtube, video_ids: list[str]) -> dict[str, dict]:
     return stats
 
 
-def fetch_comments(
-    youtube, video_id: str, max_comments: int = 100
-) -> list[dict]:
-    """Fetch comments for a video."""
-    comments: list[dict] = []
+def is_comments_unavailable(error_msg: str) -> bool:
+    """Whether a commentThreads error means "stop paging", not "fail".
+
+    Disabled comments and forbidden (private/age-restricted) videos simply
+    yield whatever was collected so far.
+    """
+    return "commentsDisabled" in error_msg or "forbidden" in error_msg.lower()
+
+
+def parse_comment(comment: dict) -> dict:
+    """Convert a comment resource into a compact comment record."""
+    snippet = comment["snippet"]
+    record = {
+        "commentId": comment["id"],
+        "author": snippet["authorDisplayName"],
+        "text": snippet["textDisplay"],
+        "publishedAt": snippet["publishedAt"],
+        "likeCount": snippet.get("likeCount", 0),
+    }
+    if snippet.get("parentId"):
+        record["parentId"] = snippet["parentId"]
+    return record
+
+
+def parse_comment_thread(item: dict) -> dict:
+    """Convert a commentThreads item into a compact comment record."""
+    return parse_comment(item["snippet"]["topLevelComment"])
+
+
+def iter_thread_replies(
+    youtube, item: dict, max_replies: int = 100
+) -> Iterator[dict]:
+    """Yield reply records for a commentThreads item.
+
+    Uses the replies embedded in the thread (at most 5) when they are
+    complete, otherwise pages through ``comments.list(parentId=...)``.
+    """
+    total = item["snippet"].get("totalReplyCount", 0)
+    if total == 0 or max_replies <= 0:
+        return
+
+    inline = item.get("replies", {}).get("comments", [])
+    if len(inline) >= total:
+        for reply in inline[:max_replies]:
+            yield parse_comment(reply)
+        return
+
+    count = 0
+    page_token = None
+    while count < max_replies:
+        try:
+            resp = youtube.comments().list(
+                part="snippet",
+                parentId=item["id"],
+                maxResults=min(100, max_replies - count),
+                textFormat="plainText",
+                pageToken=page_token,
+            ).execute()
+        except Exception as e:
+            if is_comments_unavailable(str(e)):
+                break
+            raise
+
+        for reply in resp.get("items", []):
+            yield parse_comment(reply)
+            count += 1
+
+        page_token = resp.get("nextPageToken")
+        if not page_token:
+            break
+
+
+def iter_comments(
+    youtube,
+    video_id: str,
+    max_comments: int = 100,
+    include_replies: bool = False,
+    max_replies_per_thread: int = 100,
+    order: str = "relevance",
+    stop_at: str | None = None,
+) -> Iterator[dict]:
+    """Yield compact comment records for a video, page by page.
+
+    Each API item is converted as soon as it arrives, so only one page of
+    raw responses is alive at a time. Replies (when requested) follow their
+    top-level comment and count towards ``max_comments``.
+
+    With ``order="time"`` and ``stop_at`` (an ISO-8601 ``publishedAt``),
+    paging stops at the first thread published at or before ``stop_at``.
+    """
+    count = 0
     page_token = None
+    part = "snippet,replies" if include_replies else "snippet"
 
-    while len(comments) < max_comments:
-        per_page = min(100, max_comments - len(comments))
+    while count < max_comments:
+        per_page = min(100, max_comments - count)
         try:
             resp = youtube.commentThreads().list(
-                part="snippet",
+                part=part,
                 videoId=video_id,
                 maxResults=per_page,
-                order="relevance",
+                order=order,
                 textFormat="plainText",
                 pageToken=page_token,
             ).execute()
         except Exception as e:
-            error_msg = str(e)
-            if "commentsDisabled" in error_msg:
-                break
-            if "forbidden" in error_msg.lower():
+            if is_comments_unavailable(str(e)):
                 break
             raise
 
         for item in resp.get("items", []):
-            snippet = item["snippet"]["topLevelComment"]["snippet"]
-            comments.append({
-                "commentId": item["snippet"]["topLevelComment"]["id"],
-                "author": snippet["authorDisplayName"],
-                "text": snippet["textDisplay"],
-                "publishedAt": snippet["publishedAt"],
-                "likeCount": snippet.get("likeCount", 0),
-            })
+            if count >= max_comments:
+                return
+            comment = parse_comment_thread(item)
+            if stop_at and comment["publishedAt"] <= stop_at:
+                return
+            yield comment
+            count += 1
+
+            if include_replies:
+                budget = min(max_replies_per_thread, max_comments - count)
+                for reply in iter_thread_replies(youtube, item, budget):
+                    yield reply
+                    count += 1
 
         page_token = resp.get("nextPageToken")
         if not page_token:
             break
 
-    return comments
+
+def fetch_comments(
+    youtube, video_id: str, max_comments: int = 100
+) -> list[dict]:
+    """Fetch comments for a video."""
+    return list(iter_comments(youtube, video_id, max_comments))
 
 
 # ─── Collection Pipeline ──────────────────────────────────────────
 
+_print_lock = threading.Lock()
+
+
+def log(message: str = "", prefix: str = "") -> None:
+    """Print a (multi-line) message atomically, each line with ``prefix``.
+
+    Collection threads share stdout, so progress is only ever printed as
+    whole lines.
+    """
+    lines = [f"{prefix}{line}" if line else "" for line in message.split("\n")]
+    with _print_lock:
+        print("\n".join(lines), flush=True)
+
+
+def collect_video(
+    youtube, video: dict, video_stat: dict, max_comments: int, verdicts=None
+) -> tuple[dict, str | None]:
+    """Fetch and analyze one video's comments.
+
+    Texts already in the ``verdicts`` store (if given) reuse their stored
+    analysis. Returns the video record and an error message (None on
+    success); a failed fetch yields a record without comments. Quota errors
+    propagate.
+    """
+    from verdict_store import score_comments
+
+    error = None
+    try:
+        comments = fetch_comments(youtube, video["videoId"], max_comments)
+    except QuotaExceededError:
+        raise
+    except Exception as e:
+        error = str(e)
+        comments = []
+
+    _, analyses, _ = score_comments(
+        verdicts, [c["text"] for c in comments], [c["commentId"] for c in comments]
+    )
+    analyzed_comments = [
+        {**comment, "analysis": analysis} for comment, analysis in zip(comments, analyses)
+    ]
+
+    record = {
+        "videoId": video["videoId"],
+        "title": video["title"],
+        "publishedAt": video["publishedAt"],
+        "viewCount": video_stat.get("viewCount", 0),
+        "commentCount": video_stat.get("commentCount", 0),
+        "comments": analyzed_comments,
+    }
+    return record, error
+
+
+def collect_videos(
+    youtube,
+    videos: list[dict],
+    stats: dict[str, dict],
+    max_comments: int,
+    on_video,
+    workers: int = 1,
+    verbose: bool = True,
+    prefix: str = "",
+    verdicts=None,
+) -> list[str]:
+    """Collect every video on a pool of ``workers`` threads.
+
+    ``on_video(record)`` is called from the calling thread as each video
+    completes successfully, so records are never all held in memory at
+    once. Videos whose fetch failed are not passed to ``on_video`` (so they
+    are not committed as finished and the next run retries them); their
+    IDs are returned. On QuotaExceededError, videos not yet started are
+    cancelled and the error is re-raised once running ones have finished.
+    """
+    done = 0
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        futures = [
+            pool.submit(
+                collect_video,
+                youtube,
+                video,
+                stats.get(video["videoId"], {}),
+                max_comments,
+                verdicts,
+            )
+            for video in videos
+        ]
+        try:
+            for future in as_completed(futures):
+                record, error = future.result()
+                if error is None:
+                    on_video(record)
+                else:
+                    failed.append(record["videoId"])
+                done += 1
+                if verbose:
+                    title = record["title"][:40]
+                    if error:
+                        status = f"✗ ({error})"
+                    else:
+                        comments = record["comments"]
+                        toxic = sum(1 for c in comments if c["analysis"]["toxicityScore"] >= 30)
+                        status = f"✓ {len(comments)}개 댓글 (독성: {toxic}개)"
+                    log(f"        [{done}/{len(videos)}] {title}... {status}", prefix)
+        except BaseException:
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+    return failed
+
+
 def collect_channel(
     youtube,
     channel_config: dict,
     verbose: bool = True,
+    discovery: str = "playlist",
+    workers: int = 1,
+    prefix: str = "",
+    fresh: bool = False,
+    verdicts=None,
 ) -> dict:
-    """Full collection pipeline for a single channel."""
-    from korean_profanity import analyze_comment, CATEGORIES
+    """Full collection pipeline for a single channel.
+
+    Each finished video is committed to the channel's append-only output
+    right away; videos committed by an earlier run are skipped unless
+    ``fresh``. Videos whose fetch failed are not committed and are retried
+    by the next run. ``workers`` videos are collected concurrently; ``prefix`` is
+    prepended to every progress line (used when several channels run at
+    once). ``verdicts`` is the shared ``VerdictStore`` (None: analyze every
+    comment). Returns the channel metadata ({} if the channel was not found).
+    """
+    from korean_profanity import CATEGORIES, ruleset_version
 
     name = channel_config["name"]
     handle = channel_config["handle"]
@@ -241,168 +592,108 @@ def collect_channel(
     max_comments = channel_config.get("max_comments_per_video", 100)
 
     if verbose:
-        print(f"\n{'='*60}")
-        print(f"  채널 수집 시작: {name} ({handle})")
-        print(f"{'='*60}")
+        log(f"\n{'='*60}\n  채널 수집 시작: {name} ({handle})\n{'='*60}", prefix)
 
     # 1. Resolve channel ID (use pre-configured channelId if available)
     channel_id = channel_config.get("channelId")
     if not channel_id:
         if verbose:
-            print(f"  [1/5] 채널 ID 조회 중...")
+            log(f"  [1/5] 채널 ID 조회 중...", prefix)
         channel_id = resolve_channel_id(youtube, handle)
         if not channel_id:
-            print(f"  x 채널을 찾을 수 없습니다: {handle}")
+            log(f"  x 채널을 찾을 수 없습니다: {handle}", prefix)
             return {}
     elif verbose:
-        print(f"  [1/5] 채널 ID: {channel_id}")
+        log(f"  [1/5] 채널 ID: {channel_id}", prefix)
 
     # 2. Get channel info
     if verbose:
-        print(f"  [2/5] 채널 정보 조회 중...")
+        log(f"  [2/5] 채널 정보 조회 중...", prefix)
     channel_info = get_channel_info(youtube, channel_id)
     if verbose:
-        print(f"        구독자: {channel_info['subscriberCount']:,}명")
+        log(f"        구독자: {channel_info['subscriberCount']:,}명", prefix)
 
     # 3. Get recent videos
     if verbose:
-        print(f"  [3/5] 최근 영상 {max_videos}개 조회 중...")
-    videos = get_recent_videos(youtube, channel_id, max_videos)
+        log(f"  [3/5] 최근 영상 {max_videos}개 조회 중...", prefix)
+    videos = get_recent_videos(youtube, channel_id, max_videos, discovery)
     if verbose:
-        print(f"        발견: {len(videos)}개 영상")
+        log(f"        발견: {len(videos)}개 영상", prefix)
+
+    # Skip videos already committed by an earlier run
+    store = ChannelStore(
+        channel_dir(name), CATEGORIES, fresh=fresh, rules_version=ruleset_version()
+    )
+    store.set_channel(channel_info)
+    pending = [v for v in videos if v["videoId"] not in store.finished]
+    if verbose and len(pending) < len(videos):
+        log(f"        이미 수집됨: {len(videos) - len(pending)}개 영상 (건너뜀)", prefix)
 
     # 4. Get video stats
-    video_ids = [v["videoId"] for v in videos]
+    video_ids = [v["videoId"] for v in pending]
     stats = get_video_stats(youtube, video_ids)
 
-    # 5. Collect comments for each video
+    # 5. Collect comments for each video (rate limited by the shared client)
     if verbose:
-        print(f"  [4/5] 댓글 수집 및 분석 중...")
-
-    total_comments = 0
-    toxic_comments = 0
-    category_counts: dict[str, int] = {cat: 0 for cat in CATEGORIES}
-    total_score = 0
-    video_results: list[dict] = []
-
-    for i, video in enumerate(videos):
-        vid = video["videoId"]
-        video_stat = stats.get(vid, {})
-
-        if verbose:
-            progress = f"[{i+1}/{len(videos)}]"
-            print(f"        {progress} {video['title'][:40]}...", end="", flush=True)
-
-        try:
-            comments = fetch_comments(youtube, vid, max_comments)
-        except Exception as e:
-            if verbose:
-                print(f" ✗ ({e})")
-            comments = []
-
-        analyzed_comments: list[dict] = []
-        for comment in comments:
-            analysis = analyze_comment(comment["text"])
-            comment_data = {
-                **comment,
-                "analysis": {
-                    "toxicityScore": analysis.toxicity_score,
-                    "matchedCategories": analysis.matched_categories,
-                    "matchedPatterns": analysis.matched_patterns,
-                    "matchedRules": analysis.matched_rules,
-                },
-            }
-            analyzed_comments.append(comment_data)
-
-            total_comments += 1
-            if analysis.is_toxic:
-                toxic_comments += 1
-            total_score += analysis.toxicity_score
-            for cat in analysis.matched_categories:
-                category_counts[cat] = category_counts.get(cat, 0) + 1
-
-        video_results.append({
-            "videoId": vid,
-            "title": video["title"],
-            "publishedAt": video["publishedAt"],
-            "viewCount": video_stat.get("viewCount", 0),
-            "commentCount": video_stat.get("commentCount", 0),
-            "comments": analyzed_comments,
-        })
+        log(f"  [4/5] 댓글 수집 및 분석 중... (workers={workers})", prefix)
+    failed = collect_videos(
+        youtube,
+        pending,
+        stats,
+        max_comments,
+        store.append_video,
+        workers=workers,
+        verbose=verbose,
+        prefix=prefix,
+        verdicts=verdicts,
+    )
+    if failed:
+        log(f"        실패: {len(failed)}개 영상 (저장하지 않음, 다음 실행에서 다시 수집)", prefix)
 
-        if verbose:
-            toxic_in_video = sum(
-                1 for c in analyzed_comments if c["analysis"]["toxicityScore"] >= 30
-            )
-            print(f" ✓ {len(comments)}개 댓글 (독성: {toxic_in_video}개)")
-
-        # Rate limiting: small delay between requests
-        time.sleep(0.1)
-
-    # 6. Build result
-    avg_score = total_score / total_comments if total_comments > 0 else 0
-    toxic_pct = (toxic_comments / total_comments * 100) if total_comments > 0 else 0
-
-    result = {
-        "channel": channel_info,
-        "collectedAt": datetime.now(timezone.utc).isoformat(),
-        "totalComments": total_comments,
-        "toxicComments": toxic_comments,
-        "videos": video_results,
-        "statistics": {
-            "categoryDistribution": category_counts,
-            "averageToxicityScore": round(avg_score, 1),
-            "toxicPercentage": round(toxic_pct, 1),
-        },
-    }
+    # 6. Summary of everything committed for this channel
+    result = store.metadata()
 
     if verbose:
-        print(f"\n  [5/5] 결과 요약")
-        print(f"        총 댓글: {total_comments:,}개")
-        print(f"        독성 댓글: {toxic_comments:,}개 ({toxic_pct:.1f}%)")
-        print(f"        평균 독성 점수: {avg_score:.1f}")
-        print(f"        카테고리 분포:")
-        for cat, count in sorted(category_counts.items(), key=lambda x: -x[1]):
+        statistics = result["statistics"]
+        lines = [
+            f"\n  [5/5] 결과 요약 (저장: {store.dir})",
+            f"        영상: {result['videoCount']:,}개",
+            f"        총 댓글: {result['totalComments']:,}개",
+            f"        독성 댓글: {result['toxicComments']:,}개 ({statistics['toxicPercentage']:.1f}%)",
+            f"        평균 독성 점수: {statistics['averageToxicityScore']:.1f}",
+            f"        카테고리 분포:",
+        ]
+        for cat, count in sorted(statistics["categoryDistribution"].items(), key=lambda x: -x[1]):
             if count > 0:
-                print(f"          {cat}: {count}")
+                lines.append(f"          {cat}: {count}")
+        log("\n".join(lines), prefix)
 
     return result
 
 
-def save_result(channel_name: str, result: dict) -> Path:
-    """Save collection result as JSON."""
-    # Sanitize directory name
+def channel_dir(channel_name: str) -> Path:
+    """Output directory for a channel (name sanitized for the filesystem)."""
     safe_name = "".join(c if c.isalnum() or c in "._- " else "_" for c in channel_name)
-    channel_dir = DATA_DIR / safe_name
-    channel_dir.mkdir(parents=True, exist_ok=True)
-
-    output_path = channel_dir / "comments.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
-
-    # Also save metadata separately for quick reference
-    metadata = {
-        "channel": result.get("channel", {}),
-        "collectedAt": result.get("collectedAt"),
-        "totalComments": result.get("totalComments", 0),
-        "toxicComments": result.get("toxicComments", 0),
-        "statistics": result.get("statistics", {}),
-    }
-    metadata_path = channel_dir / "metadata.json"
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
-
-    return output_path
+    return DATA_DIR / safe_name
 
 
 # ─── Stats Command ─────────────────────────────────────────────────
 
 def show_stats():
-    """Show collection statistics from saved data."""
+    """Show collection statistics from the stats index (updated incrementally)."""
+    from stats_index import INDEX_FILE, StatsIndex
+
     if not DATA_DIR.exists():
         print("아직 수집된 데이터가 없습니다.")
         return
 
+    index = StatsIndex(DATA_DIR / INDEX_FILE, DATA_DIR)
+    index.update()
+    channels = index.channels()
+    if not channels:
+        print("아직 수집된 데이터가 없습니다.")
+        return
+
     print(f"\n{'='*60}")
     print(f"  수집 데이터 통계")
     print(f"{'='*60}\n")
@@ -410,36 +701,23 @@ def show_stats():
     total_all = 0
     toxic_all = 0
 
-    for channel_dir in sorted(DATA_DIR.iterdir()):
-        if not channel_dir.is_dir():
-            continue
-
-        metadata_path = channel_dir / "metadata.json"
-        if not metadata_path.exists():
-            continue
-
-        with open(metadata_path, encoding="utf-8") as f:
-            meta = json.load(f)
-
-        channel_name = meta.get("channel", {}).get("name", channel_dir.name)
-        total = meta.get("totalComments", 0)
-        toxic = meta.get("toxicComments", 0)
-        pct = meta.get("statistics", {}).get("toxicPercentage", 0)
-        avg_score = meta.get("statistics", {}).get("averageToxicityScore", 0)
-        collected = meta.get("collectedAt", "N/A")
+    for channel in channels:
+        collected = channel["collected_at"] or "N/A"
+        total = channel["total_comments"]
+        toxic = channel["toxic_comments"]
 
         total_all += total
         toxic_all += toxic
 
-        print(f"  {channel_name}")
-        print(f"    수집일: {collected[:10] if collected != 'N/A' else 'N/A'}")
-        print(f"    총 댓글: {total:,}개 | 독성: {toxic:,}개 ({pct}%)")
-        print(f"    평균 독성 점수: {avg_score}")
+        print(f"  {channel['name']}")
+        print(f"    수집일: {collected[:10]}")
+        print(f"    영상: {channel['videos']:,}개")
+        print(f"    총 댓글: {total:,}개 | 독성: {toxic:,}개 ({channel['toxic_percentage']}%)")
+        print(f"    평균 독성 점수: {channel['average_toxicity_score']}")
 
-        dist = meta.get("statistics", {}).get("categoryDistribution", {})
-        top_cats = sorted(dist.items(), key=lambda x: -x[1])[:3]
+        top_cats = index.top_categories(channel=channel["channel_key"], limit=3)
         if top_cats:
-            top_str = ", ".join(f"{c}({n})" for c, n in top_cats)
+            top_str = ", ".join(f"{c['category']}({c['count']})" for c in top_cats)
             print(f"    상위 카테고리: {top_str}")
         print()
 
@@ -447,6 +725,31 @@ def show_stats():
         pct_all = toxic_all / total_all * 100
         print(f"  ── 전체 합계 ──")
         print(f"    총 댓글: {total_all:,}개 | 독성: {toxic_all:,}개 ({pct_all:.1f}%)")
+        top_authors = index.top_authors(limit=5)
+        if top_authors:
+            print(f"    독성 댓글 상위 작성자:")
+            for author in top_authors:
+                print(
+                    f"      {author['author']}: {author['toxic_comments']:,}개 "
+                    f"(채널 {author['channels']}개, 평균 {author['average_toxicity_score']})"
+                )
+
+
+# ─── Quota Plan ────────────────────────────────────────────────────
+
+def print_plan(plan, discovery: str) -> None:
+    """Print which channels fit into today's remaining quota."""
+    print(f"\n{'='*60}")
+    print(f"  수집 계획 (discovery={discovery})")
+    print(f"{'='*60}")
+    print(f"  남은 할당량: {plan.remaining_units:,} units")
+    print(f"  예상 사용량: {plan.estimated_units:,} units")
+    for channel in plan.scheduled:
+        cost = estimate_channel_cost(channel, discovery)
+        print(f"    ✓ {channel['name']} (~{cost:,} units)")
+    for channel in plan.deferred:
+        cost = estimate_channel_cost(channel, discovery)
+        print(f"    - {channel['name']} (~{cost:,} units, 다음 할당량으로 연기)")
 
 
 # ─── CLI ───────────────────────────────────────────────────────────
@@ -475,6 +778,51 @@ def main():
         action="store_true",
         help="진행 상황 출력 최소화",
     )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help=f"일일 할당량 예산 (units, 기본 $YOUTUBE_DAILY_QUOTA 또는 {DEFAULT_DAILY_BUDGET:,})",
+    )
+    parser.add_argument(
+        "--discovery",
+        choices=DISCOVERY_MODES,
+        default="playlist",
+        help="영상 목록 조회 방식: playlist(1 unit/페이지, 기본) | search(100 units/페이지)",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="오늘 남은 할당량으로 수집할 채널 계획만 출력",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="채널당 동시에 수집할 영상 수 (기본 1 = 순차)",
+    )
+    parser.add_argument(
+        "--channel-workers",
+        type=int,
+        default=1,
+        help="동시에 수집할 채널 수 (기본 1 = 순차)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help=f"전체 스레드 공용 API 요청 속도 상한 (요청/초, 기본 {DEFAULT_RATE:g}, 0 = 제한 없음)",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="이전 수집 결과를 이어 쓰지 않고 채널을 처음부터 다시 수집",
+    )
+    parser.add_argument(
+        "--no-verdict-store",
+        action="store_true",
+        help="판정 저장소를 쓰지 않고 모든 댓글을 다시 분석",
+    )
 
     args = parser.parse_args()
 
@@ -488,12 +836,9 @@ def main():
         show_stats()
         return
 
-    # Check API key
-    api_key = os.environ.get("YOUTUBE_API_KEY")
-    if not api_key:
-        print("✗ YOUTUBE_API_KEY가 설정되지 않았습니다.")
-        print("  발급 안내: python scripts/collect_comments.py --guide")
-        sys.exit(1)
+    load_env()
+    if args.budget is None:
+        args.budget = int(os.environ.get("YOUTUBE_DAILY_QUOTA", DEFAULT_DAILY_BUDGET))
 
     # Load channels config
     if not CHANNELS_FILE.exists():
@@ -515,25 +860,86 @@ def main():
                 print(f"    - {c['name']} ({c['handle']})")
             sys.exit(1)
 
-    # Build YouTube client
-    youtube = build_youtube_client(api_key)
+    # Schedule channels within today's remaining quota
+    quota = QuotaAccountant(args.budget, state_path=QUOTA_FILE)
+    plan = plan_collection(channels, quota.remaining, args.discovery)
 
-    # Collect comments for each channel
     verbose = not args.quiet
-    for channel_config in channels:
+    if args.plan or verbose:
+        print_plan(plan, args.discovery)
+    if args.plan:
+        return
+
+    # Check API key
+    api_key = os.environ.get("YOUTUBE_API_KEY")
+    if not api_key:
+        print("✗ YOUTUBE_API_KEY가 설정되지 않았습니다.")
+        print("  발급 안내: python scripts/collect_comments.py --guide")
+        sys.exit(1)
+
+    # Build YouTube client: every execute() is rate limited and charged to
+    # the quota ledger; each thread talks through its own transport.
+    youtube = MeteredClient(ThreadLocalClient(api_key), quota, RateLimiter(args.rate))
+
+    # Rule verdicts already known from earlier runs (or the backend) are reused
+    verdicts = None
+    if not args.no_verdict_store:
+        from verdict_store import VerdictStore
+
+        verdicts = VerdictStore(Path(os.environ.get("VERDICT_STORE_PATH") or VERDICT_STORE))
+
+    # Collect comments for each scheduled channel
+    concurrent = args.channel_workers > 1 and len(plan.scheduled) > 1
+    quota_hit = threading.Event()
+
+    def run_channel(channel_config: dict) -> None:
+        name = channel_config["name"]
+        prefix = f"[{name}] " if concurrent else ""
+        if quota_hit.is_set():
+            return
         try:
-            result = collect_channel(youtube, channel_config, verbose=verbose)
-            if result:
-                output_path = save_result(channel_config["name"], result)
-                if verbose:
-                    print(f"\n  저장 완료: {output_path}")
+            result = collect_channel(
+                youtube,
+                channel_config,
+                verbose=verbose,
+                discovery=args.discovery,
+                workers=args.workers,
+                prefix=prefix,
+                fresh=args.fresh,
+                verdicts=verdicts,
+            )
+            if result and verbose:
+                log(f"\n  저장 완료: {channel_dir(name)}", prefix)
+        except QuotaExceededError as e:
+            # Channels not yet started are skipped once the quota is exhausted
+            if not quota_hit.is_set():
+                quota_hit.set()
+                log(f"\n  ✗ {e}\n    남은 채널은 할당량 리셋 후 다시 실행하세요.", prefix)
         except Exception as e:
-            print(f"\n  ✗ 오류 발생 ({channel_config['name']}): {e}")
-            continue
+            log(f"\n  ✗ 오류 발생 ({name}): {e}", prefix)
+
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=args.channel_workers) as pool:
+            for future in [pool.submit(run_channel, c) for c in plan.scheduled]:
+                future.result()
+    else:
+        for channel_config in plan.scheduled:
+            run_channel(channel_config)
+            if quota_hit.is_set():
+                break
+
+    # Refresh the stats index (--stats, backend /stats) with the new output
+    from stats_index import INDEX_FILE, StatsIndex
+
+    StatsIndex(DATA_DIR / INDEX_FILE, DATA_DIR).update()
 
     if verbose:
+        usage = quota.summary()
         print(f"\n{'='*60}")
         print(f"  수집 완료!")
+        print(f"  할당량 사용: {usage['used']:,} / {usage['budget']:,} units")
+        for method, units in sorted(usage["units"].items(), key=lambda x: -x[1]):
+            print(f"    {method}: {units:,} units ({usage['calls'][method]:,} calls)")
         print(f"  통계 확인: python scripts/collect_comments.py --stats")
         print(f"{'='*60}")
 
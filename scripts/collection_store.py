@@ -0,0 +1,196 @@
+"""
+Append-only, checkpointed collection output for one channel.
+
+Layout (scripts/data/{channel}/):
+    comments.jsonl  — one analyzed comment per line (with its ``videoId``)
+    videos.jsonl    — one line per finished video (no comments)
+    manifest.json   — finished video IDs, committed file sizes, running totals
+    metadata.json   — channel summary, rewritten after every video
+
+A video is written in one go when it completes: its comments, then its
+video line, both flushed, then the manifest is replaced atomically. The
+manifest is the commit point: on reopen both JSONL files are truncated to
+the sizes it records, so a crash mid-video leaves no partial records and
+a rerun simply collects that video again while skipping finished ones.
+``metadata.json`` is derived from the running totals in the manifest, so
+it always describes exactly the committed stream.
+
+Re-scoring (``rescore.py``) rewrites comments.jsonl into a temporary file
+and swaps it in with ``replace_comments``; the manifest names the pending
+file first, so an interrupted swap is finished on the next open.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+COMMENTS_FILE = "comments.jsonl"
+VIDEOS_FILE = "videos.jsonl"
+MANIFEST_FILE = "manifest.json"
+METADATA_FILE = "metadata.json"
+
+# Comments at or above this score count as toxic (korean_profanity.is_toxic)
+TOXIC_THRESHOLD = 30
+
+
+def write_json(path: Path, data: dict) -> None:
+    """Replace ``path`` atomically."""
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _truncate(path: Path, size: int) -> None:
+    if size == 0:
+        path.unlink(missing_ok=True)
+    elif path.exists() and path.stat().st_size != size:
+        with open(path, "r+b") as f:
+            f.truncate(size)
+
+
+def empty_totals(categories) -> dict:
+    """Running totals for a channel (category keys in canonical order)."""
+    return {
+        "totalComments": 0,
+        "toxicComments": 0,
+        "scoreSum": 0,
+        "categoryDistribution": {cat: 0 for cat in categories},
+    }
+
+
+def add_comments(totals: dict, comments: list[dict]) -> None:
+    """Add analyzed comment records to ``totals`` in place."""
+    distribution = totals["categoryDistribution"]
+    for comment in comments:
+        analysis = comment["analysis"]
+        score = analysis["toxicityScore"]
+        totals["totalComments"] += 1
+        totals["toxicComments"] += score >= TOXIC_THRESHOLD
+        totals["scoreSum"] += score
+        for cat in analysis["matchedCategories"]:
+            distribution[cat] = distribution.get(cat, 0) + 1
+
+
+def totals_statistics(totals: dict) -> dict:
+    """Running totals → the ``statistics`` block of metadata.json."""
+    total = totals["totalComments"]
+    avg_score = totals["scoreSum"] / total if total > 0 else 0
+    toxic_pct = (totals["toxicComments"] / total * 100) if total > 0 else 0
+    return {
+        "categoryDistribution": totals["categoryDistribution"],
+        "averageToxicityScore": round(avg_score, 1),
+        "toxicPercentage": round(toxic_pct, 1),
+    }
+
+
+class ChannelStore:
+    """Append-only writer for one channel directory (see module docstring)."""
+
+    def __init__(
+        self,
+        channel_dir: Path,
+        categories,
+        fresh: bool = False,
+        rules_version: str | None = None,
+    ):
+        self.dir = channel_dir
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        manifest_path = self.dir / MANIFEST_FILE
+        if manifest_path.exists() and not fresh:
+            self.manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        else:
+            self.manifest = {
+                "channel": {},
+                "videos": {},
+                "sizes": {COMMENTS_FILE: 0, VIDEOS_FILE: 0},
+                "totals": empty_totals(categories),
+                "rulesVersion": rules_version,
+                # Changes whenever existing lines are rewritten (see stats_index)
+                "generation": uuid.uuid4().hex,
+            }
+        # Finish a comments.jsonl swap interrupted after its manifest commit
+        pending = self.manifest.pop("pendingComments", None)
+        if pending and (self.dir / pending).exists():
+            os.replace(self.dir / pending, self.dir / COMMENTS_FILE)
+        # Drop anything written after the last committed video
+        for name, size in self.manifest["sizes"].items():
+            _truncate(self.dir / name, size)
+
+    @property
+    def finished(self) -> set[str]:
+        """IDs of videos already committed to the stream."""
+        return set(self.manifest["videos"])
+
+    @property
+    def totals(self) -> dict:
+        return self.manifest["totals"]
+
+    def set_channel(self, channel_info: dict) -> None:
+        """Record (refreshed) channel metadata."""
+        with self._lock:
+            self.manifest["channel"] = channel_info
+            self.manifest["collectedAt"] = datetime.now(timezone.utc).isoformat()
+            self._save()
+
+    def append_video(self, record: dict) -> None:
+        """Commit one finished video (``record["comments"]`` holds its comments)."""
+        comments = record["comments"]
+        video = {k: v for k, v in record.items() if k != "comments"}
+        video["collectedComments"] = len(comments)
+
+        with self._lock:
+            with open(self.dir / COMMENTS_FILE, "a", encoding="utf-8") as f:
+                for comment in comments:
+                    f.write(json.dumps({"videoId": video["videoId"], **comment}, ensure_ascii=False) + "\n")
+            with open(self.dir / VIDEOS_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps(video, ensure_ascii=False) + "\n")
+
+            add_comments(self.manifest["totals"], comments)
+            self.manifest["videos"][video["videoId"]] = len(comments)
+            self.manifest["collectedAt"] = datetime.now(timezone.utc).isoformat()
+            self.manifest["sizes"] = {
+                name: (self.dir / name).stat().st_size for name in (COMMENTS_FILE, VIDEOS_FILE)
+            }
+            self._save()
+
+    def replace_comments(self, path: Path, totals: dict, rules_version: str) -> None:
+        """Swap in a rewritten comments.jsonl (same comments, re-scored analysis).
+
+        ``path`` must be in the channel directory; ``totals`` are the running
+        totals recomputed from it.
+        """
+        with self._lock:
+            self.manifest["totals"] = totals
+            self.manifest["rulesVersion"] = rules_version
+            self.manifest["sizes"][COMMENTS_FILE] = path.stat().st_size
+            self.manifest["pendingComments"] = path.name
+            self.manifest["generation"] = uuid.uuid4().hex
+            self._save()
+            os.replace(path, self.dir / COMMENTS_FILE)
+            del self.manifest["pendingComments"]
+            self._save()
+
+    def _save(self) -> None:
+        self.manifest["updatedAt"] = datetime.now(timezone.utc).isoformat()
+        write_json(self.dir / MANIFEST_FILE, self.manifest)
+        write_json(self.dir / METADATA_FILE, self.metadata())
+
+    def metadata(self) -> dict:
+        """Channel summary of everything committed so far."""
+        totals = self.manifest["totals"]
+        return {
+            "channel": self.manifest["channel"],
+            "collectedAt": self.manifest.get("collectedAt"),
+            "videoCount": len(self.manifest["videos"]),
+            "totalComments": totals["totalComments"],
+            "toxicComments": totals["toxicComments"],
+            "statistics": totals_statistics(totals),
+            "rulesVersion": self.manifest.get("rulesVersion"),
+        }
@@ -0,0 +1,421 @@
+"""
+Compressed columnar corpus of collected comments.
+
+Converts a channel's collected comments (comments.jsonl from
+``collection_store``, or a legacy comments.json) into a single
+``corpus.zcol`` file: one row per comment, one zstd-compressed chunk per
+column and row group, and a footer listing where every chunk lives.
+Readers memory-map the file and decompress only the chunks of the
+requested columns, so a scan of ``toxicityScore`` never touches ``text``.
+
+Usage:
+    python scripts/corpus.py convert                       # 모든 채널 변환
+    python scripts/corpus.py convert scripts/data/침착맨     # 특정 채널만
+    python scripts/corpus.py scan --columns toxicityScore  # 전체 코퍼스 스캔
+    python scripts/corpus.py info scripts/data/침착맨/corpus.zcol
+
+    from corpus import Corpus
+    with Corpus(path) as corpus:
+        cols = corpus.read(["text", "toxicityScore"])
+
+File layout:
+    MAGIC | chunk ... chunk | footer (zstd JSON) | footer length (u64 LE) | MAGIC
+
+Column types:
+    int      int64 values
+    str      (rows + 1) uint64 byte offsets, then the UTF-8 data
+    strlist  (rows + 1) uint64 item offsets, then a ``str`` chunk of items
+
+Requires the ``zstandard`` package (``uv sync --extra corpus``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import mmap
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - reported when the corpus is used
+    zstandard = None
+
+SCRIPT_DIR = Path(__file__).parent
+DATA_DIR = SCRIPT_DIR / "data"
+
+CORPUS_FILE = "corpus.zcol"
+MAGIC = b"YTZCOL1\n"
+FORMAT_VERSION = 1
+ROW_GROUP_SIZE = 65_536
+COMPRESSION_LEVEL = 9
+
+# (column, type) — comment record fields, then its ``analysis`` fields
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("videoId", "str"),
+    ("commentId", "str"),
+    ("author", "str"),
+    ("text", "str"),
+    ("publishedAt", "str"),
+    ("likeCount", "int"),
+    ("parentId", "str"),
+    ("toxicityScore", "int"),
+    ("matchedCategories", "strlist"),
+    ("matchedPatterns", "strlist"),
+    ("matchedRules", "strlist"),
+)
+_FOOTER = struct.Struct("<Q")
+
+
+def _require_zstd() -> None:
+    if zstandard is None:
+        raise RuntimeError("zstandard 패키지가 필요합니다: uv sync --extra corpus")
+
+
+def _offsets(values: Iterable[int]) -> array:
+    out = array("Q", [0])
+    total = 0
+    for n in values:
+        total += n
+        out.append(total)
+    return out
+
+
+def _le(a: array) -> bytes:
+    if sys.byteorder != "little":
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+def _from_le(typecode: str, data) -> array:
+    a = array(typecode)
+    a.frombytes(data)
+    if sys.byteorder != "little":
+        a.byteswap()
+    return a
+
+
+# ─── Encoding ──────────────────────────────────────────────────────
+
+def _encode(kind: str, values: list) -> bytes:
+    if kind == "int":
+        return _le(array("q", values))
+    if kind == "str":
+        encoded = [v.encode("utf-8") for v in values]
+        return _le(_offsets(map(len, encoded))) + b"".join(encoded)
+    items = [item for v in values for item in v]
+    return _le(_offsets(map(len, values))) + _encode("str", items)
+
+
+def _decode(kind: str, data: memoryview, rows: int):
+    if kind == "int":
+        return _from_le("q", data)
+    size = (rows + 1) * 8
+    offsets = _from_le("Q", data[:size])
+    if kind == "str":
+        blob = bytes(data[size:])
+        return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(rows)]
+    items = _decode("str", data[size:], offsets[-1])
+    return [items[offsets[i]:offsets[i + 1]] for i in range(rows)]
+
+
+# ─── Writer ────────────────────────────────────────────────────────
+
+class CorpusWriter:
+    """Streaming writer: rows are buffered and written one row group at a time."""
+
+    def __init__(self, path: Path, metadata: dict | None = None):
+        _require_zstd()
+        self.path = path
+        self.metadata = metadata or {}
+        self._tmp_path = path.with_suffix(path.suffix + ".tmp")
+        self._file = open(self._tmp_path, "wb")
+        self._file.write(MAGIC)
+        self._compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL)
+        self._buffer: dict[str, list] = {name: [] for name, _ in COLUMNS}
+        self._row_groups: list[dict] = []
+        self.rows = 0
+
+    def append(self, comment: dict, video_id: str | None = None) -> None:
+        """Add one collected comment record (with its ``analysis``)."""
+        analysis = comment.get("analysis", {})
+        buf = self._buffer
+        buf["videoId"].append(video_id or comment.get("videoId", ""))
+        buf["commentId"].append(comment["commentId"])
+        buf["author"].append(comment.get("author", ""))
+        buf["text"].append(comment.get("text", ""))
+        buf["publishedAt"].append(comment.get("publishedAt", ""))
+        buf["likeCount"].append(comment.get("likeCount", 0))
+        buf["parentId"].append(comment.get("parentId") or "")
+        buf["toxicityScore"].append(analysis.get("toxicityScore", 0))
+        buf["matchedCategories"].append(analysis.get("matchedCategories", []))
+        buf["matchedPatterns"].append(analysis.get("matchedPatterns", []))
+        buf["matchedRules"].append(analysis.get("matchedRules", []))
+        self.rows += 1
+        if len(buf["commentId"]) >= ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        rows = len(self._buffer["commentId"])
+        if not rows:
+            return
+        chunks = {}
+        for name, kind in COLUMNS:
+            data = self._compressor.compress(_encode(kind, self._buffer[name]))
+            chunks[name] = [self._file.tell(), len(data)]
+            self._file.write(data)
+            self._buffer[name] = []
+        self._row_groups.append({"rows": rows, "chunks": chunks})
+
+    def close(self) -> Path:
+        """Write the footer and move the finished file into place."""
+        self._flush()
+        footer = {
+            "version": FORMAT_VERSION,
+            "rows": self.rows,
+            "columns": [{"name": name, "type": kind} for name, kind in COLUMNS],
+            "rowGroups": self._row_groups,
+            "metadata": self.metadata,
+        }
+        data = self._compressor.compress(json.dumps(footer, ensure_ascii=False).encode("utf-8"))
+        self._file.write(data)
+        self._file.write(_FOOTER.pack(len(data)))
+        self._file.write(MAGIC)
+        self._file.close()
+        self._tmp_path.replace(self.path)
+        return self.path
+
+    def __enter__(self) -> CorpusWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            self._tmp_path.unlink(missing_ok=True)
+
+
+# ─── Reader ────────────────────────────────────────────────────────
+
+class Corpus:
+    """Memory-mapped reader with column projection."""
+
+    def __init__(self, path: Path | str):
+        _require_zstd()
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self.bytes_read = 0
+
+        tail = len(MAGIC) + _FOOTER.size
+        if self._view[:len(MAGIC)] != MAGIC or self._view[-len(MAGIC):] != MAGIC:
+            self.close()
+            raise ValueError(f"코퍼스 파일 형식이 아닙니다: {self.path}")
+        (footer_len,) = _FOOTER.unpack(self._view[-tail:-len(MAGIC)])
+        footer = json.loads(self._decompress(len(self._mm) - tail - footer_len, footer_len))
+
+        self.rows: int = footer["rows"]
+        self.columns: dict[str, str] = {c["name"]: c["type"] for c in footer["columns"]}
+        self.metadata: dict = footer["metadata"]
+        self._row_groups: list[dict] = footer["rowGroups"]
+
+    def _decompress(self, offset: int, length: int) -> bytes:
+        self.bytes_read += length
+        return self._decompressor.decompress(self._view[offset:offset + length])
+
+    def iter_batches(self, columns: Iterable[str] | None = None) -> Iterator[dict]:
+        """Yield {column: values} per row group, decoding only ``columns``."""
+        names = list(columns) if columns is not None else list(self.columns)
+        unknown = [n for n in names if n not in self.columns]
+        if unknown:
+            raise KeyError(f"알 수 없는 컬럼: {', '.join(unknown)}")
+        for group in self._row_groups:
+            yield {
+                name: _decode(
+                    self.columns[name],
+                    memoryview(self._decompress(*group["chunks"][name])),
+                    group["rows"],
+                )
+                for name in names
+            }
+
+    def read(self, columns: Iterable[str] | None = None) -> dict:
+        """Whole columns: ``int`` → array("q"), ``str`` → list[str], ``strlist`` → list[list[str]]."""
+        names = list(columns) if columns is not None else list(self.columns)
+        out: dict = {
+            name: array("q") if self.columns.get(name) == "int" else [] for name in names
+        }
+        for batch in self.iter_batches(names):
+            for name, values in batch.items():
+                out[name].extend(values)
+        return out
+
+    def close(self) -> None:
+        self._view.release()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> Corpus:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ─── Conversion ────────────────────────────────────────────────────
+
+def iter_channel_comments(channel_dir: Path) -> Iterator[tuple[str, dict]]:
+    """(videoId, comment record) pairs from a channel directory.
+
+    Reads comments.jsonl line by line when present, otherwise the legacy
+    comments.json (parsed whole).
+    """
+    jsonl_path = channel_dir / "comments.jsonl"
+    if jsonl_path.exists():
+        with open(jsonl_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record["videoId"], record
+        return
+
+    with open(channel_dir / "comments.json", encoding="utf-8") as f:
+        result = json.load(f)
+    for video in result.get("videos", []):
+        for comment in video.get("comments", []):
+            yield video["videoId"], comment
+
+
+def channel_dirs(paths: list[str] | None = None) -> list[Path]:
+    """Channel directories with collected comments (default: all of DATA_DIR)."""
+    candidates = [Path(p) for p in paths] if paths else (
+        sorted(DATA_DIR.iterdir()) if DATA_DIR.exists() else []
+    )
+    return [
+        d for d in candidates
+        if d.is_dir() and ((d / "comments.jsonl").exists() or (d / "comments.json").exists())
+    ]
+
+
+def convert_channel(channel_dir: Path) -> Path:
+    """Write ``channel_dir/corpus.zcol`` from the channel's collected comments."""
+    metadata_path = channel_dir / "metadata.json"
+    metadata = (
+        json.loads(metadata_path.read_text(encoding="utf-8")) if metadata_path.exists() else {}
+    )
+    with CorpusWriter(channel_dir / CORPUS_FILE, metadata={"channel": metadata.get("channel", {})}) as writer:
+        for video_id, comment in iter_channel_comments(channel_dir):
+            writer.append(comment, video_id)
+    return writer.path
+
+
+def corpus_files(paths: list[str] | None = None) -> list[Path]:
+    """corpus.zcol files given directly, inside given directories, or under DATA_DIR."""
+    if not paths:
+        return sorted(DATA_DIR.glob(f"*/{CORPUS_FILE}")) if DATA_DIR.exists() else []
+    files: list[Path] = []
+    for p in map(Path, paths):
+        files.extend([p] if p.is_file() else sorted(p.glob(f"**/{CORPUS_FILE}")))
+    return files
+
+
+# ─── CLI ───────────────────────────────────────────────────────────
+
+def cmd_convert(args) -> None:
+    dirs = channel_dirs(args.paths)
+    if not dirs:
+        print("변환할 수집 데이터가 없습니다.")
+        return
+    for channel_dir in dirs:
+        start = time.perf_counter()
+        source = channel_dir / (
+            "comments.jsonl" if (channel_dir / "comments.jsonl").exists() else "comments.json"
+        )
+        path = convert_channel(channel_dir)
+        elapsed = time.perf_counter() - start
+        src_size = source.stat().st_size
+        dst_size = path.stat().st_size
+        print(
+            f"  ✓ {channel_dir.name}: {source.name} {src_size / 1e6:,.1f}MB → "
+            f"{path.name} {dst_size / 1e6:,.1f}MB "
+            f"({src_size / max(dst_size, 1):.1f}x, {elapsed:.1f}s)"
+        )
+
+
+def cmd_scan(args) -> None:
+    columns = [c.strip() for c in args.columns.split(",") if c.strip()]
+    files = corpus_files(args.paths)
+    if not files:
+        print("코퍼스 파일이 없습니다. 먼저 convert를 실행하세요.")
+        return
+
+    start = time.perf_counter()
+    total_rows = 0
+    total_read = 0
+    total_size = 0
+    for path in files:
+        with Corpus(path) as corpus:
+            data = corpus.read(columns)
+            total_rows += corpus.rows
+            total_read += corpus.bytes_read
+            total_size += path.stat().st_size
+            line = f"  {path.parent.name}: {corpus.rows:,}행"
+            scores = data.get("toxicityScore")
+            if scores is not None and len(scores):
+                toxic = sum(1 for s in scores if s >= 30)
+                line += f" | 독성 {toxic:,}개 ({toxic / len(scores) * 100:.1f}%) | 평균 {sum(scores) / len(scores):.1f}"
+            print(line)
+    elapsed = time.perf_counter() - start
+    print(
+        f"\n  컬럼 {','.join(columns)}: {total_rows:,}행, "
+        f"압축 데이터 {total_read / 1e6:,.1f}MB 읽음 / 파일 {total_size / 1e6:,.1f}MB, "
+        f"{elapsed:.2f}s ({total_rows / max(elapsed, 1e-9):,.0f}행/s)"
+    )
+
+
+def cmd_info(args) -> None:
+    for path in corpus_files(args.paths):
+        with Corpus(path) as corpus:
+            print(f"  {path}")
+            print(f"    행: {corpus.rows:,} | row group: {len(corpus._row_groups)}")
+            for name, kind in corpus.columns.items():
+                size = sum(g["chunks"][name][1] for g in corpus._row_groups)
+                print(f"    {name:<18} {kind:<8} {size / 1e3:,.1f}KB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="수집 댓글 컬럼형 코퍼스 (zstd)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("convert", help="채널 수집 데이터 → corpus.zcol")
+    p.add_argument("paths", nargs="*", help="채널 디렉토리 (기본: scripts/data/*)")
+    p.set_defaults(func=cmd_convert)
+
+    p = sub.add_parser("scan", help="코퍼스 컬럼 스캔")
+    p.add_argument("paths", nargs="*", help="corpus.zcol 또는 디렉토리 (기본: scripts/data/*)")
+    p.add_argument("--columns", default="toxicityScore", help="읽을 컬럼 (쉼표 구분)")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("info", help="코퍼스 컬럼별 크기")
+    p.add_argument("paths", nargs="*", help="corpus.zcol 또는 디렉토리 (기본: scripts/data/*)")
+    p.set_defaults(func=cmd_info)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    # Windows cp949 인코딩 문제 방지
+    if sys.stdout.encoding != "utf-8":
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+    main()
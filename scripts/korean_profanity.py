@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import cache
 
 # ─── Types ─────────────────────────────────────────────────────────
 
@@ -394,6 +395,12 @@ DETECTION_RULES: list[DetectionRule] = [
 
 # ─── Rule Engine ───────────────────────────────────────────────────
 
+# Bump on any change to how matches become a score that is not visible in
+# DETECTION_RULES / CATEGORY_RELATIONS, i.e. to evaluate_rules,
+# analyze_comment or get_combined_severity_modifier (part of ruleset_version)
+ENGINE_VERSION = 2
+
+
 def evaluate_rules(text: str) -> list[RuleMatch]:
     """Run all detection rules against a comment text.
     v2: respects negative_patterns to avoid false positives."""
@@ -449,3 +456,30 @@ def analyze_comment(text: str) -> AnalysisResult:
         matched_rules=list(dict.fromkeys(m.rule_id for m in matches)),
         is_toxic=score >= 30,
     )
+
+
+@cache
+def ruleset_version() -> str:
+    """Short fingerprint of the rules and the engine that scores them.
+
+    Covers DETECTION_RULES (patterns with their flags), CATEGORY_RELATIONS
+    and ENGINE_VERSION, so it changes whenever a rule, pattern, modifier or
+    relation changes (and when ENGINE_VERSION is bumped for scoring code
+    changes) and stored analysis can be checked against the current rule
+    engine. It only reads data, so it also works where the module source is
+    not available.
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    for rule in DETECTION_RULES:
+        digest.update(repr((
+            rule.id,
+            rule.category,
+            rule.score_modifier,
+            [(p.pattern, p.flags) for p in rule.patterns],
+            [(p.pattern, p.flags) for p in rule.negative_patterns],
+        )).encode("utf-8"))
+    digest.update(repr(CATEGORY_RELATIONS).encode("utf-8"))
+    digest.update(repr(ENGINE_VERSION).encode("utf-8"))
+    return digest.hexdigest()[:12]
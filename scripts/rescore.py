@@ -0,0 +1,351 @@
+"""
+Offline re-scoring of collected comments with the current rule engine.
+
+Streams every stored comment in scripts/data through
+``korean_profanity.analyze_comment`` on a process pool (all cores by
+default), rewrites the ``analysis`` blocks and channel totals, and reports
+what changed, broken down by rule ID, with throughput numbers.
+
+Channels already scored with the current rules (``rulesVersion`` in
+metadata.json, see ``korean_profanity.ruleset_version``) are skipped
+unless ``--force``. An existing corpus.zcol is rebuilt after rewriting.
+
+Usage:
+    python scripts/rescore.py                        # 전체 채널 재채점
+    python scripts/rescore.py scripts/data/침착맨      # 특정 채널만
+    python scripts/rescore.py --dry-run --report diff.json
+    python scripts/rescore.py --workers 4 --force
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+SCRIPT_DIR = Path(__file__).parent
+DATA_DIR = SCRIPT_DIR / "data"
+
+BATCH_SIZE = 1000
+TOXIC_THRESHOLD = 30
+# Rule-level bucket for comments whose score changed without a rule change
+SCORING_BUCKET = "(score)"
+
+
+# ─── Scoring (runs in worker processes) ───────────────────────────
+
+def score_texts(texts: list[str]) -> list[dict]:
+    """Analyze a batch of comment texts → ``analysis`` blocks.
+
+    Texts are normalized first, as in ``verdict_store.score_comments``, so
+    rescoring agrees with the verdicts the collector stores.
+    """
+    from korean_profanity import analyze_comment
+    from verdict_store import analysis_record, normalize_text
+
+    return [analysis_record(analyze_comment(normalize_text(text))) for text in texts]
+
+
+def rescored(
+    comments: Iterable[dict], pool: Executor | None, window: int
+) -> Iterator[tuple[dict, dict]]:
+    """(comment, new analysis) pairs in input order.
+
+    Batches are scored on ``pool`` with at most ``window`` batches in
+    flight, so memory stays bounded however large the channel is.
+    """
+    it = iter(comments)
+    pending: deque = deque()
+    while True:
+        batch = list(islice(it, BATCH_SIZE))
+        if batch:
+            texts = [c.get("text", "") for c in batch]
+            if pool is None:
+                yield from zip(batch, score_texts(texts))
+                continue
+            pending.append((batch, pool.submit(score_texts, texts)))
+        if pending and (not batch or len(pending) >= window):
+            done, future = pending.popleft()
+            yield from zip(done, future.result())
+        if not batch and not pending:
+            return
+
+
+# ─── Diff report ──────────────────────────────────────────────────
+
+class DiffReport:
+    """Changes between stored and re-scored analysis."""
+
+    def __init__(self, examples: int = 3):
+        self.examples = examples
+        self.comments = 0
+        self.score_changed = 0
+        self.categories_changed = 0
+        self.became_toxic = 0
+        self.became_clean = 0
+        self.rules_added: Counter = Counter()
+        self.rules_removed: Counter = Counter()
+        self.rules_changed: Counter = Counter()
+        self.categories_added: Counter = Counter()
+        self.categories_removed: Counter = Counter()
+        self.samples: dict[str, list[dict]] = {}
+
+    def add(self, comment: dict, new: dict) -> None:
+        self.comments += 1
+        old = comment.get("analysis") or {}
+        old_score = old.get("toxicityScore", 0)
+        new_score = new["toxicityScore"]
+        old_cats = set(old.get("matchedCategories", []))
+        new_cats = set(new["matchedCategories"])
+        score_changed = old_score != new_score
+        cats_changed = old_cats != new_cats
+        if not (score_changed or cats_changed):
+            return
+
+        self.score_changed += score_changed
+        self.categories_changed += cats_changed
+        self.became_toxic += old_score < TOXIC_THRESHOLD <= new_score
+        self.became_clean += new_score < TOXIC_THRESHOLD <= old_score
+        self.categories_added.update(new_cats - old_cats)
+        self.categories_removed.update(old_cats - new_cats)
+
+        old_rules = set(old.get("matchedRules", []))
+        new_rules = set(new["matchedRules"])
+        added = new_rules - old_rules
+        removed = old_rules - new_rules
+        self.rules_added.update(added)
+        self.rules_removed.update(removed)
+        changed_rules = sorted(added | removed) or [SCORING_BUCKET]
+        self.rules_changed.update(changed_rules)
+        for rule in changed_rules:
+            samples = self.samples.setdefault(rule, [])
+            if len(samples) < self.examples:
+                samples.append({
+                    "commentId": comment.get("commentId"),
+                    "text": comment.get("text", "")[:80],
+                    "score": [old_score, new_score],
+                    "rules": [sorted(old_rules), sorted(new_rules)],
+                })
+
+    def by_rule(self) -> dict[str, dict]:
+        """Changed comments per rule ID (``SCORING_BUCKET``: score changed, rules did not)."""
+        return {
+            rule: {
+                "changed": changed,
+                "added": self.rules_added[rule],
+                "removed": self.rules_removed[rule],
+                "examples": self.samples.get(rule, []),
+            }
+            for rule, changed in self.rules_changed.most_common()
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "comments": self.comments,
+            "scoreChanged": self.score_changed,
+            "categoriesChanged": self.categories_changed,
+            "becameToxic": self.became_toxic,
+            "becameClean": self.became_clean,
+            "categories": {
+                cat: {"added": self.categories_added[cat], "removed": self.categories_removed[cat]}
+                for cat in sorted(set(self.categories_added) | set(self.categories_removed))
+            },
+            "rules": self.by_rule(),
+        }
+
+
+# ─── Channels ─────────────────────────────────────────────────────
+
+def _iter_jsonl(path: Path, size: int) -> Iterator[dict]:
+    """Records in the first ``size`` bytes (the committed part) of a JSONL file."""
+    if not size:
+        return
+    with open(path, "rb") as f:
+        pos = 0
+        for line in f:
+            pos += len(line)
+            if pos > size:
+                return
+            if line.strip():
+                yield json.loads(line)
+
+
+def rescore_jsonl(channel_dir: Path, pool, window, report, version, dry_run) -> int:
+    """Re-score a collection_store channel (comments.jsonl + manifest)."""
+    from collection_store import (
+        COMMENTS_FILE,
+        MANIFEST_FILE,
+        ChannelStore,
+        add_comments,
+        empty_totals,
+    )
+    from korean_profanity import CATEGORIES
+
+    manifest = json.loads((channel_dir / MANIFEST_FILE).read_text(encoding="utf-8"))
+    committed = _iter_jsonl(channel_dir / COMMENTS_FILE, manifest["sizes"][COMMENTS_FILE])
+    totals = empty_totals(CATEGORIES)
+    tmp_path = channel_dir / (COMMENTS_FILE + ".rescore")
+    rows = 0
+    out = None if dry_run else open(tmp_path, "w", encoding="utf-8")
+    try:
+        for comment, analysis in rescored(committed, pool, window):
+            report.add(comment, analysis)
+            comment["analysis"] = analysis
+            add_comments(totals, [comment])
+            rows += 1
+            if out is not None:
+                out.write(json.dumps(comment, ensure_ascii=False) + "\n")
+    except BaseException:
+        if out is not None:
+            out.close()
+            tmp_path.unlink(missing_ok=True)
+        raise
+    if out is not None:
+        out.close()
+        ChannelStore(channel_dir, CATEGORIES).replace_comments(tmp_path, totals, version)
+    return rows
+
+
+def rescore_legacy(channel_dir: Path, pool, window, report, version, dry_run) -> int:
+    """Re-score a legacy channel (single comments.json)."""
+    from collection_store import add_comments, empty_totals, totals_statistics, write_json
+    from korean_profanity import CATEGORIES
+
+    path = channel_dir / "comments.json"
+    result = json.loads(path.read_text(encoding="utf-8"))
+    comments = [c for video in result.get("videos", []) for c in video.get("comments", [])]
+    totals = empty_totals(CATEGORIES)
+    for comment, analysis in rescored(comments, pool, window):
+        report.add(comment, analysis)
+        comment["analysis"] = analysis
+    add_comments(totals, comments)
+    if dry_run:
+        return len(comments)
+
+    result.update({
+        "totalComments": totals["totalComments"],
+        "toxicComments": totals["toxicComments"],
+        "statistics": totals_statistics(totals),
+        "rulesVersion": version,
+    })
+    write_json(path, result)
+    write_json(channel_dir / "metadata.json", {k: v for k, v in result.items() if k != "videos"})
+    return len(comments)
+
+
+def stored_version(channel_dir: Path) -> str | None:
+    path = channel_dir / "metadata.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8")).get("rulesVersion")
+
+
+# ─── CLI ───────────────────────────────────────────────────────────
+
+def print_report(report: DiffReport, limit: int) -> None:
+    data = report.to_dict()
+    n = max(data["comments"], 1)
+    print(f"\n  ── 변경 요약 ──")
+    print(f"    점수 변경: {data['scoreChanged']:,}개 ({data['scoreChanged'] / n * 100:.1f}%)")
+    print(f"    카테고리 변경: {data['categoriesChanged']:,}개 ({data['categoriesChanged'] / n * 100:.1f}%)")
+    print(f"    독성 → 정상: {data['becameClean']:,}개 | 정상 → 독성: {data['becameToxic']:,}개")
+    if data["categories"]:
+        print(f"    카테고리별 (+추가/-제거):")
+        for cat, c in data["categories"].items():
+            print(f"      {cat}: +{c['added']:,} / -{c['removed']:,}")
+    if data["rules"]:
+        print(f"    규칙별 (+추가/-제거):")
+        for rule, c in list(data["rules"].items())[:limit]:
+            print(f"      {rule}: {c['changed']:,}개 (+{c['added']:,} / -{c['removed']:,})")
+            for ex in c["examples"]:
+                print(f"        {ex['score'][0]}→{ex['score'][1]}  {ex['text'][:50]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="수집 댓글 오프라인 재채점 (현재 규칙 엔진)")
+    parser.add_argument("paths", nargs="*", help="채널 디렉토리 (기본: scripts/data/*)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="채점 프로세스 수 (기본: CPU 코어 수, 1 = 단일 프로세스)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="변경 보고만 하고 파일은 그대로 둠")
+    parser.add_argument("--force", action="store_true", help="현재 규칙으로 채점된 채널도 다시 채점")
+    parser.add_argument("--report", type=Path, help="변경 보고서(JSON) 저장 경로")
+    parser.add_argument("--examples", type=int, default=3, help="규칙별 예시 댓글 수")
+    parser.add_argument("--top", type=int, default=20, help="출력할 규칙 수")
+    args = parser.parse_args()
+
+    from korean_profanity import ruleset_version
+
+    version = ruleset_version()
+    candidates = [Path(p) for p in args.paths] if args.paths else (
+        sorted(DATA_DIR.iterdir()) if DATA_DIR.exists() else []
+    )
+    channels = [
+        d for d in candidates
+        if d.is_dir() and ((d / "manifest.json").exists() or (d / "comments.json").exists())
+    ]
+    if not channels:
+        print("재채점할 수집 데이터가 없습니다.")
+        return
+
+    print(f"\n{'='*60}")
+    print(f"  재채점 (규칙 버전 {version}, workers={args.workers}{', dry-run' if args.dry_run else ''})")
+    print(f"{'='*60}")
+
+    report = DiffReport(examples=args.examples)
+    pool = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    window = max(args.workers, 1) * 2
+    total_rows = 0
+    start = time.perf_counter()
+    try:
+        for channel_dir in channels:
+            if not args.force and stored_version(channel_dir) == version:
+                print(f"  - {channel_dir.name}: 이미 현재 규칙으로 채점됨 (건너뜀)")
+                continue
+            t0 = time.perf_counter()
+            rescore = rescore_jsonl if (channel_dir / "manifest.json").exists() else rescore_legacy
+            rows = rescore(channel_dir, pool, window, report, version, args.dry_run)
+            if not args.dry_run and (channel_dir / "corpus.zcol").exists():
+                from corpus import convert_channel
+
+                convert_channel(channel_dir)
+            elapsed = time.perf_counter() - t0
+            total_rows += rows
+            print(f"  ✓ {channel_dir.name}: {rows:,}개 ({elapsed:.1f}s, {rows / max(elapsed, 1e-9):,.0f}개/s)")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    print(f"\n  총 {total_rows:,}개 댓글, {elapsed:.1f}s ({total_rows / max(elapsed, 1e-9):,.0f}개/s)")
+    print_report(report, args.top)
+
+    if args.report:
+        data = report.to_dict()
+        data.update({
+            "rulesVersion": version,
+            "workers": args.workers,
+            "dryRun": args.dry_run,
+            "elapsedSeconds": round(elapsed, 3),
+            "commentsPerSecond": round(total_rows / max(elapsed, 1e-9), 1),
+        })
+        args.report.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n  보고서 저장: {args.report}")
+
+
+if __name__ == "__main__":
+    # Windows cp949 인코딩 문제 방지
+    if sys.stdout.encoding != "utf-8":
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+    main()
@@ -0,0 +1,365 @@
+"""
+SQLite statistics index over collected comments.
+
+Built and updated incrementally from the collection output in
+scripts/data (``collection_store`` channels, or legacy comments.json) and
+read by ``collect_comments.py --stats`` and the backend ``/stats`` API.
+
+Only what the statistics need is indexed (no comment text): one row per
+comment with its video, author, day and score, plus its categories.
+
+Updating is incremental per channel:
+    - a channel whose manifest.json (or comments.json) is unchanged is skipped;
+    - otherwise only the JSONL bytes committed since the last update are read;
+    - a new manifest ``generation`` (``--fresh`` or ``rescore.py`` rewrote the
+      files) or a changed legacy comments.json re-indexes that channel;
+    - channels whose directory is gone are dropped.
+
+Usage:
+    from stats_index import StatsIndex
+    index = StatsIndex(DATA_DIR / "stats.db", DATA_DIR)
+    index.update()
+    index.top_authors(limit=10)
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+
+INDEX_FILE = "stats.db"
+TOXIC_THRESHOLD = 30
+BUCKETS = ("day", "month")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS channels (
+    channel_key      TEXT PRIMARY KEY,
+    channel_id       TEXT NOT NULL,
+    name             TEXT NOT NULL,
+    handle           TEXT NOT NULL,
+    subscriber_count INTEGER NOT NULL,
+    collected_at     TEXT,
+    rules_version    TEXT,
+    generation       TEXT,
+    source_mtime     INTEGER NOT NULL,
+    comments_offset  INTEGER NOT NULL,
+    videos_offset    INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS videos (
+    channel_key   TEXT NOT NULL,
+    video_id      TEXT NOT NULL,
+    title         TEXT NOT NULL,
+    published_at  TEXT NOT NULL,
+    view_count    INTEGER NOT NULL,
+    comment_count INTEGER NOT NULL,
+    PRIMARY KEY (channel_key, video_id)
+);
+
+CREATE TABLE IF NOT EXISTS comments (
+    channel_key TEXT NOT NULL,
+    comment_id  TEXT NOT NULL,
+    video_id    TEXT NOT NULL,
+    author      TEXT NOT NULL,
+    day         TEXT NOT NULL,
+    score       INTEGER NOT NULL,
+    toxic       INTEGER NOT NULL,
+    PRIMARY KEY (channel_key, comment_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_comments_day ON comments (channel_key, day);
+CREATE INDEX IF NOT EXISTS idx_comments_video ON comments (video_id, day);
+CREATE INDEX IF NOT EXISTS idx_comments_author ON comments (author, toxic);
+
+CREATE TABLE IF NOT EXISTS comment_categories (
+    channel_key TEXT NOT NULL,
+    comment_id  TEXT NOT NULL,
+    video_id    TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    PRIMARY KEY (channel_key, comment_id, category)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_categories_category ON comment_categories (category);
+"""
+
+_CHANNEL_TABLES = ("videos", "comments", "comment_categories")
+
+
+def _read_jsonl(path: Path, start: int, end: int) -> list[dict]:
+    """Records in bytes [start, end) of a JSONL file (both on line boundaries)."""
+    if end <= start or not path.exists():
+        return []
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return [json.loads(line) for line in data.splitlines() if line.strip()]
+
+
+def _filters(channel: str | None, video_id: str | None, alias: str = "") -> tuple[str, list]:
+    prefix = f"{alias}." if alias else ""
+    clauses, params = [], []
+    if channel:
+        clauses.append(f"{prefix}channel_key = ?")
+        params.append(channel)
+    if video_id:
+        clauses.append(f"{prefix}video_id = ?")
+        params.append(video_id)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+class StatsIndex:
+    """Incrementally updated statistics index. Opens a connection per call."""
+
+    def __init__(self, path: Path, data_dir: Path):
+        self.path = path
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    # ─── Update ─────────────────────────────────────────────────────
+
+    def update(self) -> dict:
+        """Bring the index up to date → {"channels": updated, "comments": added}."""
+        updated = 0
+        added = 0
+        with self._lock, closing(self._connect()) as conn:
+            known = {
+                row["channel_key"]: row
+                for row in conn.execute("SELECT * FROM channels")
+            }
+            present = set()
+            if self.data_dir.exists():
+                for channel_dir in sorted(self.data_dir.iterdir()):
+                    if not channel_dir.is_dir():
+                        continue
+                    source = channel_dir / "manifest.json"
+                    if not source.exists():
+                        source = channel_dir / "comments.json"
+                        if not source.exists():
+                            continue
+                    key = channel_dir.name
+                    present.add(key)
+                    row = known.get(key)
+                    mtime = source.stat().st_mtime_ns
+                    if row is not None and row["source_mtime"] == mtime:
+                        continue
+                    with conn:
+                        if source.name == "manifest.json":
+                            added += self._update_stream(conn, channel_dir, source, row, mtime)
+                        else:
+                            added += self._update_legacy(conn, channel_dir, source, mtime)
+                    updated += 1
+
+            with conn:
+                for key in set(known) - present:
+                    self._drop(conn, key)
+                    conn.execute("DELETE FROM channels WHERE channel_key = ?", (key,))
+        return {"channels": updated, "comments": added}
+
+    def _drop(self, conn: sqlite3.Connection, key: str) -> None:
+        for table in _CHANNEL_TABLES:
+            conn.execute(f"DELETE FROM {table} WHERE channel_key = ?", (key,))
+
+    def _update_stream(self, conn, channel_dir: Path, source: Path, row, mtime: int) -> int:
+        manifest = json.loads(source.read_text(encoding="utf-8"))
+        generation = manifest.get("generation")
+        if row is None or row["generation"] != generation:
+            self._drop(conn, channel_dir.name)
+            comments_offset = videos_offset = 0
+        else:
+            comments_offset, videos_offset = row["comments_offset"], row["videos_offset"]
+
+        sizes = manifest.get("sizes", {})
+        comments_end = sizes.get("comments.jsonl", 0)
+        videos_end = sizes.get("videos.jsonl", 0)
+        key = channel_dir.name
+        self._insert_videos(conn, key, _read_jsonl(channel_dir / "videos.jsonl", videos_offset, videos_end))
+        added = self._insert_comments(
+            conn, key, _read_jsonl(channel_dir / "comments.jsonl", comments_offset, comments_end)
+        )
+        self._upsert_channel(
+            conn, key, manifest.get("channel", {}), manifest.get("collectedAt"),
+            manifest.get("rulesVersion"), generation, mtime, comments_end, videos_end,
+        )
+        return added
+
+    def _update_legacy(self, conn, channel_dir: Path, source: Path, mtime: int) -> int:
+        result = json.loads(source.read_text(encoding="utf-8"))
+        key = channel_dir.name
+        self._drop(conn, key)
+        videos = result.get("videos", [])
+        self._insert_videos(conn, key, videos)
+        added = self._insert_comments(conn, key, [
+            {"videoId": video["videoId"], **comment}
+            for video in videos
+            for comment in video.get("comments", [])
+        ])
+        self._upsert_channel(
+            conn, key, result.get("channel", {}), result.get("collectedAt"),
+            result.get("rulesVersion"), None, mtime, 0, 0,
+        )
+        return added
+
+    @staticmethod
+    def _insert_videos(conn, key: str, videos: list[dict]) -> None:
+        conn.executemany(
+            "INSERT OR REPLACE INTO videos VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    key,
+                    v["videoId"],
+                    v.get("title", ""),
+                    v.get("publishedAt", ""),
+                    v.get("viewCount", 0),
+                    v.get("commentCount", 0),
+                )
+                for v in videos
+            ],
+        )
+
+    @staticmethod
+    def _insert_comments(conn, key: str, comments: list[dict]) -> int:
+        rows = []
+        categories = []
+        for c in comments:
+            analysis = c.get("analysis", {})
+            score = analysis.get("toxicityScore", 0)
+            rows.append((
+                key,
+                c["commentId"],
+                c.get("videoId", ""),
+                c.get("author", ""),
+                c.get("publishedAt", "")[:10],
+                score,
+                int(score >= TOXIC_THRESHOLD),
+            ))
+            categories.extend(
+                (key, c["commentId"], c.get("videoId", ""), cat)
+                for cat in analysis.get("matchedCategories", [])
+            )
+        conn.executemany("INSERT OR REPLACE INTO comments VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.executemany("INSERT OR IGNORE INTO comment_categories VALUES (?, ?, ?, ?)", categories)
+        return len(rows)
+
+    @staticmethod
+    def _upsert_channel(
+        conn, key, channel: dict, collected_at, rules_version, generation, mtime,
+        comments_offset, videos_offset,
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO channels VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                channel.get("channelId", ""),
+                channel.get("name", key),
+                channel.get("handle", ""),
+                channel.get("subscriberCount", 0),
+                collected_at,
+                rules_version,
+                generation,
+                mtime,
+                comments_offset,
+                videos_offset,
+            ),
+        )
+
+    # ─── Queries ────────────────────────────────────────────────────
+
+    def channels(self) -> list[dict]:
+        """Per-channel totals, ordered by channel key."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("""
+                SELECT ch.channel_key, ch.channel_id, ch.name, ch.handle, ch.subscriber_count,
+                       ch.collected_at, ch.rules_version,
+                       (SELECT COUNT(*) FROM videos v WHERE v.channel_key = ch.channel_key) AS videos,
+                       COUNT(c.comment_id) AS total_comments,
+                       COALESCE(SUM(c.toxic), 0) AS toxic_comments,
+                       COALESCE(ROUND(AVG(c.score), 1), 0) AS average_toxicity_score
+                FROM channels ch
+                LEFT JOIN comments c ON c.channel_key = ch.channel_key
+                GROUP BY ch.channel_key
+                ORDER BY ch.channel_key
+            """).fetchall()
+        out = []
+        for row in rows:
+            item = dict(row)
+            total = item["total_comments"]
+            item["toxic_percentage"] = round(item["toxic_comments"] / total * 100, 1) if total else 0
+            out.append(item)
+        return out
+
+    def toxicity_over_time(
+        self, channel: str | None = None, video_id: str | None = None, bucket: str = "day"
+    ) -> list[dict]:
+        """Comments / toxic comments / average score per day or month of posting."""
+        if bucket not in BUCKETS:
+            raise ValueError(f"bucket은 {' | '.join(BUCKETS)} 중 하나여야 합니다: {bucket}")
+        period = "day" if bucket == "day" else "substr(day, 1, 7)"
+        where, params = _filters(channel, video_id)
+        where = (where + " AND" if where else " WHERE") + " day != ''"
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {period} AS period, COUNT(*) AS total, SUM(toxic) AS toxic,
+                       ROUND(AVG(score), 1) AS average_toxicity_score
+                FROM comments{where}
+                GROUP BY period ORDER BY period
+                """,
+                params,
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def top_categories(
+        self, channel: str | None = None, video_id: str | None = None, limit: int = 10
+    ) -> list[dict]:
+        """Most frequent matched categories."""
+        where, params = _filters(channel, video_id)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT category, COUNT(*) AS count FROM comment_categories{where}
+                GROUP BY category ORDER BY count DESC, category LIMIT ?
+                """,
+                [*params, limit],
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def top_authors(self, channel: str | None = None, limit: int = 20) -> list[dict]:
+        """Authors with the most toxic comments (across channels unless ``channel``)."""
+        where, params = _filters(channel, None)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT author, SUM(toxic) AS toxic_comments, COUNT(*) AS total_comments,
+                       ROUND(AVG(score), 1) AS average_toxicity_score,
+                       COUNT(DISTINCT channel_key) AS channels
+                FROM comments{where}
+                GROUP BY author HAVING SUM(toxic) > 0
+                ORDER BY toxic_comments DESC, average_toxicity_score DESC, author LIMIT ?
+                """,
+                [*params, limit],
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def volume_by_day(self, channel: str | None = None, video_id: str | None = None) -> list[dict]:
+        """Comment count per posting day."""
+        where, params = _filters(channel, video_id)
+        where = (where + " AND" if where else " WHERE") + " day != ''"
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT day, COUNT(*) AS comments FROM comments{where} GROUP BY day ORDER BY day",
+                params,
+            ).fetchall()
+        return [dict(row) for row in rows]
@@ -0,0 +1,223 @@
+"""
+Content-addressed store of comment verdicts, shared across channels and runs.
+
+Comments are keyed by a hash of their normalized text (``text_hash``), so a
+text that shows up again — the same comment collected twice, or a spam text
+pasted under many videos — is stored once and analyzed once:
+
+    texts          — one row per distinct text (the first one seen)
+    comments       — comment ID → text hash (latest text of each comment)
+    rule_verdicts  — rule engine analysis, tagged with the ruleset version
+    llm_verdicts   — Gemini verdict, tagged with the model name
+
+A verdict only counts for the ruleset version (``korean_profanity.
+ruleset_version``) or model it was made with; after a rule or model change
+lookups miss and the new verdict overwrites the old one.
+
+Normalization is NFC, trimmed, with runs of spaces/tabs collapsed to one
+space (newlines are kept, since ``.`` in rule patterns stops at them).
+Rule verdicts are made on the normalized text itself, so every text that
+shares a hash also shares the verdict it would get on its own.
+
+Used by ``collect_comments.py`` (rule verdicts) and by the backend pipeline
+(prescreen: rule verdicts, analyze: LLM verdicts) through the same file.
+
+Usage:
+    from verdict_store import VerdictStore, score_comments
+    store = VerdictStore(PROJECT_ROOT / ".cache" / "verdicts.db")
+    hashes, analyses, reused = score_comments(store, texts, comment_ids)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+import unicodedata
+from contextlib import closing
+from itertools import batched
+from pathlib import Path
+from typing import Iterable
+
+STORE_FILE = "verdicts.db"
+# Bound on host parameters per IN (...) lookup
+LOOKUP_CHUNK = 500
+
+_SPACES = re.compile(r"[ \t\u00a0\u3000]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    text_hash  TEXT PRIMARY KEY,
+    text       TEXT NOT NULL,
+    first_seen REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS comments (
+    comment_id TEXT PRIMARY KEY,
+    text_hash  TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS rule_verdicts (
+    text_hash     TEXT PRIMARY KEY,
+    rules_version TEXT NOT NULL,
+    verdict       TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS llm_verdicts (
+    text_hash TEXT PRIMARY KEY,
+    model     TEXT NOT NULL,
+    verdict   TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Text as it is hashed (see module docstring)."""
+    return _SPACES.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def text_hash(text: str) -> str:
+    """Content address of a comment text."""
+    return _hash_normalized(normalize_text(text))
+
+
+def _hash_normalized(normalized: str) -> str:
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def analysis_record(result) -> dict:
+    """``korean_profanity.AnalysisResult`` → ``analysis`` block."""
+    return {
+        "toxicityScore": result.toxicity_score,
+        "matchedCategories": result.matched_categories,
+        "matchedPatterns": result.matched_patterns,
+        "matchedRules": result.matched_rules,
+    }
+
+
+class VerdictStore:
+    """SQLite verdict store. Opens a connection per call, so it is thread-safe."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        # A lost tail after a crash only means re-analyzing those texts
+        conn.execute("PRAGMA synchronous = NORMAL")
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    def _lookup(self, table: str, key_column: str, key: str, hashes: Iterable[str]) -> dict[str, dict]:
+        found = {}
+        with closing(self._connect()) as conn:
+            for chunk in batched(set(hashes), LOOKUP_CHUNK):
+                rows = conn.execute(
+                    f"SELECT text_hash, verdict FROM {table} "
+                    f"WHERE text_hash IN ({', '.join('?' * len(chunk))}) AND {key_column} = ?",
+                    (*chunk, key),
+                )
+                found.update((h, json.loads(verdict)) for h, verdict in rows)
+        return found
+
+    def rule_verdicts(self, hashes: Iterable[str], rules_version: str) -> dict[str, dict]:
+        """Stored ``analysis`` blocks made with ``rules_version``, by text hash."""
+        return self._lookup("rule_verdicts", "rules_version", rules_version, hashes)
+
+    def llm_verdicts(self, hashes: Iterable[str], model: str) -> dict[str, dict]:
+        """Stored LLM verdicts made with ``model``, by text hash."""
+        return self._lookup("llm_verdicts", "model", model, hashes)
+
+    def put_rule_verdicts(
+        self,
+        verdicts: dict[str, tuple[str, dict]],
+        rules_version: str,
+        comments: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        """Store {hash: (text, analysis)} and (comment_id, hash) pairs in one transaction."""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO texts VALUES (?, ?, ?)",
+                ((h, text, now) for h, (text, _) in verdicts.items()),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO rule_verdicts VALUES (?, ?, ?)",
+                (
+                    (h, rules_version, json.dumps(analysis, ensure_ascii=False))
+                    for h, (_, analysis) in verdicts.items()
+                ),
+            )
+            conn.executemany("INSERT OR REPLACE INTO comments VALUES (?, ?)", comments)
+
+    def put_llm_verdicts(self, verdicts: dict[str, dict], model: str) -> None:
+        """Store {hash: verdict} made with ``model``."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO llm_verdicts VALUES (?, ?, ?)",
+                (
+                    (h, model, json.dumps(verdict, ensure_ascii=False))
+                    for h, verdict in verdicts.items()
+                ),
+            )
+
+    def comment_hash(self, comment_id: str) -> str | None:
+        """Text hash last recorded for a comment ID."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT text_hash FROM comments WHERE comment_id = ?", (comment_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def counts(self) -> dict:
+        """Row counts per table."""
+        with closing(self._connect()) as conn:
+            return {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("texts", "comments", "rule_verdicts", "llm_verdicts")
+            }
+
+
+def score_comments(
+    store: VerdictStore | None,
+    texts: list[str],
+    comment_ids: list[str] | None = None,
+) -> tuple[list[str], list[dict], int]:
+    """Rule ``analysis`` blocks for ``texts``, in order.
+
+    Texts are analyzed in normalized form (the form they are keyed by).
+    Texts already in ``store`` for the current ruleset are not analyzed;
+    repeated texts within ``texts`` are analyzed once. New verdicts (and the
+    comment ID → hash mapping, if ``comment_ids`` is given) are written back.
+    With ``store`` None every text is analyzed. Returns (text hashes,
+    analyses, number reused from the store).
+    """
+    from korean_profanity import analyze_comment, ruleset_version
+
+    normalized = [normalize_text(text) for text in texts]
+    hashes = [_hash_normalized(n) for n in normalized]
+    version = ruleset_version()
+    known = store.rule_verdicts(hashes, version) if store is not None else {}
+    reused = sum(h in known for h in hashes)
+
+    new: dict[str, tuple[str, dict]] = {}
+    analyses = []
+    for h, text, n in zip(hashes, texts, normalized):
+        analysis = known.get(h)
+        if analysis is None:
+            if h not in new:
+                new[h] = (text, analysis_record(analyze_comment(n)))
+            analysis = new[h][1]
+        analyses.append(analysis)
+
+    if store is not None and (new or comment_ids):
+        store.put_rule_verdicts(new, version, zip(comment_ids or (), hashes))
+    return hashes, analyses, reused
@@ -0,0 +1,302 @@
+"""
+YouTube Data API v3 quota accounting and collection scheduling.
+
+Every API method has a fixed unit cost (search.list = 100, most list calls
+= 1) and a key gets 10,000 units per day, reset at midnight Pacific time.
+`QuotaAccountant` records units per method and refuses calls that would go
+over the daily budget; `RateLimiter` spaces out requests shared by all
+collection threads; `MeteredClient` wraps a googleapiclient service so
+every `.execute()` is rate limited and charged automatically;
+`plan_collection` decides which channels from channels.json fit into the
+remaining budget.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# ─── Costs ─────────────────────────────────────────────────────────
+
+# https://developers.google.com/youtube/v3/determine_quota_cost
+QUOTA_COSTS: dict[str, int] = {
+    "search.list": 100,
+    "channels.list": 1,
+    "playlistItems.list": 1,
+    "videos.list": 1,
+    "commentThreads.list": 1,
+    "comments.list": 1,
+}
+
+DEFAULT_DAILY_BUDGET = 10_000
+
+DISCOVERY_MODES = ("playlist", "search")
+
+
+def _quota_day() -> str:
+    """Current quota day (quota resets at midnight America/Los_Angeles)."""
+    try:
+        from zoneinfo import ZoneInfo
+
+        tz = ZoneInfo("America/Los_Angeles")
+    except Exception:
+        # tzdata missing (e.g. Windows without the tzdata package)
+        tz = timezone(timedelta(hours=-8))
+    return datetime.now(tz).date().isoformat()
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when a call would exceed the daily quota budget."""
+
+
+# ─── Accountant ────────────────────────────────────────────────────
+
+class QuotaAccountant:
+    """Thread-safe per-method quota ledger with a daily budget.
+
+    When ``state_path`` is given, usage is persisted there so separate
+    runs on the same quota day share one budget.
+    """
+
+    def __init__(
+        self,
+        daily_budget: int = DEFAULT_DAILY_BUDGET,
+        state_path: Path | None = None,
+    ):
+        self.daily_budget = daily_budget
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._day = _quota_day()
+        self._units: dict[str, int] = {}
+        self._calls: dict[str, int] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.state_path or not self.state_path.exists():
+            return
+        with open(self.state_path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("day") == self._day:
+            self._units = state.get("units", {})
+            self._calls = state.get("calls", {})
+
+    def _save(self) -> None:
+        if not self.state_path:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"day": self._day, "units": self._units, "calls": self._calls},
+                f,
+                indent=2,
+            )
+        tmp_path.replace(self.state_path)
+
+    def _roll_day(self) -> None:
+        day = _quota_day()
+        if day != self._day:
+            self._day = day
+            self._units = {}
+            self._calls = {}
+
+    @property
+    def used(self) -> int:
+        with self._lock:
+            self._roll_day()
+            return sum(self._units.values())
+
+    @property
+    def remaining(self) -> int:
+        return max(self.daily_budget - self.used, 0)
+
+    def charge(self, method: str, calls: int = 1) -> None:
+        """Record ``calls`` invocations of ``method``.
+
+        Raises:
+            QuotaExceededError: if the calls would go over the budget.
+        """
+        cost = QUOTA_COSTS.get(method, 1) * calls
+        with self._lock:
+            self._roll_day()
+            used = sum(self._units.values())
+            if used + cost > self.daily_budget:
+                raise QuotaExceededError(
+                    f"일일 할당량 초과: {method} ({cost} units) — "
+                    f"사용 {used:,} / 예산 {self.daily_budget:,}"
+                )
+            self._units[method] = self._units.get(method, 0) + cost
+            self._calls[method] = self._calls.get(method, 0) + calls
+            self._save()
+
+    def summary(self) -> dict:
+        with self._lock:
+            self._roll_day()
+            return {
+                "day": self._day,
+                "budget": self.daily_budget,
+                "used": sum(self._units.values()),
+                "units": dict(self._units),
+                "calls": dict(self._calls),
+            }
+
+
+# ─── Rate limiter ──────────────────────────────────────────────────
+
+class RateLimiter:
+    """Thread-safe token bucket: ``rate`` requests per second, bursts of ``burst``.
+
+    A rate of 0 (or less) disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# ─── Metered client ────────────────────────────────────────────────
+
+class _MeteredRequest:
+    def __init__(
+        self, request, method: str, quota: QuotaAccountant, limiter: RateLimiter | None
+    ):
+        self._request = request
+        self._method = method
+        self._quota = quota
+        self._limiter = limiter
+
+    def execute(self, *args, **kwargs):
+        # Failed requests still cost quota, so charge before sending.
+        self._quota.charge(self._method)
+        if self._limiter is not None:
+            self._limiter.acquire()
+        return self._request.execute(*args, **kwargs)
+
+
+class _MeteredResource:
+    def __init__(
+        self, resource, name: str, quota: QuotaAccountant, limiter: RateLimiter | None
+    ):
+        self._resource = resource
+        self._name = name
+        self._quota = quota
+        self._limiter = limiter
+
+    def __getattr__(self, method: str):
+        factory = getattr(self._resource, method)
+
+        def build_request(*args, **kwargs):
+            return _MeteredRequest(
+                factory(*args, **kwargs), f"{self._name}.{method}", self._quota, self._limiter
+            )
+
+        return build_request
+
+
+class MeteredClient:
+    """googleapiclient service wrapper that rate limits and charges each execute().
+
+    One instance (with one accountant and limiter) can be shared by several
+    collection threads as long as ``client`` is safe to use from each of
+    them (see ``collect_comments.ThreadLocalClient``).
+    """
+
+    def __init__(self, client, quota: QuotaAccountant, limiter: RateLimiter | None = None):
+        self._client = client
+        self.quota = quota
+        self.limiter = limiter
+
+    def __getattr__(self, name: str):
+        factory = getattr(self._client, name)
+
+        def build_resource(*args, **kwargs):
+            return _MeteredResource(factory(*args, **kwargs), name, self.quota, self.limiter)
+
+        return build_resource
+
+
+# ─── Scheduling ────────────────────────────────────────────────────
+
+def estimate_channel_cost(channel_config: dict, discovery: str = "playlist") -> int:
+    """Upper-bound quota units for collecting one channel.
+
+    Without a configured ``channelId`` the handle lookup may fall back to
+    ``search.list`` (see ``resolve_channel_id``), so both calls are counted.
+    """
+    max_videos = channel_config.get("max_videos", 50)
+    max_comments = channel_config.get("max_comments_per_video", 100)
+    video_pages = math.ceil(max_videos / 50)
+
+    cost = 0
+    if not channel_config.get("channelId"):
+        cost += QUOTA_COSTS["channels.list"]  # forHandle lookup
+        cost += QUOTA_COSTS["search.list"]  # fallback search by name
+    cost += QUOTA_COSTS["channels.list"]  # channel info
+    if discovery == "search":
+        cost += QUOTA_COSTS["search.list"] * video_pages
+    else:
+        cost += QUOTA_COSTS["playlistItems.list"] * video_pages
+    cost += QUOTA_COSTS["videos.list"] * video_pages  # statistics
+    cost += QUOTA_COSTS["commentThreads.list"] * max_videos * math.ceil(max_comments / 100)
+    return cost
+
+
+@dataclass
+class CollectionPlan:
+    scheduled: list[dict]
+    deferred: list[dict]
+    estimated_units: int
+    remaining_units: int
+
+
+def plan_collection(
+    channels: list[dict],
+    remaining_units: int,
+    discovery: str = "playlist",
+) -> CollectionPlan:
+    """Pick channels (in config order) whose estimated cost fits the budget.
+
+    Channels that do not fit are deferred, but later smaller channels are
+    still considered so the budget is used as fully as possible.
+    """
+    scheduled: list[dict] = []
+    deferred: list[dict] = []
+    total = 0
+
+    for channel in channels:
+        cost = estimate_channel_cost(channel, discovery)
+        if total + cost <= remaining_units:
+            scheduled.append(channel)
+            total += cost
+        else:
+            deferred.append(channel)
+
+    return CollectionPlan(
+        scheduled=scheduled,
+        deferred=deferred,
+        estimated_units=total,
+        remaining_units=remaining_units,
+    )